@@ -6,43 +6,102 @@
 """Sample module for incremental buildout of Async Sui GraphQL RPC for Pysui 1.0.0."""
 
 import asyncio
+import atexit
 import base64
+import sys
+from typing import Callable, Optional
+import orjson
 
 from pysui import SuiConfig, SuiRpcResult, AsyncClient
 from pysui.sui.sui_txn import AsyncTransaction
-from pysui.sui.sui_pgql.pgql_clients import AsyncSuiGQLClient
+from pysui.sui.sui_pgql.pgql_clients import AsyncSuiGQLClient, PGQL_QueryNode
 import pysui.sui.sui_pgql.pgql_query as qn
 import pysui.sui.sui_pgql.pgql_types as ptypes
 
+# All output goes through one buffered writer, flushed at exit or per write if interactive
+_OUT = open(sys.stdout.fileno(), "wb", buffering=65536, closefd=False)
+_INTERACTIVE = sys.stdout.isatty()
+atexit.register(_OUT.flush)
 
-def handle_result(result: SuiRpcResult) -> SuiRpcResult:
-    """."""
-    if result.is_ok():
-        if hasattr(result.result_data, "to_json"):
-            print(result.result_data.to_json(indent=2))
-        else:
-            print(result.result_data)
+
+def _emit(*parts) -> None:
+    """Write the parts as one line of output."""
+    _OUT.write(" ".join(str(x) for x in parts).encode() + b"\n")
+    if _INTERACTIVE:
+        _OUT.flush()
+
+
+def _print_result(result: SuiRpcResult) -> None:
+    """Format and write the result in one write."""
+    chunks = [] if result.is_ok() else [result.result_string.encode(), b"\n"]
+    if result.result_data and hasattr(result.result_data, "to_dict"):
+        chunks.append(
+            orjson.dumps(
+                result.result_data.to_dict(),
+                option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+            )
+        )
     else:
-        print(result.result_string)
-        if result.result_data and hasattr(result.result_data, "to_json"):
-            print(result.result_data.to_json(indent=2))
-        else:
-            print(result.result_data)
+        chunks.append(f"{result.result_data}\n".encode())
+    _OUT.write(b"".join(chunks))
+    if _INTERACTIVE:
+        _OUT.flush()
+
+
+async def handle_result(result: SuiRpcResult) -> SuiRpcResult:
+    """Print the result from a worker thread, keeping the event loop free."""
+    await asyncio.to_thread(_print_result, result)
     return result
 
 
+async def _paged(
+    client: AsyncSuiGQLClient,
+    node_for: Callable[[Optional[ptypes.PagingCursor]], PGQL_QueryNode],
+    max_page: Optional[int] = None,
+):
+    """Fetch and handle pages of a query.
+
+    Pages are requested with the previous page's cursor (`after: endCursor`), a
+    producer keeps up to two pages queued ahead of the handling consumer.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+    async def producer():
+        cursor = None
+        in_page = 0
+        while True:
+            result = await client.execute_query_node(with_node=node_for(cursor))
+            in_page += 1
+            await queue.put(result)
+            if (
+                not result.is_ok()
+                or not result.result_data.next_cursor.hasNextPage
+                or (max_page and in_page >= max_page)
+            ):
+                break
+            cursor = result.result_data.next_cursor
+        await queue.put(None)
+
+    async def consumer():
+        while (result := await queue.get()) is not None:
+            await handle_result(result)
+
+    await asyncio.gather(producer(), consumer())
+
+
 async def do_coin_meta(client: AsyncSuiGQLClient):
     """Fetch meta data about coins, includes supply."""
     # Defaults to 0x2::sui::SUI
-    handle_result(await client.execute_query_node(with_node=qn.GetCoinMetaData()))
+    await handle_result(await client.execute_query_node(with_node=qn.GetCoinMetaData()))
 
 
 async def do_coins_for_type(client: AsyncSuiGQLClient):
     """Fetch coins of specific type for owner."""
-    handle_result(
+    owner = client.config.active_address.address
+    await handle_result(
         await client.execute_query_node(
             with_node=qn.GetCoins(
-                owner=client.config.active_address.address,
+                owner=owner,
                 coin_type="0x2::sui::SUI",
             )
         )
@@ -51,20 +110,19 @@ async def do_coins_for_type(client: AsyncSuiGQLClient):
 
 async def do_gas(client: AsyncSuiGQLClient):
     """Fetch 0x2::sui::SUI (default) for owner."""
-    result = handle_result(
-        await client.execute_query_node(
-            with_node=qn.GetCoins(owner=client.config.active_address.address)
-        )
+    owner = client.config.active_address.address
+    result = await handle_result(
+        await client.execute_query_node(with_node=qn.GetCoins(owner=owner))
     )
     if result.is_ok():
-        print(
+        _emit(
             f"Total coins in page: {len(result.result_data.data)} has more: {result.result_data.next_cursor.hasNextPage}"
         )
 
 
 async def do_sysstate(client: AsyncSuiGQLClient):
     """Fetch the most current system state summary."""
-    handle_result(
+    await handle_result(
         await client.execute_query_node(with_node=qn.GetLatestSuiSystemState())
     )
 
@@ -74,36 +132,27 @@ async def do_all_balances(client: AsyncSuiGQLClient):
 
     Demonstrates paging as well
     """
-    result = await client.execute_query_node(
-        with_node=qn.GetAllCoinBalances(owner=client.config.active_address.address)
+    owner = client.config.active_address.address
+    await _paged(
+        client,
+        lambda cursor: qn.GetAllCoinBalances(owner=owner, next_page=cursor),
     )
-    handle_result(result)
-    if result.is_ok():
-        while result.result_data.next_cursor.hasNextPage:
-            result = await client.execute_query_node(
-                with_node=qn.GetAllCoinBalances(
-                    owner=client.config.active_address.address,
-                    next_page=result.next_cursor,
-                )
-            )
-            handle_result(result)
-        print("DONE")
+    _emit("DONE")
 
 
 async def do_object(client: AsyncSuiGQLClient):
     """Fetch specific object data."""
-    handle_result(
+    await handle_result(
         await client.execute_query_node(with_node=qn.GetObject(object_id="0x6"))
     )
 
 
 async def do_objects(client: AsyncSuiGQLClient):
     """Fetch all objects help by owner."""
-    handle_result(
+    owner = client.config.active_address.address
+    await handle_result(
         await client.execute_query_node(
-            with_node=qn.GetObjectsOwnedByAddress(
-                owner=client.config.active_address.address
-            )
+            with_node=qn.GetObjectsOwnedByAddress(owner=owner)
         )
     )
 
@@ -112,7 +161,7 @@ async def do_past_object(client: AsyncSuiGQLClient):
     """Fetch a past object.
     To run, change the objectID str and version int.
     """
-    handle_result(
+    await handle_result(
         await client.execute_query_node(
             with_node=qn.GetPastObject(
                 object_id="0xdfa764b29d303acecc801828839108ea81a45e93c3b9ccbe05b0d9a697a2a9ed",
@@ -132,7 +181,7 @@ async def do_multiple_past_object(client: AsyncSuiGQLClient):
             "version": 17078252,
         }
     ]
-    handle_result(
+    await handle_result(
         await client.execute_query_node(
             with_node=qn.GetMultiplePastObjects(for_versions=past_objects)
         )
@@ -144,7 +193,7 @@ async def do_objects_for(client: AsyncSuiGQLClient):
 
     These are test IDs, replace to run.
     """
-    handle_result(
+    await handle_result(
         await client.execute_query_node(
             with_node=qn.GetMultipleObjects(
                 object_ids=[
@@ -162,7 +211,7 @@ async def do_dynamics(client: AsyncSuiGQLClient):
 
     This is test ID, replace to run.
     """
-    handle_result(
+    await handle_result(
         await client.execute_query_node(
             with_node=qn.GetDynamicFields(
                 object_id="0xdfa764b29d303acecc801828839108ea81a45e93c3b9ccbe05b0d9a697a2a9ed"
@@ -173,7 +222,7 @@ async def do_dynamics(client: AsyncSuiGQLClient):
 
 async def do_event(client: AsyncSuiGQLClient):
     """."""
-    handle_result(
+    await handle_result(
         await client.execute_query_node(
             with_node=qn.GetEvents(event_filter={"sender": "0x0"})
         )
@@ -182,7 +231,7 @@ async def do_event(client: AsyncSuiGQLClient):
 
 async def do_configs(client: AsyncSuiGQLClient):
     """Fetch the GraphQL, Protocol and System configurations."""
-    print(client.rpc_config.to_json(indent=2))
+    _emit(client.rpc_config.to_json(indent=2))
 
 
 async def do_chain_id(client: AsyncSuiGQLClient):
@@ -190,12 +239,12 @@ async def do_chain_id(client: AsyncSuiGQLClient):
 
     Demonstrates overriding serialization
     """
-    print(client.chain_id)
+    _emit(client.chain_id)
 
 
 async def do_tx(client: AsyncSuiGQLClient):
     """Fetch specific transaction by it's digest."""
-    handle_result(
+    await handle_result(
         await client.execute_query_node(
             with_node=qn.GetTx(digest="A8kCT1n8dmCWchz5WnKPsQ8x7U49ExgMEWJ13nRULpiz")
         )
@@ -207,27 +256,14 @@ async def do_txs(client: AsyncSuiGQLClient):
 
     We loop through 3 pages.
     """
-    result = await client.execute_query_node(with_node=qn.GetMultipleTx())
-    handle_result(result)
-    if result.is_ok():
-        max_page = 3
-        in_page = 0
-        while True:
-            in_page += 1
-            if in_page < max_page and result.result_data.next_cursor:
-                result = await client.execute_query_node(
-                    with_node=qn.GetMultipleTx(next_page=result.result_data.next_cursor)
-                )
-                handle_result(result)
-            else:
-                break
-        print("DONE")
+    await _paged(client, lambda cursor: qn.GetMultipleTx(next_page=cursor), max_page=3)
+    _emit("DONE")
 
 
 async def do_staked_sui(client: AsyncSuiGQLClient):
     """."""
     owner = client.config.active_address.address
-    handle_result(
+    await handle_result(
         await client.execute_query_node(with_node=qn.GetDelegatedStakes(owner=owner))
     )
 
@@ -236,7 +272,7 @@ async def do_latest_cp(client: AsyncSuiGQLClient):
     """."""
     qnode = qn.GetLatestCheckpointSequence()
     # print(qnode.query_as_string())
-    handle_result(await client.execute_query_node(with_node=qnode))
+    await handle_result(await client.execute_query_node(with_node=qnode))
 
 
 async def do_sequence_cp(client: AsyncSuiGQLClient):
@@ -244,13 +280,13 @@ async def do_sequence_cp(client: AsyncSuiGQLClient):
     result = await client.execute_query_node(with_node=qn.GetLatestCheckpointSequence())
     if result.is_ok():
         cp: ptypes.CheckpointGQL = result.result_data
-        handle_result(
+        await handle_result(
             await client.execute_query_node(
                 with_node=qn.GetCheckpointBySequence(sequence_number=cp.sequence_number)
             )
         )
     else:
-        print(result.result_string)
+        _emit(result.result_string)
 
 
 async def do_digest_cp(client: AsyncSuiGQLClient):
@@ -258,28 +294,30 @@ async def do_digest_cp(client: AsyncSuiGQLClient):
     result = await client.execute_query_node(with_node=qn.GetLatestCheckpointSequence())
     if result.is_ok():
         cp: ptypes.CheckpointGQL = result.result_data
-        handle_result(
+        await handle_result(
             await client.execute_query_node(
                 with_node=qn.GetCheckpointByDigest(digest=cp.digest)
             )
         )
     else:
-        print(result.result_string)
+        _emit(result.result_string)
 
 
 async def do_checkpoints(client: AsyncSuiGQLClient):
     """."""
-    handle_result(await client.execute_query_node(with_node=qn.GetCheckpoints()))
+    await handle_result(await client.execute_query_node(with_node=qn.GetCheckpoints()))
 
 
 async def do_refgas(client: AsyncSuiGQLClient):
     """Fetch the most current system state summary."""
-    handle_result(await client.execute_query_node(with_node=qn.GetReferenceGasPrice()))
+    await handle_result(
+        await client.execute_query_node(with_node=qn.GetReferenceGasPrice())
+    )
 
 
 async def do_nameservice(client: AsyncSuiGQLClient):
     """Fetch the most current system state summary."""
-    handle_result(
+    await handle_result(
         await client.execute_query_node(
             with_node=qn.GetNameServiceAddress(name="gql-frank")
         )
@@ -288,26 +326,29 @@ async def do_nameservice(client: AsyncSuiGQLClient):
 
 async def do_owned_nameservice(client: AsyncSuiGQLClient):
     """Fetch the most current system state summary."""
-    handle_result(
-        await client.execute_query_node(
-            with_node=qn.GetNameServiceNames(owner=client.config.active_address.address)
-        )
+    owner = client.config.active_address.address
+    await handle_result(
+        await client.execute_query_node(with_node=qn.GetNameServiceNames(owner=owner))
     )
 
 
 async def do_validators_apy(client: AsyncSuiGQLClient):
     """Fetch the most current validators apy and identity."""
-    handle_result(await client.execute_query_node(with_node=qn.GetValidatorsApy()))
+    await handle_result(
+        await client.execute_query_node(with_node=qn.GetValidatorsApy())
+    )
 
 
 async def do_validators(client: AsyncSuiGQLClient):
     """Fetch the most current validator detail."""
-    handle_result(await client.execute_query_node(with_node=qn.GetCurrentValidators()))
+    await handle_result(
+        await client.execute_query_node(with_node=qn.GetCurrentValidators())
+    )
 
 
 async def do_protcfg(client: AsyncSuiGQLClient):
     """Fetch the most current system state summary."""
-    handle_result(
+    await handle_result(
         await client.execute_query_node(with_node=qn.GetProtocolConfig(version=30))
     )
 
@@ -325,7 +366,7 @@ async def do_struct(client: AsyncSuiGQLClient):
         )
     )
     if result.is_ok():
-        print(result.result_data.to_json(indent=2))
+        _emit(result.result_data.to_json(indent=2))
 
 
 async def do_structs(client: AsyncSuiGQLClient):
@@ -340,7 +381,7 @@ async def do_structs(client: AsyncSuiGQLClient):
         )
     )
     if result.is_ok():
-        print(result.result_data.to_json(indent=2))
+        _emit(result.result_data.to_json(indent=2))
 
 
 async def do_func(client: AsyncSuiGQLClient):
@@ -356,7 +397,7 @@ async def do_func(client: AsyncSuiGQLClient):
         )
     )
     if result.is_ok():
-        print(result.result_data.to_json(indent=2))
+        _emit(result.result_data.to_json(indent=2))
 
 
 async def do_funcs(client: AsyncSuiGQLClient):
@@ -371,7 +412,7 @@ async def do_funcs(client: AsyncSuiGQLClient):
         )
     )
     if result.is_ok():
-        print(result.result_data.to_json(indent=2))
+        _emit(result.result_data.to_json(indent=2))
 
 
 async def do_module(client: AsyncSuiGQLClient):
@@ -386,7 +427,7 @@ async def do_module(client: AsyncSuiGQLClient):
         )
     )
     if result.is_ok():
-        print(result.result_data.to_json(indent=2))
+        _emit(result.result_data.to_json(indent=2))
 
 
 async def do_package(client: AsyncSuiGQLClient):
@@ -400,13 +441,26 @@ async def do_package(client: AsyncSuiGQLClient):
         )
     )
     if result.is_ok():
-        print(result.result_data.to_json(indent=2))
+        _emit(result.result_data.to_json(indent=2))
+
 
+async def do_batch(client: AsyncSuiGQLClient):
+    """Fetch several lightweight queries in a single request."""
+    for result in await client.execute_query_nodes(
+        with_nodes=[
+            qn.GetReferenceGasPrice(),
+            qn.GetLatestCheckpointSequence(),
+            qn.GetCoinMetaData(),
+            qn.GetLatestSuiSystemState(),
+        ]
+    ):
+        await handle_result(result)
 
-async def do_dry_run(client: AsyncSuiGQLClient):
+
+async def do_dry_run(client: AsyncSuiGQLClient, rpc_client: AsyncClient):
     """Execute a dry run."""
     if client.chain_environment == "testnet":
-        txer = AsyncTransaction(client=AsyncClient(client.config))
+        txer = AsyncTransaction(client=rpc_client)
         scres = await txer.split_coin(coin=txer.gas, amounts=[1000000000])
         await txer.transfer_objects(
             transfers=scres, recipient=client.config.active_address
@@ -414,77 +468,98 @@ async def do_dry_run(client: AsyncSuiGQLClient):
 
         tx_data = await txer.get_transaction_data()
         tx_b64 = base64.b64encode(tx_data.serialize()).decode()
-        handle_result(
+        await handle_result(
             await client.execute_query_node(
                 with_node=qn.DryRunTransaction(tx_bytestr=tx_b64)
             )
         )
 
 
-async def do_execute(client: AsyncSuiGQLClient):
+async def do_execute(client: AsyncSuiGQLClient, rpc_client: AsyncClient):
     """Execute a transaction."""
     if client.chain_environment == "testnet":
-        rpc_client = AsyncClient(client.config)
         txer = AsyncTransaction(client=rpc_client)
         scres = await txer.split_coin(coin=txer.gas, amounts=[1000000000])
         await txer.transfer_objects(
             transfers=scres, recipient=client.config.active_address
         )
         tx_b64 = await txer.deferred_execution(run_verification=True)
-        print(tx_b64)
+        _emit(tx_b64)
         sig_array = txer.signer_block.get_signatures(client=rpc_client, tx_bytes=tx_b64)
         rsig_array = [x.value for x in sig_array.array]
-        print(rsig_array)
-        handle_result(
+        _emit(rsig_array)
+        await handle_result(
             await client.execute_query_node(
                 with_node=qn.ExecuteTransaction(tx_bytestr=tx_b64, sig_array=rsig_array)
             )
         )
 
 
+async def _bounded(limiter: asyncio.Semaphore, coro):
+    """Await coro while holding the concurrency limiter."""
+    async with limiter:
+        return await coro
+
+
 async def main():
     """."""
     client_init = AsyncSuiGQLClient(
         write_schema=False,
         config=SuiConfig.default_config(),
     )
-    print(f"Schema version {client_init.schema_version}")
-    ## QueryNodes (fetch)
-    # await do_coin_meta(client_init)
-    # await do_coins_for_type(client_init)
-    await do_gas(client_init)
-    # await do_sysstate(client_init)
-    # await do_all_balances(client_init)
-    # await do_object(client_init)
-    # await do_objects(client_init)
-    # await do_past_object(client_init)
-    # await do_multiple_past_object(client_init)
-    # await do_objects_for(client_init)
-    # await do_dynamics(client_init)
-    # await do_event(client_init)
-    # await do_tx(client_init)
-    # await do_txs(client_init)
-    # await do_staked_sui(client_init)
-    # await do_latest_cp(client_init)
-    # await do_sequence_cp(client_init)
-    # await do_digest_cp(client_init)
-    # await do_checkpoints(client_init)
-    # await do_owned_nameservice(client_init)
-    # await do_nameservice(client_init)
-    # await do_refgas(client_init)
-    # await do_struct(client_init)
-    # await do_structs(client_init)
-    # await do_func(client_init)
-    # await do_funcs(client_init)
-    # await do_module(client_init)
-    # await do_package(client_init)
-    # await do_dry_run(client_init)
-    # await do_execute(client_init)
-    ## Config
-    # await do_chain_id(client_init)
-    # await do_configs(client_init)
-    # await do_protcfg(client_init)
-    await client_init.client.close_async()
+    _emit(f"Schema version {client_init.schema_version}")
+    # Independent demos are run concurrently, at most 4 in flight
+    limiter = asyncio.Semaphore(4)
+    demos = [
+        ## QueryNodes (fetch)
+        # do_coin_meta(client_init),
+        # do_coins_for_type(client_init),
+        do_gas(client_init),
+        # do_sysstate(client_init),
+        # do_all_balances(client_init),
+        # do_object(client_init),
+        # do_objects(client_init),
+        # do_past_object(client_init),
+        # do_multiple_past_object(client_init),
+        # do_objects_for(client_init),
+        # do_dynamics(client_init),
+        # do_event(client_init),
+        # do_tx(client_init),
+        # do_txs(client_init),
+        # do_staked_sui(client_init),
+        # do_latest_cp(client_init),
+        # do_sequence_cp(client_init),
+        # do_digest_cp(client_init),
+        # do_checkpoints(client_init),
+        # do_owned_nameservice(client_init),
+        # do_nameservice(client_init),
+        # do_refgas(client_init),
+        # do_struct(client_init),
+        # do_structs(client_init),
+        # do_func(client_init),
+        # do_funcs(client_init),
+        # do_module(client_init),
+        # do_package(client_init),
+        # do_batch(client_init),
+        ## Config
+        # do_chain_id(client_init),
+        # do_configs(client_init),
+        # do_protcfg(client_init),
+    ]
+    # Demos that build transactions with the JSON RPC client
+    txn_demos = [
+        # do_dry_run,
+        # do_execute,
+    ]
+    rpc_client = None
+    if txn_demos:
+        # Shared by the transaction demos, only built when one is enabled
+        rpc_client = AsyncClient(client_init.config)
+        demos.extend(demo(client_init, rpc_client) for demo in txn_demos)
+    await asyncio.gather(*[_bounded(limiter, demo) for demo in demos])
+    await client_init.close()
+    if rpc_client:
+        await rpc_client.close()
 
 
 if __name__ == "__main__":
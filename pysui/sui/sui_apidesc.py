@@ -14,54 +14,68 @@
 """Sui RPC API Descriptor."""
 
 from abc import ABC
+from collections import OrderedDict
+import hashlib
 import json
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Callable, Optional
 from dataclasses_json import dataclass_json, DataClassJsonMixin
 from pysui.sui.sui_excepts import (
     SuiApiDefinitionInvalid,
     SuiParamSchemaInvalid,
 )
 
+# In process descriptors by rpc.discover response hash, least recently used first
+_APIDESC_CACHE: OrderedDict[bytes, tuple[str, dict, dict]] = OrderedDict()
+_APIDESC_CACHE_SIZE: int = 8
+
 
 class SuiJsonType(ABC):
     """Sui Json Type."""
 
+    __slots__ = ()
 
-@dataclass(frozen=True)
-class SuiJsonNull(DataClassJsonMixin, SuiJsonType):
+
+@dataclass_json
+@dataclass(frozen=True, slots=True)
+class SuiJsonNull(SuiJsonType):
     """Sui Json Null Value."""
 
     type: str
     type_path: list[str]
 
 
-@dataclass(frozen=True)
-class SuiJsonValue(DataClassJsonMixin, SuiJsonType):
+@dataclass_json
+@dataclass(frozen=True, slots=True)
+class SuiJsonValue(SuiJsonType):
     """Sui Json Value."""
 
     type: str
     type_path: list[str]
 
 
-@dataclass(frozen=True)
-class SuiJsonString(DataClassJsonMixin, SuiJsonType):
+@dataclass_json
+@dataclass(frozen=True, slots=True)
+class SuiJsonString(SuiJsonType):
     """Sui Json String."""
 
     type: str
     type_path: list[str]
 
 
-@dataclass(frozen=True)
-class SuiJsonBoolean(DataClassJsonMixin, SuiJsonType):
+@dataclass_json
+@dataclass(frozen=True, slots=True)
+class SuiJsonBoolean(SuiJsonType):
     """Sui Json Boolean."""
 
     type: bool
     type_path: list[str]
 
 
-@dataclass(frozen=True)
-class SuiJsonInteger(DataClassJsonMixin, SuiJsonType):
+@dataclass_json
+@dataclass(frozen=True, slots=True)
+class SuiJsonInteger(SuiJsonType):
     """Sui Json Integer."""
 
     type: str
@@ -70,8 +84,9 @@ class SuiJsonInteger(DataClassJsonMixin, SuiJsonType):
     minimum: float
 
 
-@dataclass(frozen=True)
-class SuiJsonArray(DataClassJsonMixin, SuiJsonType):
+@dataclass_json
+@dataclass(frozen=True, slots=True)
+class SuiJsonArray(SuiJsonType):
     """Sui Json Array."""
 
     type: str
@@ -80,8 +95,9 @@ class SuiJsonArray(DataClassJsonMixin, SuiJsonType):
 
 
 # pylint: disable=invalid-name
-@dataclass(frozen=True)
-class SuiJsonTuple(DataClassJsonMixin, SuiJsonType):
+@dataclass_json
+@dataclass(frozen=True, slots=True)
+class SuiJsonTuple(SuiJsonType):
     """Sui Json Tuple."""
 
     type: str
@@ -92,8 +108,9 @@ class SuiJsonTuple(DataClassJsonMixin, SuiJsonType):
 
 
 # pylint: enable=invalid-name
-@dataclass(frozen=True)
-class SuiJsonEnum(DataClassJsonMixin, SuiJsonType):
+@dataclass_json
+@dataclass(frozen=True, slots=True)
+class SuiJsonEnum(SuiJsonType):
     """Sui Json Enum."""
 
     type: str
@@ -101,8 +118,9 @@ class SuiJsonEnum(DataClassJsonMixin, SuiJsonType):
     enum: list[str]
 
 
-@dataclass(frozen=True)
-class SuiJsonObject(DataClassJsonMixin, SuiJsonType):
+@dataclass_json
+@dataclass(frozen=True, slots=True)
+class SuiJsonObject(SuiJsonType):
     """Sui Json Enum."""
 
     type: str
@@ -140,77 +158,197 @@ class SuiApi(DataClassJsonMixin):
     description: str = ""
 
 
-def _resolve_param_type(schema_dict: dict, indata: dict, tpath: list) -> SuiJsonType:
-    """Find the sui type base."""
-    if "type" in indata:
-        ptype = indata.get("type")
-        tpath.append(ptype)
-        dcp = indata.copy()
-        dcp["type_path"] = tpath
-        match ptype:
-            case "string":
-                if "enum" in dcp:
-                    return SuiJsonEnum.from_dict(dcp)
-                return SuiJsonString.from_dict(dcp)
-            case "integer":
-                return SuiJsonInteger.from_dict(dcp)
-            case "enum":
-                return SuiJsonEnum.from_dict(dcp)
-            case "array":
-                apath = []
-                if isinstance(dcp["items"], dict):
-                    dcp["items"] = _resolve_param_type(
-                        schema_dict, dcp.get("items"), apath
-                    )
-                    return SuiJsonArray.from_dict(dcp)
-                elif isinstance(dcp["items"], list):
-                    dcp["type"] = "tuple"
-                    vitems = []
-                    for item in dcp["items"]:
-                        ipath = []
-                        vitems.append(_resolve_param_type(schema_dict, item, ipath))
-                    dcp["items"] = vitems
-                    dcp["type_path"] = ["tuple"]
-                    return SuiJsonTuple.from_dict(dcp)
-            case "object":
-                return SuiJsonObject.from_dict(dcp)
-            case "null":
-                return SuiJsonNull.from_dict(dcp)
-            case "boolean":
-                return SuiJsonBoolean.from_dict(dcp)
-            case _:
-                raise NotImplementedError("ptype")
-        return ptype
-    if "$ref" in indata:
-        last = indata.get("$ref").split("/")[-1]
-        tpath.append(last)
-        return _resolve_param_type(schema_dict, schema_dict.get(last), tpath)
-    if "oneOf" in indata:
-        head = indata.get("oneOf")[0]
-        return _resolve_param_type(schema_dict, head, tpath)
-    if "allOf" in indata:
-        head = indata.get("allOf")[0]
-        last = head["$ref"].split("/")[-1]
-        tpath.append(last)
-        return _resolve_param_type(schema_dict, schema_dict.get(last), tpath)
-    if "anyOf" in indata:
-        if len(indata.get("anyOf")) == 1:
-            last = indata.get("anyOf")[0]["$ref"].split("/")[-1]
+@lru_cache(maxsize=4096)
+def _ref_tail(ref: str) -> str:
+    """Schema name of a $ref, e.g. '#/components/schemas/ObjectID' -> 'ObjectID'."""
+    return ref.rsplit("/", 1)[-1]
+
+
+def _rebase(node: SuiJsonType, prefix: list) -> SuiJsonType:
+    """Place node's type_path under prefix, tuple paths do not depend on prefix."""
+    if not prefix or isinstance(node, SuiJsonTuple):
+        return node
+    return replace(node, type_path=prefix + node.type_path)
+
+
+def _resolve_param_type(
+    schema_dict: dict, indata: dict, tpath: list, ref_cache: Optional[dict] = None
+) -> SuiJsonType:
+    """Find the sui type base.
+
+    Reference chains ($ref, oneOf, allOf, anyOf) are followed iteratively, only
+    array items are resolved with a nested call. Types resolved for a schema name
+    are interned in ref_cache, relative to that name, and reused by later references.
+    """
+    ref_cache = {} if ref_cache is None else ref_cache
+    refs: list[tuple[str, int]] = []
+    while "type" not in indata:
+        if "$ref" in indata:
+            last = _ref_tail(indata.get("$ref"))
+        elif "oneOf" in indata:
+            indata = indata.get("oneOf")[0]
+            continue
+        elif "allOf" in indata:
+            last = _ref_tail(indata.get("allOf")[0]["$ref"])
+        elif "anyOf" in indata:
+            any_of = indata.get("anyOf")
+            last = _ref_tail(any_of[0 if len(any_of) == 1 else 1]["$ref"])
+        elif bool(indata) is False:
+            node = SuiJsonValue(type="SuiJsonValue", type_path=tpath)
+            break
         else:
-            last = indata.get("anyOf")[1]["$ref"].split("/")[-1]
-        # last = head["$ref"].split("/")[-1]
+            raise SuiParamSchemaInvalid(indata)
+        if last in ref_cache:
+            node = _rebase(ref_cache[last], tpath)
+            break
+        refs.append((last, len(tpath)))
         tpath.append(last)
-        return _resolve_param_type(schema_dict, schema_dict.get(last), tpath)
-    if bool(indata) is False:
-        dcp = indata.copy()
-        dcp["type_path"] = tpath
-        dcp["type"] = "SuiJsonValue"
-        return SuiJsonValue.from_dict(dcp)
-
-    raise SuiParamSchemaInvalid(indata)
-
-
-def build_api_descriptors(indata: dict) -> tuple[str, dict, dict]:
+        indata = schema_dict.get(last)
+    else:
+        node = _resolve_typed(schema_dict, indata, tpath, ref_cache)
+    for name, index in refs:
+        if index == 0 or isinstance(node, SuiJsonTuple):
+            ref_cache[name] = node
+        else:
+            ref_cache[name] = replace(node, type_path=node.type_path[index:])
+    return node
+
+
+def _mk_string_or_enum(
+    _schema_dict: dict, indata: dict, tpath: list, _ref_cache: dict
+) -> SuiJsonType:
+    """String, or enum if values enumerated, type."""
+    if "enum" in indata:
+        return SuiJsonEnum(type="string", type_path=tpath, enum=indata["enum"])
+    return SuiJsonString(type="string", type_path=tpath)
+
+
+def _mk_integer(
+    _schema_dict: dict, indata: dict, tpath: list, _ref_cache: dict
+) -> SuiJsonType:
+    """Integer type."""
+    return SuiJsonInteger(
+        type="integer",
+        type_path=tpath,
+        format=indata.get("format"),
+        minimum=indata.get("minimum"),
+    )
+
+
+def _mk_enum(
+    _schema_dict: dict, indata: dict, tpath: list, _ref_cache: dict
+) -> SuiJsonType:
+    """Enum type."""
+    return SuiJsonEnum(type="enum", type_path=tpath, enum=indata.get("enum"))
+
+
+def _mk_array(
+    schema_dict: dict, indata: dict, tpath: list, ref_cache: dict
+) -> SuiJsonType:
+    """Array type, or tuple type if items are positional."""
+    items = indata["items"]
+    if isinstance(items, dict):
+        return SuiJsonArray(
+            type="array",
+            type_path=tpath,
+            items=_resolve_param_type(schema_dict, items, [], ref_cache),
+        )
+    elif isinstance(items, list):
+        return SuiJsonTuple(
+            type="tuple",
+            type_path=["tuple"],
+            items=[
+                _resolve_param_type(schema_dict, item, [], ref_cache) for item in items
+            ],
+            minItems=indata.get("minItems"),
+            maxItems=indata.get("maxItems"),
+        )
+    return "array"
+
+
+def _mk_object(
+    _schema_dict: dict, _indata: dict, tpath: list, _ref_cache: dict
+) -> SuiJsonType:
+    """Object type."""
+    return SuiJsonObject(type="object", type_path=tpath)
+
+
+def _mk_null(
+    _schema_dict: dict, _indata: dict, tpath: list, _ref_cache: dict
+) -> SuiJsonType:
+    """Null type."""
+    return SuiJsonNull(type="null", type_path=tpath)
+
+
+def _mk_boolean(
+    _schema_dict: dict, _indata: dict, tpath: list, _ref_cache: dict
+) -> SuiJsonType:
+    """Boolean type."""
+    return SuiJsonBoolean(type=True, type_path=tpath)
+
+
+_TYPE_HANDLERS: dict[str, Callable[[dict, dict, list, dict], SuiJsonType]] = {
+    "string": _mk_string_or_enum,
+    "integer": _mk_integer,
+    "enum": _mk_enum,
+    "array": _mk_array,
+    "object": _mk_object,
+    "null": _mk_null,
+    "boolean": _mk_boolean,
+}
+
+
+def _resolve_typed(
+    schema_dict: dict, indata: dict, tpath: list, ref_cache: dict
+) -> SuiJsonType:
+    """Build the sui type for a schema with a type."""
+    ptype = indata.get("type")
+    handler = _TYPE_HANDLERS.get(ptype)
+    if handler is None:
+        raise NotImplementedError("ptype")
+    tpath.append(ptype)
+    return handler(schema_dict, indata, tpath, ref_cache)
+
+
+def _resolve_api(schema_dict: dict, rpc_api: dict, ref_cache: dict) -> SuiApi:
+    """Build a SuiApi with its parameter and result schemas resolved.
+
+    Depends only on its arguments so methods may be resolved independently.
+    """
+    api_def = SuiApi.from_dict(rpc_api)
+    for inparams in api_def.params:
+        inparams.schema = _resolve_param_type(
+            schema_dict, inparams.schema, [], ref_cache
+        )
+    api_def.result.schema = _resolve_param_type(
+        schema_dict, api_def.result.schema, [], ref_cache
+    )
+    return api_def
+
+
+def build_api_descriptors(
+    indata: dict, *, raw: Optional[bytes] = None
+) -> tuple[str, dict, dict]:
+    """Build, or fetch from cache, the schema dictionary then API call dictionary.
+
+    When `raw`, the rpc.discover response body `indata` was decoded from, is provided
+    descriptors are cached in process keyed by its hash.
+    """
+    if raw is None:
+        return _build_api_descriptors(indata)
+    key = hashlib.blake2b(raw, digest_size=16).digest()
+    descriptors = _APIDESC_CACHE.get(key)
+    if descriptors is None:
+        descriptors = _build_api_descriptors(indata)
+        _APIDESC_CACHE[key] = descriptors
+        if len(_APIDESC_CACHE) > _APIDESC_CACHE_SIZE:
+            _APIDESC_CACHE.popitem(last=False)
+    else:
+        _APIDESC_CACHE.move_to_end(key)
+    return descriptors
+
+
+def _build_api_descriptors(indata: dict) -> tuple[str, dict, dict]:
     """Build the schema dictionary then API call dictionary."""
     # Validate the inbound data. Keys are present in valid response
     # from rpc.discover
@@ -230,18 +368,9 @@ def build_api_descriptors(indata: dict) -> tuple[str, dict, dict]:
 
         mdict: dict = {}
         schema_dict: dict = indata["result"]["components"]["schemas"]
+        ref_cache: dict[str, SuiJsonType] = {}
         for rpc_api in indata["result"]["methods"]:
-            mdict[rpc_api["name"]] = SuiApi.from_dict(rpc_api)
-        for _api_name, api_def in mdict.items():
-            for inparams in api_def.params:
-                tpath: list = []
-                inparams.schema = _resolve_param_type(
-                    schema_dict, inparams.schema, tpath
-                )
-            tpath: list = []
-            api_def.result.schema = _resolve_param_type(
-                schema_dict, api_def.result.schema, tpath
-            )
+            mdict[rpc_api["name"]] = _resolve_api(schema_dict, rpc_api, ref_cache)
 
         return (rpc_version, mdict, schema_dict)
     raise SuiApiDefinitionInvalid(indata)
@@ -29,7 +29,7 @@ from pysui import (
     SuiConfig,
 )
 
-from pysui.sui.sui_clients.common import ClientMixin
+from pysui.sui.sui_clients.common import ClientMixin, _json_content, _json_loads
 from pysui.sui.sui_constants import (
     TESTNET_FAUCET_STATUS_URLV1,
     DEVNET_FAUCET_STATUS_URLV1,
@@ -104,12 +104,12 @@ class SuiClient(ClientMixin):
             result = await self._client.post(
                 self.config.rpc_url,
                 headers=builder.header,
-                json=self._validate_builder(builder),
+                content=_json_content(self._validate_builder(builder)),
             )
             return SuiRpcResult(
                 True,
                 None,
-                result.json(),
+                _json_loads(result.content),
             )
         except JSONDecodeError as jexc:
             return SuiRpcResult(False, f"JSON Decoder Error {jexc.msg}", vars(jexc))
@@ -142,6 +142,43 @@ class SuiClient(ClientMixin):
             return result
         return await self._multi_signed_execution(builder, additional_signatures)
 
+    @versionadded(version="0.57.0", reason="Batch non-signing builders in one post")
+    async def execute_batch(
+        self, builders: list[SuiBaseBuilder]
+    ) -> Union[list[SuiRpcResult], Exception]:
+        """execute_batch Execute non-signing builders as a single JSON RPC batch request.
+
+        If the request as a whole fails each builder gets its own failed result.
+
+        :param builders: The builders to execute, none may require signing
+        :type builders: list[SuiBaseBuilder]
+        :return: A result per builder, in the order of the builders
+        :rtype: list[SuiRpcResult]
+        """
+        batch = self._batch_request(builders)
+        if not batch:
+            return []
+        try:
+            response = await self._client.post(
+                self.config.rpc_url,
+                headers=builders[0].header,
+                content=_json_content(batch),
+            )
+            rdata = _json_loads(response.content)
+        except JSONDecodeError as jexc:
+            return self._batch_failed(
+                builders, f"JSON Decoder Error {jexc.msg}", vars(jexc)
+            )
+        except (
+            httpx.HTTPError,
+            httpx.InvalidURL,
+            httpx.CookieConflict,
+        ) as hexc:
+            return self._batch_failed(
+                builders, f"HTTPX error: {hexc.__class__.__name__}", vars(hexc)
+            )
+        return self._batch_results(builders, rdata)
+
     async def execute_no_sign(
         self, builder: SuiBaseBuilder
     ) -> Union[SuiRpcResult, Exception]:
@@ -14,12 +14,14 @@
 """Sui Client common classes module."""
 
 import os
+import re
 import sys
 import json
 from dataclasses import dataclass
 from abc import abstractmethod
 from typing import Any, Optional, Union, Callable
 import httpx
+import orjson
 from deprecated.sphinx import versionchanged, versionadded
 from pysui.abstracts import RpcResult, Provider
 from pysui.abstracts.client_keypair import KeyPair
@@ -124,6 +126,32 @@ def pysui_default_handler(result: SuiRpcResult) -> Any:
     sys.exit(-1)
 
 
+def _json_content(payload: Any) -> bytes:
+    """Encode a JSON RPC request body.
+
+    orjson rejects integers wider than 64 bits, those fall back to the standard library.
+    """
+    try:
+        return orjson.dumps(payload)
+    except TypeError:
+        return json.dumps(payload).encode()
+
+
+# Any integer orjson would silently decode as a float has at least 19 digits
+_WIDE_INT_DIGITS = re.compile(rb"\d{19}")
+
+
+def _json_loads(content: bytes) -> Any:
+    """Decode a JSON RPC response body.
+
+    orjson decodes integers wider than 64 bits as floats, bodies that may carry one
+    fall back to the standard library.
+    """
+    if _WIDE_INT_DIGITS.search(content):
+        return json.loads(content)
+    return orjson.loads(content)
+
+
 def handle_result(from_cmd: SuiRpcResult, handler=pysui_default_handler) -> Any:
     """handle_result Returns value from invoking handler.
 
@@ -218,7 +246,7 @@ class ClientMixin(Provider):
             self._rpc_version,
             self._rpc_api,
             self._schema_dict,
-        ) = build_api_descriptors(rpc_api_result.json())
+        ) = build_api_descriptors(rpc_api_result.json(), raw=rpc_api_result.content)
         self.rpc_version_support()
         os.environ[PYSUI_RPC_VERSION] = self._rpc_version
 
@@ -244,6 +272,63 @@ class ClientMixin(Provider):
 
         return jblock
 
+    @versionadded(version="0.57.0", reason="Shared JSON RPC batch handling")
+    def _batch_request(self, builders: list[SuiBaseBuilder]) -> list[dict]:
+        """Validate non-signing builders into a batch, request ids are positions."""
+        assert all(
+            not x.txn_required for x in builders
+        ), "execute_batch does not support signed transactions"
+        batch: list[dict] = []
+        for index, builder in enumerate(builders):
+            jblock = self._validate_builder(builder)
+            jblock["id"] = index
+            batch.append(jblock)
+        return batch
+
+    @staticmethod
+    def _batch_failed(
+        builders: list[SuiBaseBuilder], error: Any, data: Any = None
+    ) -> list[SuiRpcResult]:
+        """A failed result per builder when the batch as a whole fails."""
+        return [SuiRpcResult(False, error, data) for _ in builders]
+
+    @staticmethod
+    def _batch_results(
+        builders: list[SuiBaseBuilder], rdata: Any
+    ) -> list[SuiRpcResult]:
+        """Split a batch response into a result per builder, in builder order."""
+        if not isinstance(rdata, list):
+            if isinstance(rdata, dict) and "error" in rdata:
+                return ClientMixin._batch_failed(builders, rdata["error"])
+            return ClientMixin._batch_failed(
+                builders, "Malformed batch response", rdata
+            )
+        # Batch responses may arrive in any order
+        by_id = {x.get("id"): x for x in rdata if isinstance(x, dict)}
+        results: list[SuiRpcResult] = []
+        for index, builder in enumerate(builders):
+            rblock = by_id.get(index)
+            if rblock is None:
+                results.append(SuiRpcResult(False, "Missing batch response", None))
+            elif "error" in rblock:
+                results.append(SuiRpcResult(False, rblock["error"], None))
+            else:
+                try:
+                    results.append(
+                        SuiRpcResult(
+                            True, None, builder.handle_return(rblock["result"])
+                        )
+                    )
+                except Exception as exc:
+                    results.append(
+                        SuiRpcResult(
+                            False,
+                            f"Result handling error {exc.__class__.__name__}",
+                            rblock,
+                        )
+                    )
+        return results
+
     @versionadded(
         version="0.26.1",
         reason="Added to support transport state information.",
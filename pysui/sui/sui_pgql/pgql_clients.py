@@ -5,12 +5,15 @@
 
 """Sui GraphQL clients."""
 
-
 from abc import ABC, abstractmethod
+import asyncio
+from collections import OrderedDict
+import dataclasses
 import logging
 from typing import Callable, Any, Optional, Union
 from deprecated.sphinx import versionchanged, versionadded, deprecated
 from gql import Client, gql
+from gql.client import AsyncClientSession
 import httpx
 
 # TODO: Replace with HTTPX equivalents
@@ -21,7 +24,17 @@ from gql.transport import exceptions as texc
 from gql.dsl import (
     DSLSchema,
 )
-from graphql import DocumentNode, print_ast, GraphQLSchema
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    NameNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    print_ast,
+    GraphQLSchema,
+)
 from graphql.error.syntax_error import GraphQLSyntaxError
 from graphql.utilities.print_schema import print_schema
 
@@ -39,10 +52,27 @@ if not logging.getLogger().handlers:
     logger.propagate = False
 
 
+def _has_value_repr(value: Any) -> bool:
+    """Test that value's repr reflects its content, and not its identity."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_has_value_repr(x) for x in value)
+    if isinstance(value, dict):
+        return all(_has_value_repr(k) and _has_value_repr(v) for k, v in value.items())
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return all(
+            _has_value_repr(getattr(value, x.name)) for x in dataclasses.fields(value)
+        )
+    return False
+
+
 class PGQL_QueryNode(ABC):
     """Base query class."""
 
     _SCHEMA_CONSTRAINT: str = None
+    # Repeatable queries with small state opt in to DocumentNode reuse
+    _CACHE_DOCUMENT: bool = False
 
     @property
     def schema_constraint(self) -> Union[str, None]:
@@ -97,6 +127,8 @@ class BaseSuiGQLClient:
     _SUI_GRAPHQL_MAINNET: str = "https://sui-mainnet.mystenlabs.com/graphql"
     _SUI_GRAPHQL_TESTNET: str = "https://sui-testnet.mystenlabs.com/graphql"
     _UNIQUE_VERSIONS: list[str] = ["2024_1_3-517d6c06d0707c458c0a66bd6ff9f341c472106c"]
+    _DOCUMENT_CACHE_SIZE: int = 256
+    _DOCUMENT_KEY_MAX: int = 1024
 
     @classmethod
     def _resolve_url(cls, sui_config: SuiConfig) -> list[str, str]:
@@ -139,6 +171,9 @@ class BaseSuiGQLClient:
         self._version: str = version
         self._schema: DSLSchema = schema
         self._rpc_config: SuiConfigGQL = rpc_config
+        self._document_cache: OrderedDict[tuple[type, str], DocumentNode] = (
+            OrderedDict()
+        )
         mver = "_".join(self._version.split("."))
         # TODO: When Sui begins maintaining earlier versions
         # this will effect query choices, etc.
@@ -203,22 +238,109 @@ class BaseSuiGQLClient:
         """
         return self._schema
 
+    @versionchanged(version="0.57.0", reason="Reuse DocumentNodes of like QueryNodes")
     def _qnode_pre_run(self, qnode: PGQL_QueryNode) -> Union[DocumentNode, ValueError]:
-        """."""
+        """Resolve the QueryNode's DocumentNode.
+
+        QueryNodes inline their arguments, so DocumentNodes are reused for
+        QueryNodes of the same type and state (e.g. repeated parameterless queries).
+        """
         if issubclass(type(qnode), PGQL_QueryNode):
             if hasattr(qnode, "owner"):
                 resolved_owner = TypeValidator.check_owner(
                     getattr(qnode, "owner"), self.config
                 )
                 setattr(qnode, "owner", resolved_owner)
+            key = None
+            if qnode._CACHE_DOCUMENT:
+                qstate = vars(qnode)
+                if _has_value_repr(qstate):
+                    qrepr = repr(qstate)
+                    if len(qrepr) <= self._DOCUMENT_KEY_MAX:
+                        key = (type(qnode), qrepr)
+            dnode = self._document_cache.get(key)
+            if dnode is not None:
+                self._document_cache.move_to_end(key)
+                return dnode
             dnode = qnode.as_document_node(self.schema)
             if isinstance(dnode, DocumentNode):
+                if key:
+                    self._document_cache[key] = dnode
+                    if len(self._document_cache) > self._DOCUMENT_CACHE_SIZE:
+                        self._document_cache.popitem(last=False)
                 return dnode
             else:
                 raise ValueError("QueryNode did not produce a gql DocumentNode")
         else:
             raise ValueError("Not a valid PGQL_QueryNode")
 
+    @versionadded(version="0.57.0", reason="Support batching QueryNodes")
+    def _qnodes_merge(
+        self, qnodes: list[PGQL_QueryNode]
+    ) -> tuple[DocumentNode, list[Union[list[tuple[str, str]], SuiRpcResult]]]:
+        """Merge QueryNodes into a single query DocumentNode.
+
+        Top level fields of each QueryNode are aliased with a unique prefix and
+        fragments of the same name are included once.
+
+        :param qnodes: The QueryNodes to merge
+        :type qnodes: list[PGQL_QueryNode]
+        :return: The merged DocumentNode (None if nothing to run) and, per QueryNode,
+            either the (merged key, original key) pairs to split the result with or the
+            SuiRpcResult for a QueryNode that could not be merged
+        :rtype: tuple[DocumentNode, list[Union[list[tuple[str, str]], SuiRpcResult]]]
+        """
+        selections: list[FieldNode] = []
+        fragments: dict[str, FragmentDefinitionNode] = {}
+        slots: list = []
+        for index, qnode in enumerate(qnodes):
+            try:
+                dnode = self._qnode_pre_run(qnode)
+            except ValueError as ve:
+                slots.append(
+                    SuiRpcResult(
+                        False, "ValueError", pgql_type.ErrorGQL.from_query(ve.args)
+                    )
+                )
+                continue
+            prefix = f"q{index}_"
+            key_map: list[tuple[str, str]] = []
+            for definition in dnode.definitions:
+                if isinstance(definition, FragmentDefinitionNode):
+                    fragments.setdefault(definition.name.value, definition)
+                elif definition.operation != OperationType.QUERY:
+                    raise ValueError("Only query QueryNodes can be batched")
+                else:
+                    for field in definition.selection_set.selections:
+                        okey = (field.alias or field.name).value
+                        key_map.append((prefix + okey, okey))
+                        selections.append(
+                            FieldNode(
+                                alias=NameNode(value=prefix + okey),
+                                name=field.name,
+                                arguments=field.arguments,
+                                directives=field.directives,
+                                selection_set=field.selection_set,
+                            )
+                        )
+            slots.append(key_map)
+        if not selections:
+            return None, slots
+        return (
+            DocumentNode(
+                definitions=(
+                    *fragments.values(),
+                    OperationDefinitionNode(
+                        operation=OperationType.QUERY,
+                        variable_definitions=(),
+                        directives=(),
+                        selection_set=SelectionSetNode(selections=tuple(selections)),
+                    ),
+                )
+            ),
+            slots,
+        )
+
 
 class SuiGQLClient(BaseSuiGQLClient):
     """Synchronous pysui GraphQL client."""
@@ -404,7 +526,11 @@ class SuiGQLClient(BaseSuiGQLClient):
 
 
 class AsyncSuiGQLClient(BaseSuiGQLClient):
-    """Asynchronous pysui GraphQL client."""
+    """Asynchronous pysui GraphQL client.
+
+    Executions share one HTTP/2 connection pool which is released with
+    `await client.close()`, or by using the client as an async context manager.
+    """
 
     def __init__(
         self,
@@ -434,15 +560,79 @@ class AsyncSuiGQLClient(BaseSuiGQLClient):
             gql_client=Client(
                 transport=HTTPXAsyncTransport(
                     url=gurl,
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=100,
+                        max_keepalive_connections=20,
+                        keepalive_expiry=30.0,
+                    ),
+                    timeout=httpx.Timeout(30.0, connect=5.0),
                 ),
-                fetch_schema_from_transport=True,
+                schema=_iclient.schema,
             ),
             version=_version,
             schema=_schema,
             rpc_config=_rpc_config,
             write_schema=write_schema,
         )
-
+        self._async_session: AsyncClientSession = None
+        self._session_lock: asyncio.Lock = None
+        self._session_loop: asyncio.AbstractEventLoop = None
+
+    async def __aenter__(self) -> "AsyncSuiGQLClient":
+        """Enter the async context, the session connects on first execution."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Exit the async context releasing the session."""
+        await self.close()
+
+    def _drop_session(self) -> None:
+        """Forget a session bound to another, typically closed, event loop."""
+        self._async_session = None
+        self._session_lock = None
+        self._session_loop = None
+        # Its connections can not be closed from this loop
+        self.client.transport.client = None
+
+    @versionadded(version="0.57.0", reason="Share one session across executions")
+    async def _session(self) -> AsyncClientSession:
+        """_session Connect, once per event loop, and return the shared session.
+
+        Concurrent executions (e.g. asyncio.gather) on the same client would
+        otherwise collide on the transport connection.
+
+        :return: The connected gql session
+        :rtype: AsyncClientSession
+        """
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            if self._session_loop is not None:
+                self._drop_session()
+            self._session_lock = asyncio.Lock()
+            self._session_loop = loop
+        if self._async_session is None:
+            async with self._session_lock:
+                if self._async_session is None:
+                    self._async_session = await self.client.connect_async()
+        return self._async_session
+
+    @versionadded(version="0.57.0", reason="Release the shared session")
+    async def close(self) -> None:
+        """close Release the shared session and its connection pool.
+
+        The client remains usable, a later execution connects a new session.
+        """
+        if self._session_loop is not asyncio.get_running_loop():
+            if self._session_loop is not None:
+                self._drop_session()
+            return
+        async with self._session_lock:
+            if self._async_session is not None:
+                self._async_session = None
+                await self.client.close_async()
+
+    @versionchanged(version="0.57.0", reason="Executes on the shared client session")
     @versionadded(
         version="0.56.0", reason="Common node execution with exception handling"
     )
@@ -464,11 +654,9 @@ class AsyncSuiGQLClient(BaseSuiGQLClient):
         :rtype: SuiRpcResult
         """
         try:
-            async with self.client as aclient:
-                sres = await aclient.execute(node)
-                return SuiRpcResult(
-                    True, None, sres if not encode_fn else encode_fn(sres)
-                )
+            session = await self._session()
+            sres = await session.execute(node)
+            return SuiRpcResult(True, None, sres if not encode_fn else encode_fn(sres))
 
         except texc.TransportQueryError as gte:
             return SuiRpcResult(
@@ -545,6 +733,54 @@ class AsyncSuiGQLClient(BaseSuiGQLClient):
                 False, "ValueError", pgql_type.ErrorGQL.from_query(ve.args)
             )
 
+    @versionadded(version="0.57.0", reason="Batch QueryNodes in a single request")
+    async def execute_query_nodes(
+        self,
+        *,
+        with_nodes: list[PGQL_QueryNode],
+    ) -> list[SuiRpcResult]:
+        """Execute multiple query QueryNodes in one GraphQL request.
+
+        The QueryNodes are merged into a single query and the response is split
+        back out and encoded by each QueryNode's encode_fn.
+
+        The merged query succeeds or fails as a whole, a GraphQL or transport error
+        for any one QueryNode fails every merged QueryNode with that error. A
+        QueryNode that can not produce a DocumentNode fails on its own.
+
+        :param with_nodes: The query QueryNodes to execute
+        :type with_nodes: list[PGQL_QueryNode]
+        :return: A SuiRpcResult for each QueryNode, in the same order
+        :rtype: list[SuiRpcResult]
+        """
+        try:
+            merged, slots = self._qnodes_merge(with_nodes)
+        except ValueError as ve:
+            return [
+                SuiRpcResult(
+                    False, "ValueError", pgql_type.ErrorGQL.from_query(ve.args)
+                )
+                for _ in with_nodes
+            ]
+        if merged is None:
+            return slots
+        mres = await self._execute(merged, None)
+        results: list[SuiRpcResult] = []
+        for qnode, slot in zip(with_nodes, slots):
+            if isinstance(slot, SuiRpcResult):
+                results.append(slot)
+            elif not mres.is_ok():
+                results.append(
+                    SuiRpcResult(False, mres.result_string, mres.result_data)
+                )
+            else:
+                sres = {okey: mres.result_data[mkey] for mkey, okey in slot}
+                encode_fn = qnode.encode_fn()
+                results.append(
+                    SuiRpcResult(True, None, sres if not encode_fn else encode_fn(sres))
+                )
+        return results
+
     @deprecated(
         version="0.56.0",
         reason="Use explicit execute for type (str,DocumentNode,PGQL_QueryNode. This will be deleted in version 0.60.0)",
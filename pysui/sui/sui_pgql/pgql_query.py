@@ -26,6 +26,8 @@ from pysui.sui.sui_pgql.pgql_validators import TypeValidator
 class GetCoinMetaData(PGQL_QueryNode):
     """GetCoinMetaData returns meta data for a specific `coin_type`."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, *, coin_type: Optional[str] = "0x2::sui::SUI") -> None:
         """QueryNode initializer.
 
@@ -60,6 +62,8 @@ class GetAllCoinBalances(PGQL_QueryNode):
     You take the coin_type from any list member and call...
     """
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(
         self, *, owner: str, next_page: Optional[pgql_type.PagingCursor] = None
     ):
@@ -106,6 +110,8 @@ class GetAllCoinBalances(PGQL_QueryNode):
 class GetCoins(PGQL_QueryNode):
     """GetCoins Returns all Coin objects of a specific type for owner."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(
         self,
         *,
@@ -153,6 +159,8 @@ class GetCoins(PGQL_QueryNode):
 class GetLatestSuiSystemState(PGQL_QueryNode):
     """GetLatestSuiSystemState return the latest known SUI system state."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self) -> None:
         """QueryNode initializer."""
 
@@ -228,6 +236,8 @@ class GetLatestSuiSystemState(PGQL_QueryNode):
 class GetObject(PGQL_QueryNode):
     """Returns a specific object's data."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, *, object_id: str):
         """QueryNode initializer.
 
@@ -259,6 +269,8 @@ class GetObject(PGQL_QueryNode):
 class GetObjectsOwnedByAddress(PGQL_QueryNode):
     """Returns data for all objects by owner."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(
         self, *, owner: str, next_page: Optional[pgql_type.PagingCursor] = None
     ):
@@ -305,6 +317,8 @@ class GetObjectsOwnedByAddress(PGQL_QueryNode):
 class GetMultipleGasObjects(PGQL_QueryNode):
     """Return basic Sui gas represnetation for each coin_id string."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, *, coin_object_ids: list[str]):
         """."""
         self.coin_ids = coin_object_ids
@@ -355,6 +369,8 @@ class GetMultipleGasObjects(PGQL_QueryNode):
 class GetMultipleObjects(PGQL_QueryNode):
     """Returns object data for list of object ids."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(
         self,
         *,
@@ -404,6 +420,8 @@ class GetMultipleObjects(PGQL_QueryNode):
 class GetPastObject(PGQL_QueryNode):
     """Returns a specific objects version data."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, *, object_id: str, version: int):
         """QueryNode initializer
 
@@ -446,6 +464,8 @@ class GetMultiplePastObjects(PGQL_QueryNode):
     policies.
     """
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, *, for_versions: list[dict]):
         """__init__ Initialize QueryNode to fetch object information give a list of object keys.
 
@@ -488,6 +508,8 @@ class GetMultiplePastObjects(PGQL_QueryNode):
 class GetDynamicFields(PGQL_QueryNode):
     """GetDynamicFields when executed, returns the list of dynamic field objects owned by an object."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(
         self,
         *,
@@ -561,6 +583,8 @@ class GetDynamicFields(PGQL_QueryNode):
 class GetEvents(PGQL_QueryNode):
     """GetEvents When executed, return list of events for a specified transaction block."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(
         self,
         *,
@@ -605,6 +629,8 @@ class GetEvents(PGQL_QueryNode):
 class GetTx(PGQL_QueryNode):
     """GetTx When executed, return the transaction response object."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, *, digest: str) -> None:
         """Initialize QueryNode.
 
@@ -642,6 +668,8 @@ class GetTx(PGQL_QueryNode):
 class GetMultipleTx(PGQL_QueryNode):
     """GetTxs returns multiple transaction summaries and is controlled by filters and paging."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(
         self, *, next_page: Optional[pgql_type.PagingCursor] = None, **qfilter
     ) -> None:
@@ -694,6 +722,8 @@ class GetMultipleTx(PGQL_QueryNode):
 class GetDelegatedStakes(PGQL_QueryNode):
     """GetDelegatedStakes return all [StakedSui] coins for owner."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, owner: str, next_page: Optional[pgql_type.PagingCursor] = None):
         """QueryNode initializer.
 
@@ -773,6 +803,8 @@ class GetDelegatedStakes(PGQL_QueryNode):
 class GetLatestCheckpointSequence(PGQL_QueryNode):
     """GetLatestCheckpointSequence return the sequence number of the latest checkpoint that has been executed."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self):
         """__init__ QueryNode initializer."""
 
@@ -795,6 +827,8 @@ class GetLatestCheckpointSequence(PGQL_QueryNode):
 class GetCheckpointByDigest(PGQL_QueryNode):
     """GetCheckpointByDigest return a checkpoint for cp_id."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, *, digest: str):
         """__init__ QueryNode initializer.
 
@@ -822,6 +856,8 @@ class GetCheckpointByDigest(PGQL_QueryNode):
 class GetCheckpointBySequence(PGQL_QueryNode):
     """GetCheckpoint return a checkpoint for cp_id."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, *, sequence_number: int):
         """__init__ QueryNode initializer.
 
@@ -849,6 +885,8 @@ class GetCheckpointBySequence(PGQL_QueryNode):
 class GetCheckpoints(PGQL_QueryNode):
     """GetCheckpoints return paginated list of checkpoints."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, *, next_page: Optional[pgql_type.PagingCursor] = None):
         """QueryNode initializer."""
         self.next_page = next_page
@@ -884,6 +922,8 @@ class GetCheckpoints(PGQL_QueryNode):
 class GetProtocolConfig(PGQL_QueryNode):
     """Return the protocol config table for the given version number."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, *, version: int):
         """QueryNode initializer
 
@@ -908,6 +948,8 @@ class GetProtocolConfig(PGQL_QueryNode):
 class GetReferenceGasPrice(PGQL_QueryNode):
     """GetReferenceGasPrice return the reference gas price for the network."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self):
         """QueryNode initializer."""
 
@@ -927,6 +969,8 @@ class GetReferenceGasPrice(PGQL_QueryNode):
 class GetNameServiceAddress(PGQL_QueryNode):
     """Return the resolved name service address for name."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, *, name: str):
         """__init__ QueryNode initializer."""
         self.name = name
@@ -946,6 +990,8 @@ class GetNameServiceAddress(PGQL_QueryNode):
 class GetNameServiceNames(PGQL_QueryNode):
     """Return the resolved names given address, if multiple names are resolved, the first one is the primary name."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(
         self,
         *,
@@ -974,6 +1020,8 @@ class GetNameServiceNames(PGQL_QueryNode):
 class GetValidatorsApy(PGQL_QueryNode):
     """Return the validator APY."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, next_page: Optional[pgql_type.PagingCursor] = None):
         """QueryNode initializer."""
         self.next_page = next_page
@@ -1015,6 +1063,8 @@ class GetValidatorsApy(PGQL_QueryNode):
 class GetCurrentValidators(PGQL_QueryNode):
     """Return the set of validators from the current Epoch."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, next_page: Optional[pgql_type.PagingCursor] = None):
         """QueryNode initializer."""
         self.next_page = next_page
@@ -1049,6 +1099,8 @@ class GetCurrentValidators(PGQL_QueryNode):
 class GetStructure(PGQL_QueryNode):
     """GetStructure When executed, returns a module's structure representation."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(
         self,
         *,
@@ -1093,6 +1145,8 @@ class GetStructure(PGQL_QueryNode):
 class GetStructures(PGQL_QueryNode):
     """GetStructures When executed, returns all of a module's structures."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(
         self,
         *,
@@ -1134,6 +1188,8 @@ class GetStructures(PGQL_QueryNode):
 class GetFunction(PGQL_QueryNode):
     """GetFunction When executed, returns a module's function information."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, *, package: str, module_name: str, function_name: str) -> None:
         """QueryNode initializer.
 
@@ -1172,6 +1228,8 @@ class GetFunction(PGQL_QueryNode):
 class GetFunctions(PGQL_QueryNode):
     """GetFunctions When executed, returns all module's functions information."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, *, package: str, module_name: str) -> None:
         """QueryNode initializer.
 
@@ -1212,6 +1270,8 @@ class GetModule(PGQL_QueryNode):
     Includes general Module informationn as well as structure and function definitions.
     """
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, *, package: str, module_name: str) -> None:
         """__init__ Initialize GetModule object.
 
@@ -1250,6 +1310,8 @@ class GetModule(PGQL_QueryNode):
 class GetPackage(PGQL_QueryNode):
     """GetPackage When executed, return structured representations of the package."""
 
+    _CACHE_DOCUMENT: bool = True
+
     def __init__(self, *, package: str) -> None:
         """__init__ Initialize GetPackage object."""
         self.package = package
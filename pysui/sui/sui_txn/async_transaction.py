@@ -14,8 +14,10 @@
 
 """Sui asynchronous Transaction for building Programmable Transactions."""
 
+import asyncio
+import functools
 import logging
-import base64
+import binascii
 from typing import Optional, Union, Any, Callable, Awaitable
 from deprecated.sphinx import versionadded, versionchanged, deprecated
 
@@ -41,6 +43,7 @@ from pysui.sui.sui_txresults.complex_tx import (
 from pysui.sui.sui_txn.transaction import (
     _DebugInspectTransaction,
     _SuiTransactionBase,
+    _coerce_object,
 )
 from pysui.sui.sui_builders.exec_builders import (
     DryRunTransaction,
@@ -64,18 +67,36 @@ if not logging.getLogger().handlers:
     logger.addHandler(logging.NullHandler())
     logger.propagate = False
 
+# Senders, packages and objects recur across transactions, parse each hex string once.
+# The returned Address instances are shared and must not be mutated.
+_address_from_str = functools.lru_cache(maxsize=4096)(bcs.Address.from_str)
+
+# Generic type arguments repeat across move calls, parse each type string once.
+# The returned TypeTag instances are shared and must not be mutated.
+_type_tag_from_str = functools.lru_cache(maxsize=2048)(bcs.TypeTag.type_tag_from)
+
+# Marks placeholder object references when resolution is deferred
+_DEFERRED_DIGEST: bcs.Digest = bcs.Digest.from_bytes(bytes(32))
+
 
 @versionchanged(version="0.30.0", reason="Separated sync and async SuiTransaction.")
 @deprecated(version="0.54.0", reason="Transitioning to sui_pgql")
 class SuiTransactionAsync(_SuiTransactionBase):
     """."""
 
+    # Object ids per fetch and concurrent fetches when resolving arguments
+    _OBJECT_FETCH_CHUNK: int = 15
+    _OBJECT_FETCH_PARALLEL: int = 4
+
     @versionchanged(version="0.29.1", reason="Eliminated redundant gas price RPC call")
     @versionchanged(version="0.33.0", reason="Added deserialize_from optional argument")
     @versionchanged(version="0.39.0", reason="Added compress_inputs option")
     @versionchanged(version="0.39.0", reason="keyword arguments")
+    @versionchanged(version="0.57.0", reason="Added deferred_resolution option")
     def __init__(
         self,
+        *,
+        deferred_resolution: Optional[bool] = False,
         **kwargs,
     ) -> None:
         """__init__ Initialize the asynchronous SuiTransaction.
@@ -90,8 +111,65 @@ class SuiTransactionAsync(_SuiTransactionBase):
         :type compress_inputs: bool,optional
         :param deserialize_from: Will rehydrate SuiTransaction state from serialized base64 str or bytes, defaults to None
         :type deserialize_from: Union[str, bytes], optional
+        :param deferred_resolution: Defer fetching objects passed by id until the transaction is inspected
+            or built, fetching all of them in one batch, defaults to False. Until then `raw_kind`,
+            `build_for_inspection` and `serialize` raise ValueError, see `resolve_deferred`.
+        :type deferred_resolution: bool, optional
         """
         super().__init__(**kwargs)
+        self._deferred_resolution = deferred_resolution
+        self._deferred_objects: set[str] = set()
+        # Deferred objects a move call parameter requires as mutable
+        self._deferred_mutable: set[str] = set()
+
+    async def _dry_run_budget(
+        self, tx_kind: bcs.TransactionKind, who_sends: str
+    ) -> Union[int, ValueError]:
+        """Dry run the transaction kind to establish the gas budget."""
+        tx_data = bcs.TransactionData(
+            "V1",
+            bcs.TransactionDataV1(
+                tx_kind,
+                _address_from_str(who_sends),
+                bcs.GasData(
+                    [],
+                    _address_from_str(who_sends),
+                    int(self._current_gas_price),
+                    self.constraints.max_tx_gas,
+                ),
+                bcs.TransactionExpiration("None"),
+            ),
+        )
+        result = await self.client.execute(
+            DryRunTransaction(
+                tx_bytes=binascii.b2a_base64(
+                    tx_data.serialize_with_kind(
+                        self.builder.finish_for_inspect_bytes()
+                    ),
+                    newline=False,
+                ).decode("ascii")
+            )
+        )
+        if (
+            result.is_ok()
+            and result.result_data
+            and isinstance(result.result_data, DryRunTxResult)
+        ):
+            dr_data: DryRunTxResult = result.result_data
+            return dr_data.effects.gas_used.total
+        raise ValueError(f"Dry run failed, can't establish budget for transaction")
+
+    async def _fetch_gas_object(
+        self, gas_object_id: str
+    ) -> Union[ObjectRead, ValueError]:
+        """Fetch the explicit gas object to use for payment."""
+        res = await self.client.get_object(gas_object_id)
+        if res.is_ok():
+            return res.result_data
+        logger.exception(f"Unable to fetch gas object {gas_object_id}")
+        raise ValueError(
+            f"Unable to fetch gas object {gas_object_id} error {res.result_string}"
+        )
 
     @versionchanged(
         version="0.28.0",
@@ -105,10 +183,14 @@ class SuiTransactionAsync(_SuiTransactionBase):
         version="0.32.0",
         reason="Changed to use DryRun for estimating if explicit gas_budget not set",
     )
+    @versionchanged(
+        version="0.57.0",
+        reason="use_gas_object accepts a fetched ObjectRead.",
+    )
     async def _build_for_execute(
         self,
         gas_budget: Union[str, SuiString] = "",
-        use_gas_object: Optional[Union[str, ObjectID]] = None,
+        use_gas_object: Optional[Union[str, ObjectID, ObjectRead]] = None,
     ) -> Union[bcs.TransactionData, ValueError]:
         """_build_for_execute Generates the TransactionData object.
 
@@ -118,8 +200,9 @@ class SuiTransactionAsync(_SuiTransactionBase):
         :param gas_budget: If gas_budget set it is used explicitly, otherwise a dry-run is peformed to get
             the recommended budget
         :type gas_budget: Union[str, SuiString],defaults to empty string (none)
-        :param use_gas_object: Explicit gas object to use for payment, defaults to None
-        :type use_gas_object: Optional[Union[str, ObjectID]], optional
+        :param use_gas_object: Explicit gas object to use for payment, defaults to None.
+            A current ObjectRead of the coin is used as is, without fetching it
+        :type use_gas_object: Optional[Union[str, ObjectID, ObjectRead]], optional
         :raises ValueError: If the dry-run of the transaction fails.
         :raises ValueError: If malformed inspection result
         :raises ValueError: If `use_gas_object` and it cannot resolve to Sui coin object
@@ -135,61 +218,38 @@ class SuiTransactionAsync(_SuiTransactionBase):
             who_sends = self.signer_block.sender.signing_address
 
         # Get the transaction kind body
+        await self._resolve_deferred()
         tx_kind = self.raw_kind()
 
-        # Use explicit budget or dry-run for it
-        if gas_budget:
-            gas_budget = int(gas_budget)
-        else:
-            # Dry run first
-            tx_data = bcs.TransactionData(
-                "V1",
-                bcs.TransactionDataV1(
-                    tx_kind,
-                    bcs.Address.from_str(who_sends),
-                    bcs.GasData(
-                        [],
-                        bcs.Address.from_str(who_sends),
-                        int(self._current_gas_price),
-                        self.constraints.max_tx_gas,
-                    ),
-                    bcs.TransactionExpiration("None"),
-                ),
-            )
-            result = await self.client.execute(
-                DryRunTransaction(
-                    tx_bytes=base64.b64encode(tx_data.serialize()).decode()
-                )
-            )
-            if (
-                result.is_ok()
-                and result.result_data
-                and isinstance(result.result_data, DryRunTxResult)
-            ):
-                dr_data: DryRunTxResult = result.result_data
-                gas_budget = dr_data.effects.gas_used.total
+        if use_gas_object:
+            if isinstance(use_gas_object, ObjectRead):
+                test_gas_object = use_gas_object.object_id
             else:
-                raise ValueError(
-                    f"Dry run failed, can't establish budget for transaction"
+                test_gas_object = (
+                    use_gas_object
+                    if isinstance(use_gas_object, str)
+                    else use_gas_object.value
                 )
-
-        if use_gas_object:
-            test_gas_object = (
-                use_gas_object
-                if isinstance(use_gas_object, str)
-                else use_gas_object.value
-            )
             if test_gas_object in self.builder.objects_registry:
                 raise ValueError(
                     f"use_gas_object {test_gas_object} in use in transaction."
                 )
-            res = await self.client.get_object(test_gas_object)
-            if res.is_ok():
-                use_coin: ObjectRead = res.result_data
+            if isinstance(use_gas_object, ObjectRead):
+                # Caller supplied the coin reference, nothing to fetch
+                gas_budget = (
+                    int(gas_budget)
+                    if gas_budget
+                    else await self._dry_run_budget(tx_kind, who_sends)
+                )
+                use_coin = use_gas_object
+            # The dry-run and the gas object fetch are independent, overlap them
+            elif gas_budget:
+                gas_budget = int(gas_budget)
+                use_coin = await self._fetch_gas_object(test_gas_object)
             else:
-                logger.exception(f"Unable to fetch gas object {test_gas_object}")
-                raise ValueError(
-                    f"Unable to fetch gas object {test_gas_object} error {res.result_string}"
+                gas_budget, use_coin = await asyncio.gather(
+                    self._dry_run_budget(tx_kind, who_sends),
+                    self._fetch_gas_object(test_gas_object),
                 )
             # Ensure there is enough in user provided gas
             if use_coin.balance < gas_budget:
@@ -203,19 +263,23 @@ class SuiTransactionAsync(_SuiTransactionBase):
             gas_object = bcs.GasData(
                 [
                     bcs.ObjectReference(
-                        bcs.Address.from_str(use_coin.object_id),
+                        _address_from_str(use_coin.object_id),
                         int(use_coin.version),
                         bcs.Digest.from_str(use_coin.digest),
                     )
                 ],
-                bcs.Address.from_str(use_coin.owner.address_owner),
+                _address_from_str(use_coin.owner.address_owner),
                 int(self._current_gas_price),
                 int(gas_budget),
             )
 
         else:
+            # Use explicit budget or dry-run for it
+            if gas_budget:
+                gas_budget = int(gas_budget)
+            else:
+                gas_budget = await self._dry_run_budget(tx_kind, who_sends)
             # Fetch the payment
-
             gas_object = await self._sig_block.get_gas_object_async(
                 client=self.client,
                 budget=gas_budget,
@@ -229,7 +293,7 @@ class SuiTransactionAsync(_SuiTransactionBase):
             "V1",
             bcs.TransactionDataV1(
                 tx_kind,
-                bcs.Address.from_str(who_sends),
+                _address_from_str(who_sends),
                 gas_object,
                 bcs.TransactionExpiration("None"),
             ),
@@ -256,12 +320,16 @@ class SuiTransactionAsync(_SuiTransactionBase):
         version="0.31.0",
         reason="Added optional 'run_verification' argument.",
     )
+    @versionchanged(
+        version="0.57.0",
+        reason="use_gas_object accepts a fetched ObjectRead.",
+    )
     async def execute(
         self,
         *,
         gas_budget: Optional[Union[str, SuiString]] = "",
         options: Optional[dict] = None,
-        use_gas_object: Optional[Union[str, ObjectID]] = None,
+        use_gas_object: Optional[Union[str, ObjectID, ObjectRead]] = None,
         run_verification: Optional[bool] = False,
     ) -> Union[SuiRpcResult, ValueError]:
         """execute Finalizes transaction and submits for execution on the chain.
@@ -273,8 +341,10 @@ class SuiTransactionAsync(_SuiTransactionBase):
             information results, defaults to None
         :type options: Optional[dict], optional
         :param use_gas_object: Explicit gas object to use for payment, defaults to None
-            Will fail if provided object is marked as 'in use' in commands
-        :type use_gas_object: Optional[Union[str, ObjectID]], optional
+            Will fail if provided object is marked as 'in use' in commands.
+            A current ObjectRead of the coin is used as is, with an explicit gas_budget
+            no RPC is made to prepare payment
+        :type use_gas_object: Optional[Union[str, ObjectID, ObjectRead]], optional
         :param run_verification: Will run validation on transaction using Sui ProtocolConfig constraints, defaults to False.
             Will fail if validation errors (SuiRpcResult.is_err()).
         :type run_verification: Optional[bool], optional
@@ -284,14 +354,14 @@ class SuiTransactionAsync(_SuiTransactionBase):
         assert not self._executed, "Transaction already executed"
 
         txn_data = await self._build_for_execute(gas_budget, use_gas_object)
-        ser_data = txn_data.serialize()
+        ser_data = txn_data.serialize_with_kind(self.builder.finish_for_inspect_bytes())
         if run_verification:
             _, failed_verification = self.verify_transaction(ser_data)
             if failed_verification:
                 return SuiRpcResult(False, "Failed validation", failed_verification)
 
         # To base64
-        tx_b64 = base64.b64encode(ser_data).decode()
+        tx_b64 = binascii.b2a_base64(ser_data, newline=False).decode("ascii")
         # To execution
         exec_tx = ExecuteTransaction(
             tx_bytes=tx_b64,
@@ -305,11 +375,15 @@ class SuiTransactionAsync(_SuiTransactionBase):
         return await self.client.execute(exec_tx)
 
     @versionadded(version="0.35.0", reason="Added for offline signing support")
+    @versionchanged(
+        version="0.57.0",
+        reason="use_gas_object accepts a fetched ObjectRead.",
+    )
     async def deferred_execution(
         self,
         *,
         gas_budget: Optional[Union[str, SuiString]] = "",
-        use_gas_object: Optional[Union[str, ObjectID]] = None,
+        use_gas_object: Optional[Union[str, ObjectID, ObjectRead]] = None,
         run_verification: Optional[bool] = False,
     ) -> Union[str, ValueError]:
         """deferred_execution Finalizes transaction and returns base64 string for signing.
@@ -321,7 +395,8 @@ class SuiTransactionAsync(_SuiTransactionBase):
         :type gas_budget: Optional[Union[str, SuiString]], optional
         :param use_gas_object: Explicit gas object to use for payment, defaults to None.
             Will fail if provided object is marked as 'in use' in commands.
-        :type use_gas_object: Optional[Union[str, ObjectID]], optional
+            A current ObjectRead of the coin is used as is, without fetching it.
+        :type use_gas_object: Optional[Union[str, ObjectID, ObjectRead]], optional
         :param run_verification: Will run validation on transaction using Sui ProtocolConfig constraints, defaults to False.
             Will fail if validation errors (SuiRpcResult.is_err()).
         :type run_verification: Optional[bool], optional
@@ -330,13 +405,13 @@ class SuiTransactionAsync(_SuiTransactionBase):
         """
         assert not self._executed, "Transaction already executed"
         txn_data = await self._build_for_execute(gas_budget, use_gas_object)
-        ser_data = txn_data.serialize()
+        ser_data = txn_data.serialize_with_kind(self.builder.finish_for_inspect_bytes())
         if run_verification:
             _, failed_verification = self.verify_transaction(ser_data)
             if failed_verification:
                 return SuiRpcResult(False, "Failed validation", failed_verification)
         self._executed = True
-        return base64.b64encode(ser_data).decode()
+        return binascii.b2a_base64(ser_data, newline=False).decode("ascii")
 
     @versionchanged(
         version="0.16.1",
@@ -350,6 +425,7 @@ class SuiTransactionAsync(_SuiTransactionBase):
         :return: The successful result or the SuiRpcResult if inspect transaction failed.
         :rtype: Union[TxInspectionResult, SuiRpcResult]
         """
+        await self._resolve_deferred()
         tx_bytes = self.build_for_inspection()
         if self.signer_block.sender:
             for_sender: Union[SuiAddress, SigningMultiSig] = self.signer_block.sender
@@ -358,7 +434,8 @@ class SuiTransactionAsync(_SuiTransactionBase):
         else:
             for_sender = self.client.config.active_address
         try:
-            logger.debug(f"Inspecting {tx_bytes}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Inspecting %s", tx_bytes)
             result = await self.client.execute(
                 _DebugInspectTransaction(sender_address=for_sender, tx_bytes=tx_bytes)
             )
@@ -382,44 +459,179 @@ class SuiTransactionAsync(_SuiTransactionBase):
         self, items: list, objref_indexes: list, objtup_indexes: list
     ):
         """Finalizes object ref types."""
-        if objref_indexes:
-            res = await self.client.get_objects_for([items[x] for x in objref_indexes])
-
-            # res = await self.client.execute(
-            #     GetMultipleObjects(
-            #         object_ids=[items[x] for x in objref_indexes]
-            #     )
-            # )
-            if res.is_ok():
-                res_list = res.result_data
-                if len(res_list) != len(objref_indexes):
-                    raise ValueError(
-                        f"Unable to find object in set {[items[x] for x in objref_indexes]}"
-                    )
-                # Update items list and register tuple conversion
-                for index, result in enumerate(res_list):
-                    items[objref_indexes[index]] = result
-                    objtup_indexes.append(objref_indexes[index])
-            else:
-                raise ValueError(f"{res.result_string}")
-        if objtup_indexes:
-            for tindex in objtup_indexes:
-                item = items[tindex]
-                if isinstance(item.owner, (AddressOwner, ImmutableOwner)):
-                    obj_ref = GenericRef(item.object_id, item.version, item.digest)
-                    b_obj_arg = bcs.ObjectArg(
+        # Hoisted for the conversion loops
+        builder_arg = bcs.BuilderArg
+        address_from_str = _address_from_str
+        object_arg = self._object_arg
+        if objref_indexes and self._deferred_resolution:
+            # Placeholder until _resolve_deferred fetches the actual references
+            for oindex in objref_indexes:
+                address = address_from_str(items[oindex].value)
+                self._deferred_objects.add(address.to_address_str())
+                items[oindex] = (
+                    builder_arg("Object", address),
+                    bcs.ObjectArg(
                         "ImmOrOwnedObject",
-                        bcs.ObjectReference.from_generic_ref(obj_ref),
-                    )
-                elif isinstance(item.owner, SharedOwner):
-                    b_obj_arg = bcs.ObjectArg(
-                        "SharedObject",
-                        bcs.SharedObjectReference.from_object_read(item),
-                    )
-                items[tindex] = (
-                    bcs.BuilderArg("Object", bcs.Address.from_str(item.object_id)),
-                    b_obj_arg,
+                        bcs.ObjectReference(address, 0, _DEFERRED_DIGEST),
+                    ),
                 )
+        elif objref_indexes:
+            res_list = await self._fetch_objects([items[x] for x in objref_indexes])
+            # Convert fetched objects as they are placed
+            for oindex, item in zip(objref_indexes, res_list):
+                items[oindex] = (
+                    builder_arg("Object", address_from_str(item.object_id)),
+                    object_arg(item),
+                )
+        self._place_object_reads(items, objtup_indexes)
+
+    def _place_object_reads(self, items: list, objtup_indexes: list) -> None:
+        """Convert objects supplied ready to use, no fetch required."""
+        builder_arg = bcs.BuilderArg
+        address_from_str = _address_from_str
+        object_arg = self._object_arg
+        for tindex in objtup_indexes:
+            item = items[tindex]
+            items[tindex] = (
+                builder_arg("Object", address_from_str(item.object_id)),
+                object_arg(item),
+            )
+
+    async def _fetch_objects(self, object_ids: list) -> list[ObjectRead]:
+        """Fetch objects in bounded parallel chunks, preserving order."""
+        cached = self._cached_system_objects(object_ids)
+        if cached:
+            missing = [x for i, x in enumerate(object_ids) if i not in cached]
+            fetched = iter(await self._fetch_objects(missing) if missing else [])
+            return [cached.get(i) or next(fetched) for i in range(len(object_ids))]
+        limiter = asyncio.Semaphore(self._OBJECT_FETCH_PARALLEL)
+
+        async def _fetch_chunk(chunk: list) -> SuiRpcResult:
+            async with limiter:
+                return await self.client.get_objects_for(chunk)
+
+        chunk_size = self._OBJECT_FETCH_CHUNK
+        res_list: list = []
+        for res in await asyncio.gather(
+            *[
+                _fetch_chunk(object_ids[x : x + chunk_size])
+                for x in range(0, len(object_ids), chunk_size)
+            ]
+        ):
+            if res.is_err():
+                raise ValueError(f"{res.result_string}")
+            res_list.extend(res.result_data)
+        if len(res_list) != len(object_ids):
+            raise ValueError(f"Unable to find object in set {object_ids}")
+        self._cache_system_objects(object_ids, res_list)
+        return res_list
+
+    def _object_arg(self, item: ObjectRead) -> bcs.ObjectArg:
+        """Convert a fetched object to its ObjectArg by ownership."""
+        if isinstance(item.owner, (AddressOwner, ImmutableOwner)):
+            obj_ref = GenericRef(item.object_id, item.version, item.digest)
+            return bcs.ObjectArg(
+                "ImmOrOwnedObject",
+                bcs.ObjectReference.from_generic_ref(obj_ref),
+            )
+        if isinstance(item.owner, SharedOwner):
+            return bcs.ObjectArg(
+                "SharedObject",
+                bcs.SharedObjectReference.from_object_read(item),
+            )
+
+    @versionadded(version="0.57.0", reason="Support deferred object resolution")
+    async def _resolve_deferred(self) -> None:
+        """Fetch all deferred objects at once and replace their placeholder inputs."""
+        if not self._deferred_objects:
+            return
+        object_ids = list(self._deferred_objects)
+        reads = await self._fetch_objects([ObjectID(x) for x in object_ids])
+        by_id: dict[str, ObjectRead] = dict(zip(object_ids, reads))
+        builder = self.builder
+        for key, call_arg in builder.inputs.items():
+            obj_arg = call_arg.value
+            if (
+                call_arg.enum_name == "Object"
+                and getattr(obj_arg.value, "ObjectDigest", None) is _DEFERRED_DIGEST
+            ):
+                object_id = key.value.to_address_str()
+                real_arg = self._object_arg(by_id[object_id])
+                # Carry forward Receiving and Mutable set by _receiving_feature
+                if obj_arg.enum_name == "Receiving":
+                    real_arg = bcs.ObjectArg("Receiving", real_arg.value)
+                elif (
+                    real_arg.enum_name == "SharedObject"
+                    and object_id in self._deferred_mutable
+                ):
+                    real_arg.value.Mutable = True
+                builder.inputs[key] = bcs.CallArg("Object", real_arg)
+                builder.objects_registry[object_id] = real_arg.enum_name
+        builder._kind_bytes = None
+        self._deferred_objects.clear()
+        self._deferred_mutable.clear()
+
+    @versionadded(version="0.57.0", reason="Support deferred object resolution")
+    async def resolve_deferred(self) -> None:
+        """resolve_deferred Fetch objects deferred by `deferred_resolution`.
+
+        Required before `raw_kind`, `build_for_inspection` or `serialize` when
+        objects are pending, inspecting and executing resolve them implicitly.
+        """
+        await self._resolve_deferred()
+
+    def _check_resolved(self) -> None:
+        """Refuse to expose placeholder object references."""
+        if self._deferred_objects:
+            raise ValueError(
+                f"{len(self._deferred_objects)} deferred objects are unresolved, "
+                "await resolve_deferred() first"
+            )
+
+    def raw_kind(self) -> bcs.TransactionKind:
+        """Returns the TransactionKind object hierarchy of inputs, returns and commands.
+
+        This is useful for reviewing the transaction that will be executed or inspected.
+
+        :raises ValueError: If deferred objects are unresolved
+        """
+        self._check_resolved()
+        return super().raw_kind()
+
+    def build_for_inspection(self) -> str:
+        """build_for_inspection returns a base64 string that can be used in inspecting transaction.
+
+        :raises ValueError: If deferred objects are unresolved
+        :return: base64 string representation of underlying TransactionKind
+        :rtype: str
+        """
+        self._check_resolved()
+        return super().build_for_inspection()
+
+    def serialize(self, include_sender_sponsor: Optional[bool] = True) -> bytes:
+        """serialize Serialize the transaction builder state.
+
+        :raises ValueError: If deferred objects are unresolved, their placeholders
+            can not be resolved after deserializing
+        """
+        self._check_resolved()
+        return super().serialize(include_sender_sponsor)
+
+    def _receiving_feature(
+        self, arguments: list, param_flags: tuple[tuple[bool, bool], ...]
+    ) -> list:
+        """Apply argument flags, recording mutability for deferred placeholders."""
+        arguments = super()._receiving_feature(arguments, param_flags)
+        if self._deferred_objects:
+            # Placeholders are ImmOrOwnedObject so have no Mutable to set
+            for arg, (_, is_mutable) in zip(arguments, param_flags):
+                if (
+                    is_mutable
+                    and type(arg) is tuple
+                    and getattr(arg[1].value, "ObjectDigest", None) is _DEFERRED_DIGEST
+                ):
+                    self._deferred_mutable.add(arg[0].value.to_address_str())
+        return arguments
 
     @versionchanged(version="0.18.0", reason="Handle argument nested list recursion.")
     async def _resolve_arguments(self, items: list) -> list:
@@ -427,25 +639,28 @@ class SuiTransactionAsync(_SuiTransactionBase):
         objref_indexes: list[int] = []
         objtup_indexes: list[int] = []
         # Separate the index based on conversion types
-        for index in range(len(items)):
-            self._resolve_item(index, items, objref_indexes, objtup_indexes)
-        await self._resolve_objects(items, objref_indexes, objtup_indexes)
+        self._resolve_items(items, objref_indexes, objtup_indexes)
+        # Only object ids need a fetch, everything else resolves in place
+        if objref_indexes:
+            await self._resolve_objects(items, objref_indexes, objtup_indexes)
+        elif objtup_indexes:
+            self._place_object_reads(items, objtup_indexes)
         return items
 
-    # TODO: Investigate functools LRU
     @versionchanged(
         version="0.20.2", reason="Capture function argument meta data as well"
     )
     async def _move_call_target_cache(
         self, target: str
-    ) -> tuple[bcs.Address, str, str, list, int]:
+    ) -> tuple[bcs.Address, str, str, tuple, int]:
         """Used to resolve information regarding a move call target.
 
         This caches the result of a GetFunction meta-data information essention to setting up
         the proper command return types.
         """
-        if target in self._MC_RESULT_CACHE:
-            return self._MC_RESULT_CACHE[target]
+        res_tup = self._mc_cache_get(target)
+        if res_tup is not None:
+            return res_tup
         package_id, module_id, function_id = target.split("::")
         result = await self.client.execute(
             GetFunction(
@@ -459,18 +674,62 @@ class SuiTransactionAsync(_SuiTransactionBase):
             if reslen:
                 pass
             res_tup = (
-                bcs.Address.from_str(package_id),
+                _address_from_str(package_id),
                 module_id,
                 function_id,
-                result.result_data.parameters,
+                self._parameter_flags(result.result_data.parameters),
                 reslen,
             )
             # res_cnt: int = len(result.result_data.returns)
-            # package_id = bcs.Address.from_str(package_id)
-            self._MC_RESULT_CACHE[target] = res_tup
+            self._mc_cache_put(target, res_tup)
             return res_tup
         raise ValueError(f"Unable to find target: {target}")
 
+    @versionadded(version="0.57.0", reason="Resolve many move call targets at once")
+    async def prefetch_targets(self, targets: list[Union[str, SuiString]]) -> None:
+        """prefetch_targets Resolve move call target meta data in one batch request.
+
+        Useful before staging many `move_call` commands, subsequent calls to targets
+        resolved here will not go to the chain.
+
+        :param targets: List of "package_object_id::module_name::function_name" strings
+        :type targets: list[Union[str, SuiString]]
+        :raises ValueError: If any target can not be found
+        """
+        pending: list[str] = []
+        for target in targets:
+            target = target if isinstance(target, str) else target.value
+            if self._mc_cache_get(target) is None and target not in pending:
+                pending.append(target)
+        if not pending:
+            return
+        split_targets = [x.split("::") for x in pending]
+        results = await self.client.execute_batch(
+            [
+                GetFunction(
+                    package=package_id,
+                    module_name=module_id,
+                    function_name=function_id,
+                )
+                for package_id, module_id, function_id in split_targets
+            ]
+        )
+        for target, (package_id, module_id, function_id), result in zip(
+            pending, split_targets, results
+        ):
+            if not result.is_ok():
+                raise ValueError(f"Unable to find target: {target}")
+            self._mc_cache_put(
+                target,
+                (
+                    _address_from_str(package_id),
+                    module_id,
+                    function_id,
+                    self._parameter_flags(result.result_data.parameters),
+                    len(result.result_data.returns),
+                ),
+            )
+
     @versionchanged(version="0.19.0", reason="Check that only type Objects are passed")
     @versionchanged(version="0.21.1", reason="Added optional item_type argument")
     @versionchanged(
@@ -481,36 +740,28 @@ class SuiTransactionAsync(_SuiTransactionBase):
     ) -> bcs.Argument:
         """Create a call to convert a list of objects to a Sui 'vector' of item_type."""
 
-        def _first_non_argument_type(inner_list: list) -> Any:
+        arg_type = bcs.Argument
+
+        def _first_non_argument_type(inner_list: list) -> Optional[type]:
             """."""
-            result = None
             for inner_item in inner_list:
-                if not isinstance(inner_item, bcs.Argument):
-                    result = inner_item
-                    break
-            return result
+                if type(inner_item) is not arg_type:
+                    return type(inner_item)
+            return None
 
         if item_type:
-            type_tag = bcs.OptionalTypeTag(bcs.TypeTag.type_tag_from(item_type))
+            type_tag = bcs.OptionalTypeTag(_type_tag_from_str(item_type))
         else:
             type_tag = bcs.OptionalTypeTag()
         if items:
-            first_item = _first_non_argument_type(items)
-            if first_item:
+            first_type = _first_non_argument_type(items)
+            if first_type:
                 # If not all arguments, ensure the remaining are consistent
-                first_class = first_item.__class__.__name__
-                # if first_class != "Argument" and first_class in self._PURE_CANDIDATES:
-                #     raise ValueError(
-                #         f"make_move_vec is for Objects only. Found type {first_class}"
-                #     )
                 for item in items:
-                    item_class = item.__class__.__name__
-                    if item_class == "Argument":
-                        pass
-                    else:
-                        assert (
-                            item_class == first_class
-                        ), f"Expected {first_class} found {item_class}"
+                    item_clz = type(item)
+                    assert (
+                        item_clz is first_type or item_clz is arg_type
+                    ), f"Expected {first_type.__name__} found {item_clz.__name__}"
                 return self.builder.make_move_vector(
                     type_tag, await self._resolve_arguments(items)
                 )
@@ -553,14 +804,14 @@ class SuiTransactionAsync(_SuiTransactionBase):
             target_id,
             module_id,
             function_id,
-            parameters,
+            param_flags,
             res_count,
         ) = await self._move_call_target_cache(target)
         # Standardize the arguments to list
         if arguments:
             arguments = arguments if isinstance(arguments, list) else arguments.array
             arguments = self._receiving_feature(
-                await self._resolve_arguments(arguments), parameters
+                await self._resolve_arguments(arguments), param_flags
             )
         else:
             arguments = []
@@ -571,7 +822,7 @@ class SuiTransactionAsync(_SuiTransactionBase):
                 if isinstance(type_arguments, list)
                 else type_arguments.array
             )
-            type_arguments = [bcs.TypeTag.type_tag_from(x) for x in type_arguments]
+            type_arguments = [_type_tag_from_str(x) for x in type_arguments]
         else:
             type_arguments = []
 
@@ -606,15 +857,21 @@ class SuiTransactionAsync(_SuiTransactionBase):
         assert isinstance(target, (str, SuiString))
         # Standardize the input parameters
         target = target if isinstance(target, str) else target.value
-        (
-            target_id,
-            module_id,
-            function_id,
-            parameters,
-            res_count,
-        ) = await self._move_call_target_cache(target)
+        return self._move_call_resolved(
+            await self._move_call_target_cache(target), arguments, type_arguments
+        )
+
+    @versionadded(version="0.57.0", reason="Stage move calls for a resolved target")
+    def _move_call_resolved(
+        self,
+        target_info: tuple[bcs.Address, str, str, tuple, int],
+        arguments: list[Union[bcs.Argument, tuple[bcs.BuilderArg, bcs.ObjectArg]]],
+        type_arguments: Optional[list[bcs.TypeTag]] = None,
+    ) -> Union[bcs.Argument, list[bcs.Argument]]:
+        """Stage a move call command from the result of _move_call_target_cache."""
+        target_id, module_id, function_id, param_flags, res_count = target_info
         if arguments:
-            arguments = self._receiving_feature(arguments, parameters)
+            arguments = self._receiving_feature(arguments, param_flags)
         type_arguments = type_arguments if isinstance(type_arguments, list) else []
         return self.builder.move_call(
             target=target_id,
@@ -650,7 +907,10 @@ class SuiTransactionAsync(_SuiTransactionBase):
         :rtype: bcs.Argument
         """
         assert not self._executed, "Transaction already executed"
-        modules, dependencies, _ = self._compile_source(project_path, args_list)
+        # Compile off the event loop
+        modules, dependencies, _ = await asyncio.to_thread(
+            self._compile_source, project_path, args_list
+        )
         return self.builder.publish(modules, dependencies)
 
     async def _verify_upgrade_cap(self, upgrade_cap: str) -> ObjectRead:
@@ -706,16 +966,17 @@ class SuiTransactionAsync(_SuiTransactionBase):
         assert not self._executed, "Transaction already executed"
         assert isinstance(upgrade_cap, (str, ObjectID, ObjectRead))
         assert isinstance(package_id, (str, ObjectID))
-        # Compile the new package
-        modules, dependencies, digest = self._compile_source(project_path, args_list)
-        # Verify get/upgrade cap details
+        # Compile the new package in a thread while verifying get/upgrade cap details
         if not isinstance(upgrade_cap, ObjectRead):
             upgrade_cap = (
                 upgrade_cap if isinstance(upgrade_cap, str) else upgrade_cap.value
             )
-            upgrade_cap = await self._verify_upgrade_cap(upgrade_cap)
         else:
-            upgrade_cap = await self._verify_upgrade_cap(upgrade_cap.object_id)
+            upgrade_cap = upgrade_cap.object_id
+        (modules, dependencies, digest), upgrade_cap = await asyncio.gather(
+            asyncio.to_thread(self._compile_source, project_path, args_list),
+            self._verify_upgrade_cap(upgrade_cap),
+        )
 
         capability_arg = await self._resolve_arguments(
             [
@@ -730,7 +991,7 @@ class SuiTransactionAsync(_SuiTransactionBase):
         cap_arg = len(self.builder.inputs)
         # authorize
         auth_cmd = self.builder.authorize_upgrade(*capability_arg)
-        package_id = bcs.Address.from_str(
+        package_id = _address_from_str(
             package_id if isinstance(package_id, str) else package_id.value
         )
         # Upgrade
@@ -780,20 +1041,21 @@ class SuiTransactionAsync(_SuiTransactionBase):
         """
         assert authorize_upgrade_fn, "'authorize_upgrade_fn' is NoneType"
         assert commit_upgrade_fn, "'commit_upgrade_fn' is NoneType"
-        # Compile the new package
-        modules, dependencies, digest = self._compile_source(project_path, args_list)
-        # Verify get/upgrade cap details
+        # Compile the new package in a thread while verifying get/upgrade cap details
         if not isinstance(upgrade_cap, ObjectRead):
             upgrade_cap = (
                 upgrade_cap if isinstance(upgrade_cap, str) else upgrade_cap.value
             )
-            upgrade_cap = await self._verify_upgrade_cap(upgrade_cap)
         else:
-            upgrade_cap = await self._verify_upgrade_cap(upgrade_cap.object_id)
+            upgrade_cap = upgrade_cap.object_id
+        (modules, dependencies, digest), upgrade_cap = await asyncio.gather(
+            asyncio.to_thread(self._compile_source, project_path, args_list),
+            self._verify_upgrade_cap(upgrade_cap),
+        )
 
         upgrade_ticket = await authorize_upgrade_fn(self, upgrade_cap, digest)
         # Extrack the auth_cmd cap input
-        package_id = bcs.Address.from_str(
+        package_id = _address_from_str(
             package_id if isinstance(package_id, str) else package_id.value
         )
         # Upgrade
@@ -821,22 +1083,22 @@ class SuiTransactionAsync(_SuiTransactionBase):
         :rtype: bcs.Argument
         """
         assert not self._executed, "Transaction already executed"
-        params: list = []
-        params.append(self._SYSTEMSTATE_OBJECT)
-        params.append(await self.make_move_vector(coins))
+        coins_vector = await self.make_move_vector(coins)
         if amount:
             amount = amount if isinstance(amount, int) else amount.value
-            params.append(bcs.OptionalU64(amount))
+            amount = bcs.OptionalU64(amount)
         else:
-            params.append(bcs.OptionalU64())
-        params.append(
+            amount = self._empty_optional_u64()
+        validator_address = (
             validator_address
             if isinstance(validator_address, SuiAddress)
             else SuiAddress(validator_address)
         )
         return await self._move_call(
             target=self._STAKE_REQUEST_TARGET,
-            arguments=await self._resolve_arguments(params),
+            arguments=await self._resolve_arguments(
+                [self._SYSTEMSTATE_OBJECT, coins_vector, amount, validator_address]
+            ),
         )
 
     async def unstake_coin(
@@ -851,22 +1113,20 @@ class SuiTransactionAsync(_SuiTransactionBase):
         :rtype: bcs.Argument
         """
         assert not self._executed, "Transaction already executed"
-        params: list = []
-        params.append(self._SYSTEMSTATE_OBJECT)
         if isinstance(staked_coin, str):
-            params.append(ObjectID(staked_coin))
+            staked_coin = ObjectID(staked_coin)
         elif isinstance(staked_coin, StakedSui):
             if staked_coin.status != "Pending":
-                params.append(ObjectID(staked_coin.staked_sui_id))
+                staked_coin = ObjectID(staked_coin.staked_sui_id)
             else:
                 raise ValueError(
                     f"Can not unstake non-activated staked coin {staked_coin}"
                 )
-        else:
-            params.append(staked_coin)
         return await self._move_call(
             target=self._UNSTAKE_REQUEST_TARGET,
-            arguments=await self._resolve_arguments(params),
+            arguments=await self._resolve_arguments(
+                [self._SYSTEMSTATE_OBJECT, staked_coin]
+            ),
         )
 
     @versionchanged(
@@ -906,27 +1166,23 @@ class SuiTransactionAsync(_SuiTransactionBase):
         :rtype: Union[list[bcs.Argument],bcs.Argument]
         """
         assert not self._executed, "Transaction already executed"
-        assert isinstance(
-            coin, (str, ObjectID, ObjectRead, SuiCoinObject, bcs.Argument)
-        ), "invalid coin object type"
+        coin = _coerce_object(coin)
         amounts = amounts if isinstance(amounts, list) else [amounts]
-        for amount in amounts:
-            assert isinstance(amount, (int, SuiInteger))
-        i_amounts = []
-        for amount in amounts:
-            if isinstance(amount, int):
-                i_amounts.append(tx_builder.PureInput.as_input(bcs.U64.encode(amount)))
-            elif isinstance(amount, SuiInteger):
-                i_amounts.append(
-                    tx_builder.PureInput.as_input(bcs.U64.encode(amount.value))
-                )
-            elif isinstance(amount, bcs.Argument):
-                i_amounts.append(amount)
-        coin = (
-            coin
-            if isinstance(coin, (ObjectID, ObjectRead, SuiCoinObject, bcs.Argument))
-            else ObjectID(coin)
-        )
+        to_u64 = tx_builder.PureInput.as_u64_input
+        # Common case of all python ints encodes in one monomorphic pass
+        if all(type(amount) is int for amount in amounts):
+            i_amounts = list(map(to_u64, amounts))
+        else:
+            for amount in amounts:
+                assert isinstance(amount, (int, SuiInteger))
+            i_amounts = []
+            for amount in amounts:
+                if isinstance(amount, int):
+                    i_amounts.append(to_u64(amount))
+                elif isinstance(amount, SuiInteger):
+                    i_amounts.append(to_u64(amount.value))
+                elif isinstance(amount, bcs.Argument):
+                    i_amounts.append(amount)
         resolved = await self._resolve_arguments([coin])
         return self.builder.split_coin(resolved[0], i_amounts)
 
@@ -954,24 +1210,17 @@ class SuiTransactionAsync(_SuiTransactionBase):
         :rtype: bcs.Argument
         """
         assert not self._executed, "Transaction already executed"
-        assert isinstance(
-            coin, (str, ObjectID, ObjectRead, SuiCoinObject, bcs.Argument)
-        ), "invalid coin object type"
+        coin = _coerce_object(coin)
         assert isinstance(split_count, (int, SuiInteger)), "invalid amount type"
         split_count = split_count if isinstance(split_count, int) else split_count.value
-        coin = (
-            coin
-            if isinstance(coin, (ObjectID, ObjectRead, SuiCoinObject, bcs.Argument))
-            else ObjectID(coin)
-        )
         resolved = await self._resolve_arguments(
-            [coin, tx_builder.PureInput.as_input(bcs.U64.encode(split_count))]
+            [coin, tx_builder.PureInput.as_u64_input(split_count)]
         )
 
         return await self._move_call(
             target=self._SPLIT_AND_KEEP,
             arguments=resolved,
-            type_arguments=[bcs.TypeTag.type_tag_from(coin_type)],
+            type_arguments=[_type_tag_from_str(coin_type)],
         )
 
     async def split_coin_and_return(
@@ -993,24 +1242,17 @@ class SuiTransactionAsync(_SuiTransactionBase):
         :rtype: bcs.Argument
         """
         assert not self._executed, "Transaction already executed"
-        assert isinstance(
-            coin, (str, ObjectID, ObjectRead, SuiCoinObject, bcs.Argument)
-        ), "invalid coin object type"
+        coin = _coerce_object(coin)
         assert isinstance(split_count, (int, SuiInteger)), "invalid amount type"
         split_count = split_count if isinstance(split_count, int) else split_count.value
         if split_count < 2:
             raise ValueError(f"Split count {split_count} must be greater than 1")
-        coin = (
-            coin
-            if isinstance(coin, (ObjectID, ObjectRead, SuiCoinObject, bcs.Argument))
-            else ObjectID(coin)
-        )
         resolved = await self._resolve_arguments(
-            [coin, tx_builder.PureInput.as_input(bcs.U64.encode(split_count))]
+            [coin, tx_builder.PureInput.as_u64_input(split_count)]
         )
 
         # Split 1 coin into split_count total [orig, new 1, new 2]
-        coin_type_tag = bcs.TypeTag.type_tag_from(coin_type)
+        coin_type_tag = _type_tag_from_str(coin_type)
         result_vector = await self._move_call(
             target=self._SPLIT_AND_RETURN,
             arguments=resolved,
@@ -1018,26 +1260,23 @@ class SuiTransactionAsync(_SuiTransactionBase):
         )
         # Itemize the new coins
         if coin_type.count("<") == 0:
-            coin_type_tag = bcs.TypeTag.type_tag_from(f"0x2::coin::Coin<{coin_type}>")
-
-        # We only want the new coins
-        nreslist: list[bcs.Argument] = []
-        for nrindex in range(split_count - 1):
-            nreslist.append(
-                await self._move_call(
-                    target=self._VECTOR_REMOVE_INDEX,
-                    arguments=[
-                        result_vector,
-                        tx_builder.PureInput.as_input(SuiU64(0)),
-                    ],
-                    type_arguments=[coin_type_tag],
-                )
-            )
-        await self._move_call(
-            target=self._VECTOR_DESTROY_EMPTY,
-            arguments=[result_vector],
-            type_arguments=[coin_type_tag],
+            coin_type_tag = _type_tag_from_str(f"0x2::coin::Coin<{coin_type}>")
+
+        # We only want the new coins, every removal shares one index 0 input
+        zero_arg = self.builder.input_pure(tx_builder.PureInput.as_input(SuiU64(0)))
+        # Targets resolved up front so the removals are staged without awaits
+        remove_target, destroy_target = await asyncio.gather(
+            self._move_call_target_cache(self._VECTOR_REMOVE_INDEX),
+            self._move_call_target_cache(self._VECTOR_DESTROY_EMPTY),
         )
+        # Only read by the builder, shared by every removal
+        remove_args = [result_vector, zero_arg]
+        type_args = [coin_type_tag]
+        nreslist: list[bcs.Argument] = [
+            self._move_call_resolved(remove_target, remove_args, type_args)
+            for _ in range(split_count - 1)
+        ]
+        self._move_call_resolved(destroy_target, [result_vector], type_args)
         return nreslist
 
     async def merge_coins(
@@ -1059,29 +1298,19 @@ class SuiTransactionAsync(_SuiTransactionBase):
         :rtype: bcs.Argument
         """
         assert not self._executed, "Transaction already executed"
-        assert isinstance(
-            merge_to, (str, ObjectID, ObjectRead, SuiCoinObject, bcs.Argument)
-        ), "Unsupported type for merge_to"
+        merge_to = _coerce_object(merge_to)
         if isinstance(merge_to, bcs.Argument) and merge_to.enum_name == "GasCoin":
             self.signer_block._merging_to_gas()
-        resolved = await self._resolve_arguments(
-            [merge_to if not isinstance(merge_to, str) else ObjectID(merge_to)]
-        )
-        merge_to = resolved[0]
         # Depper from_coin type verification
         # assert isinstance(
         #     merge_from, (list, SuiArray)
         # ), "Unsupported merge_from collection type"
-        parm_list: list = []
+        # Resolve merge_to and merge_from together in one pass
         merge_from = merge_from if isinstance(merge_from, list) else merge_from.coins
-        for fcoin in merge_from:
-            assert isinstance(
-                fcoin, (str, ObjectID, ObjectRead, SuiCoinObject, bcs.Argument)
-            ), "Unsupported entry in merge_from"
-            parm_list.append(fcoin if not isinstance(fcoin, str) else ObjectID(fcoin))
-        return self.builder.merge_coins(
-            merge_to, await self._resolve_arguments(parm_list)
-        )
+        parm_list: list = [merge_to]
+        parm_list.extend(_coerce_object(fcoin) for fcoin in merge_from)
+        resolved = await self._resolve_arguments(parm_list)
+        return self.builder.merge_coins(resolved[0], resolved[1:])
 
     async def public_transfer_object(
         self,
@@ -1102,12 +1331,9 @@ class SuiTransactionAsync(_SuiTransactionBase):
         :rtype: bcs.Argument
         """
         assert not self._executed, "Transaction already executed"
-        assert isinstance(
-            object_to_send,
-            (str, ObjectID, ObjectRead, SuiCoinObject, bcs.Argument),
-        ), "invalid object type"
+        object_to_send = _coerce_object(object_to_send)
         assert isinstance(recipient, SuiAddress), "Invalid recipient type"
-        obj_type_tag = bcs.TypeTag.type_tag_from(object_type)
+        obj_type_tag = _type_tag_from_str(object_type)
         resolved_args = await self._resolve_arguments([object_to_send, recipient])
         return await self._move_call(
             target=self._PUBLIC_TRANSFER,
@@ -1140,16 +1366,7 @@ class SuiTransactionAsync(_SuiTransactionBase):
         assert isinstance(recipient, (ObjectID, SuiAddress)), "invalid recipient type"
         if isinstance(transfers, (list, SuiArray)):
             transfers = transfers if isinstance(transfers, list) else transfers.array
-            coerced_transfers: list = []
-            for txfer in transfers:
-                assert isinstance(
-                    txfer,
-                    (str, ObjectID, ObjectRead, SuiCoinObject, bcs.Argument),
-                ), "Unsupported entry in transfers"
-                if isinstance(txfer, str):
-                    coerced_transfers.append(ObjectID(txfer))
-                else:
-                    coerced_transfers.append(txfer)
+            coerced_transfers: list = [_coerce_object(txfer) for txfer in transfers]
             transfers = await self._resolve_arguments(coerced_transfers)
         return self.builder.transfer_objects(
             tx_builder.PureInput.as_input(recipient), transfers
@@ -1177,16 +1394,15 @@ class SuiTransactionAsync(_SuiTransactionBase):
         """
         assert not self._executed, "Transaction already executed"
         assert isinstance(recipient, (ObjectID, SuiAddress)), "invalid recipient type"
+        recipient = tx_builder.PureInput.as_input(recipient)
         if amount:
             assert isinstance(amount, (int, SuiInteger))
             amount = amount if isinstance(amount, int) else amount.value
-            amount = tx_builder.PureInput.as_input(bcs.U64.encode(amount))
+            amount = tx_builder.PureInput.as_u64_input(amount)
         if from_coin:
             if isinstance(from_coin, str):
                 from_coin = ObjectID(from_coin)
             from_coin = await self._resolve_arguments([from_coin])
         else:
             raise ValueError(f"Invalid 'from_coin' {from_coin}")
-        return self.builder.transfer_sui(
-            tx_builder.PureInput.as_input(recipient), *from_coin, amount
-        )
+        return self.builder.transfer_sui(recipient, *from_coin, amount)
@@ -17,7 +17,7 @@
 from typing import Optional, Union
 from deprecated.sphinx import versionadded, versionchanged
 
-from pysui import SuiAddress, SyncClient, handle_result, ObjectID, AsyncClient
+from pysui import SuiAddress, SyncClient, ObjectID, AsyncClient
 from pysui.sui.sui_builders.base_builder import sui_builder
 from pysui.sui.sui_builders.exec_builders import _MoveCallTransactionBuilder
 from pysui.sui.sui_crypto import MultiSig, SuiPublicKey, BaseMultiSig
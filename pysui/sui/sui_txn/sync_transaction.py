@@ -15,6 +15,7 @@
 """Sui synchronous Transaction for building Programmable Transactions."""
 
 from typing import Any, Optional, Union, Callable
+import functools
 import logging
 import base64
 from deprecated.sphinx import versionadded, versionchanged, deprecated
@@ -38,6 +39,7 @@ import pysui.sui.sui_txn.transaction_builder as tx_builder
 from pysui.sui.sui_txn.transaction import (
     _DebugInspectTransaction,
     _SuiTransactionBase,
+    _coerce_object,
 )
 from pysui.sui.sui_builders.exec_builders import (
     DryRunTransaction,
@@ -62,6 +64,10 @@ if not logging.getLogger().handlers:
     logger.addHandler(logging.NullHandler())
     logger.propagate = False
 
+# Generic type arguments repeat across move calls, parse each type string once.
+# The returned TypeTag instances are shared and must not be mutated.
+_type_tag_from_str = functools.lru_cache(maxsize=2048)(bcs.TypeTag.type_tag_from)
+
 
 @versionchanged(version="0.20.3", reason="Explicit support of tx.gas.")
 @versionchanged(version="0.30.0", reason="Separated sync and async SuiTransaction.")
@@ -113,7 +119,8 @@ class SuiTransaction(_SuiTransactionBase):
         else:
             for_sender = self.client.config.active_address
         try:
-            logger.debug(f"Inspecting {tx_bytes}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Inspecting %s", tx_bytes)
             result = self.client.execute(
                 _DebugInspectTransaction(sender_address=for_sender, tx_bytes=tx_bytes)
             )
@@ -407,13 +414,23 @@ class SuiTransaction(_SuiTransactionBase):
     def _resolve_objects(self, items: list, objref_indexes: list, objtup_indexes: list):
         """Finalizes object ref types."""
         if objref_indexes:
-            res = self.client.get_objects_for([items[x] for x in objref_indexes])
+            # Previously fetched shared system objects need no round trip
+            cached = self._cached_system_objects([items[x] for x in objref_indexes])
+            for index, result in cached.items():
+                items[objref_indexes[index]] = result
+                objtup_indexes.append(objref_indexes[index])
+            if cached:
+                objref_indexes = [
+                    x for i, x in enumerate(objref_indexes) if i not in cached
+                ]
+        if objref_indexes:
+            object_ids = [items[x] for x in objref_indexes]
+            res = self.client.get_objects_for(object_ids)
             if res.is_ok():
                 res_list = res.result_data
                 if len(res_list) != len(objref_indexes):
-                    raise ValueError(
-                        f"Unable to find object in set {[items[x] for x in objref_indexes]}"
-                    )
+                    raise ValueError(f"Unable to find object in set {object_ids}")
+                self._cache_system_objects(object_ids, res_list)
                 # Update items list and register tuple conversion
                 for index, result in enumerate(res_list):
                     items[objref_indexes[index]] = result
@@ -445,25 +462,24 @@ class SuiTransaction(_SuiTransactionBase):
         objref_indexes: list[int] = []
         objtup_indexes: list[int] = []
         # Separate the index based on conversion types
-        for index in range(len(items)):
-            self._resolve_item(index, items, objref_indexes, objtup_indexes)
+        self._resolve_items(items, objref_indexes, objtup_indexes)
         self._resolve_objects(items, objref_indexes, objtup_indexes)
         return items
 
-    # TODO: Investigate functools LRU
     @versionchanged(
         version="0.20.2", reason="Capture function argument meta data as well"
     )
     def _move_call_target_cache(
         self, target: str
-    ) -> tuple[bcs.Address, str, str, list, int]:
+    ) -> tuple[bcs.Address, str, str, tuple, int]:
         """Used to resolve information regarding a move call target.
 
         This caches the result of a GetFunction meta-data information essention to setting up
         the proper command return types.
         """
-        if target in self._MC_RESULT_CACHE:
-            return self._MC_RESULT_CACHE[target]
+        res_tup = self._mc_cache_get(target)
+        if res_tup is not None:
+            return res_tup
         package_id, module_id, function_id = target.split("::")
         result = self.client.execute(
             GetFunction(
@@ -480,12 +496,12 @@ class SuiTransaction(_SuiTransactionBase):
                 bcs.Address.from_str(package_id),
                 module_id,
                 function_id,
-                result.result_data.parameters,
+                self._parameter_flags(result.result_data.parameters),
                 reslen,
             )
             # res_cnt: int = len(result.result_data.returns)
             # package_id = bcs.Address.from_str(package_id)
-            self._MC_RESULT_CACHE[target] = res_tup
+            self._mc_cache_put(target, res_tup)
             return res_tup
         raise ValueError(f"Unable to find target: {target}")
 
@@ -499,36 +515,28 @@ class SuiTransaction(_SuiTransactionBase):
     ) -> bcs.Argument:
         """Create a call to convert a list of objects to a Sui 'vector' of item_type."""
 
-        def _first_non_argument_type(inner_list: list) -> Any:
+        arg_type = bcs.Argument
+
+        def _first_non_argument_type(inner_list: list) -> Optional[type]:
             """."""
-            result = None
             for inner_item in inner_list:
-                if not isinstance(inner_item, bcs.Argument):
-                    result = inner_item
-                    break
-            return result
+                if type(inner_item) is not arg_type:
+                    return type(inner_item)
+            return None
 
         if item_type:
-            type_tag = bcs.OptionalTypeTag(bcs.TypeTag.type_tag_from(item_type))
+            type_tag = bcs.OptionalTypeTag(_type_tag_from_str(item_type))
         else:
             type_tag = bcs.OptionalTypeTag()
         if items:
-            first_item = _first_non_argument_type(items)
-            if first_item:
+            first_type = _first_non_argument_type(items)
+            if first_type:
                 # If not all arguments, ensure the remaining are consistent
-                first_class = first_item.__class__.__name__
-                # if first_class != "Argument" and first_class in self._PURE_CANDIDATES:
-                #     raise ValueError(
-                #         f"make_move_vec is for Objects only. Found type {first_class}"
-                #     )
                 for item in items:
-                    item_class = item.__class__.__name__
-                    if item_class == "Argument":
-                        pass
-                    else:
-                        assert (
-                            item_class == first_class
-                        ), f"Expected {first_class} found {item_class}"
+                    item_clz = type(item)
+                    assert (
+                        item_clz is first_type or item_clz is arg_type
+                    ), f"Expected {first_type.__name__} found {item_clz.__name__}"
                 return self.builder.make_move_vector(
                     type_tag, self._resolve_arguments(items)
                 )
@@ -571,14 +579,14 @@ class SuiTransaction(_SuiTransactionBase):
             target_id,
             module_id,
             function_id,
-            parameters,
+            param_flags,
             res_count,
         ) = self._move_call_target_cache(target)
         # Standardize the arguments to list
         if arguments:
             arguments = arguments if isinstance(arguments, list) else arguments.array
             arguments = self._receiving_feature(
-                self._resolve_arguments(arguments), parameters
+                self._resolve_arguments(arguments), param_flags
             )
         else:
             arguments = []
@@ -589,7 +597,7 @@ class SuiTransaction(_SuiTransactionBase):
                 if isinstance(type_arguments, list)
                 else type_arguments.array
             )
-            type_arguments = [bcs.TypeTag.type_tag_from(x) for x in type_arguments]
+            type_arguments = [_type_tag_from_str(x) for x in type_arguments]
         else:
             type_arguments = []
 
@@ -628,11 +636,11 @@ class SuiTransaction(_SuiTransactionBase):
             target_id,
             module_id,
             function_id,
-            parameters,
+            param_flags,
             res_count,
         ) = self._move_call_target_cache(target)
         if arguments:
-            arguments = self._receiving_feature(arguments, parameters)
+            arguments = self._receiving_feature(arguments, param_flags)
         type_arguments = type_arguments if isinstance(type_arguments, list) else []
         return self.builder.move_call(
             target=target_id,
@@ -837,22 +845,22 @@ class SuiTransaction(_SuiTransactionBase):
         :rtype: bcs.Argument
         """
         assert not self._executed, "Transaction already executed"
-        params: list = []
-        params.append(self._SYSTEMSTATE_OBJECT)
-        params.append(self.make_move_vector(coins))
+        coins_vector = self.make_move_vector(coins)
         if amount:
             amount = amount if isinstance(amount, int) else amount.value
-            params.append(bcs.OptionalU64(amount))
+            amount = bcs.OptionalU64(amount)
         else:
-            params.append(bcs.OptionalU64())
-        params.append(
+            amount = self._empty_optional_u64()
+        validator_address = (
             validator_address
             if isinstance(validator_address, SuiAddress)
             else SuiAddress(validator_address)
         )
         return self._move_call(
             target=self._STAKE_REQUEST_TARGET,
-            arguments=self._resolve_arguments(params),
+            arguments=self._resolve_arguments(
+                [self._SYSTEMSTATE_OBJECT, coins_vector, amount, validator_address]
+            ),
         )
 
     def unstake_coin(
@@ -867,22 +875,18 @@ class SuiTransaction(_SuiTransactionBase):
         :rtype: bcs.Argument
         """
         assert not self._executed, "Transaction already executed"
-        params: list = []
-        params.append(self._SYSTEMSTATE_OBJECT)
         if isinstance(staked_coin, str):
-            params.append(ObjectID(staked_coin))
+            staked_coin = ObjectID(staked_coin)
         elif isinstance(staked_coin, StakedSui):
             if staked_coin.status != "Pending":
-                params.append(ObjectID(staked_coin.staked_sui_id))
+                staked_coin = ObjectID(staked_coin.staked_sui_id)
             else:
                 raise ValueError(
                     f"Can not unstake non-activated staked coin {staked_coin}"
                 )
-        else:
-            params.append(staked_coin)
         return self._move_call(
             target=self._UNSTAKE_REQUEST_TARGET,
-            arguments=self._resolve_arguments(params),
+            arguments=self._resolve_arguments([self._SYSTEMSTATE_OBJECT, staked_coin]),
         )
 
     @versionchanged(
@@ -922,29 +926,25 @@ class SuiTransaction(_SuiTransactionBase):
         :rtype: Union[list[bcs.Argument],bcs.Argument]
         """
         assert not self._executed, "Transaction already executed"
-        assert isinstance(
-            coin, (str, ObjectID, ObjectRead, SuiCoinObject, bcs.Argument)
-        ), "invalid coin object type"
+        coin = _coerce_object(coin)
         amounts = amounts if isinstance(amounts, list) else [amounts]
-        for amount in amounts:
-            assert isinstance(
-                amount, (int, SuiInteger, bcs.Argument)
-            ), "Amounts invalid type"
-        i_amounts = []
-        for amount in amounts:
-            if isinstance(amount, int):
-                i_amounts.append(tx_builder.PureInput.as_input(bcs.U64.encode(amount)))
-            elif isinstance(amount, SuiInteger):
-                i_amounts.append(
-                    tx_builder.PureInput.as_input(bcs.U64.encode(amount.value))
-                )
-            elif isinstance(amount, bcs.Argument):
-                i_amounts.append(amount)
-        coin = (
-            coin
-            if isinstance(coin, (ObjectID, ObjectRead, SuiCoinObject, bcs.Argument))
-            else ObjectID(coin)
-        )
+        to_u64 = tx_builder.PureInput.as_u64_input
+        # Common case of all python ints encodes in one monomorphic pass
+        if all(type(amount) is int for amount in amounts):
+            i_amounts = list(map(to_u64, amounts))
+        else:
+            for amount in amounts:
+                assert isinstance(
+                    amount, (int, SuiInteger, bcs.Argument)
+                ), "Amounts invalid type"
+            i_amounts = []
+            for amount in amounts:
+                if isinstance(amount, int):
+                    i_amounts.append(to_u64(amount))
+                elif isinstance(amount, SuiInteger):
+                    i_amounts.append(to_u64(amount.value))
+                elif isinstance(amount, bcs.Argument):
+                    i_amounts.append(amount)
         resolved = self._resolve_arguments([coin])
         return self.builder.split_coin(resolved[0], i_amounts)
 
@@ -972,24 +972,17 @@ class SuiTransaction(_SuiTransactionBase):
         :rtype: bcs.Argument
         """
         assert not self._executed, "Transaction already executed"
-        assert isinstance(
-            coin, (str, ObjectID, ObjectRead, SuiCoinObject, bcs.Argument)
-        ), "invalid coin object type"
+        coin = _coerce_object(coin)
         assert isinstance(split_count, (int, SuiInteger)), "invalid amount type"
         split_count = split_count if isinstance(split_count, int) else split_count.value
-        coin = (
-            coin
-            if isinstance(coin, (ObjectID, ObjectRead, SuiCoinObject, bcs.Argument))
-            else ObjectID(coin)
-        )
         resolved = self._resolve_arguments(
-            [coin, tx_builder.PureInput.as_input(bcs.U64.encode(split_count))]
+            [coin, tx_builder.PureInput.as_u64_input(split_count)]
         )
 
         return self._move_call(
             target=self._SPLIT_AND_KEEP,
             arguments=resolved,
-            type_arguments=[bcs.TypeTag.type_tag_from(coin_type)],
+            type_arguments=[_type_tag_from_str(coin_type)],
         )
 
     def split_coin_and_return(
@@ -1011,24 +1004,17 @@ class SuiTransaction(_SuiTransactionBase):
         :rtype: bcs.Argument
         """
         assert not self._executed, "Transaction already executed"
-        assert isinstance(
-            coin, (str, ObjectID, ObjectRead, SuiCoinObject, bcs.Argument)
-        ), "invalid coin object type"
+        coin = _coerce_object(coin)
         assert isinstance(split_count, (int, SuiInteger)), "invalid amount type"
         split_count = split_count if isinstance(split_count, int) else split_count.value
         if split_count < 2:
             raise ValueError(f"Split count {split_count} must be greater than 1")
-        coin = (
-            coin
-            if isinstance(coin, (ObjectID, ObjectRead, SuiCoinObject, bcs.Argument))
-            else ObjectID(coin)
-        )
         resolved = self._resolve_arguments(
-            [coin, tx_builder.PureInput.as_input(bcs.U64.encode(split_count))]
+            [coin, tx_builder.PureInput.as_u64_input(split_count)]
         )
 
         # Split 1 coin into split_count total [orig, new 1, new 2]
-        coin_type_tag = bcs.TypeTag.type_tag_from(coin_type)
+        coin_type_tag = _type_tag_from_str(coin_type)
         result_vector = self._move_call(
             target=self._SPLIT_AND_RETURN,
             arguments=resolved,
@@ -1036,25 +1022,26 @@ class SuiTransaction(_SuiTransactionBase):
         )
         # Itemize the new coins
         if coin_type.count("<") == 0:
-            coin_type_tag = bcs.TypeTag.type_tag_from(f"0x2::coin::Coin<{coin_type}>")
+            coin_type_tag = _type_tag_from_str(f"0x2::coin::Coin<{coin_type}>")
 
-        # We only want the new coins
+        # We only want the new coins, every removal shares one index 0 input
+        zero_arg = self.builder.input_pure(tx_builder.PureInput.as_input(SuiU64(0)))
+        # Only read by the builder, shared by every removal
+        remove_args = [result_vector, zero_arg]
+        type_args = [coin_type_tag]
         nreslist: list[bcs.Argument] = []
-        for nrindex in range(split_count - 1):
+        for _ in range(split_count - 1):
             nreslist.append(
                 self._move_call(
                     target=self._VECTOR_REMOVE_INDEX,
-                    arguments=[
-                        result_vector,
-                        tx_builder.PureInput.as_input(SuiU64(0)),
-                    ],
-                    type_arguments=[coin_type_tag],
+                    arguments=remove_args,
+                    type_arguments=type_args,
                 )
             )
         self._move_call(
             target=self._VECTOR_DESTROY_EMPTY,
             arguments=[result_vector],
-            type_arguments=[coin_type_tag],
+            type_arguments=type_args,
         )
         return nreslist
 
@@ -1077,26 +1064,19 @@ class SuiTransaction(_SuiTransactionBase):
         :rtype: bcs.Argument
         """
         assert not self._executed, "Transaction already executed"
-        assert isinstance(
-            merge_to, (str, ObjectID, ObjectRead, SuiCoinObject, bcs.Argument)
-        ), "Unsupported type for merge_to"
+        merge_to = _coerce_object(merge_to)
         if isinstance(merge_to, bcs.Argument) and merge_to.enum_name == "GasCoin":
             self.signer_block._merging_to_gas()
-        merge_to = self._resolve_arguments(
-            [merge_to if not isinstance(merge_to, str) else ObjectID(merge_to)]
-        )[0]
         # Depper from_coin type verification
         # assert isinstance(
         #     merge_from, (list, SuiArray)
         # ), "Unsupported merge_from collection type"
-        parm_list: list = []
+        # Resolve merge_to and merge_from together in one pass
         merge_from = merge_from if isinstance(merge_from, list) else merge_from.coins
-        for fcoin in merge_from:
-            assert isinstance(
-                fcoin, (str, ObjectID, ObjectRead, SuiCoinObject, bcs.Argument)
-            ), "Unsupported entry in merge_from"
-            parm_list.append(fcoin if not isinstance(fcoin, str) else ObjectID(fcoin))
-        return self.builder.merge_coins(merge_to, self._resolve_arguments(parm_list))
+        parm_list: list = [merge_to]
+        parm_list.extend(_coerce_object(fcoin) for fcoin in merge_from)
+        resolved = self._resolve_arguments(parm_list)
+        return self.builder.merge_coins(resolved[0], resolved[1:])
 
     def public_transfer_object(
         self,
@@ -1117,12 +1097,9 @@ class SuiTransaction(_SuiTransactionBase):
         :rtype: bcs.Argument
         """
         assert not self._executed, "Transaction already executed"
-        assert isinstance(
-            object_to_send,
-            (str, ObjectID, ObjectRead, SuiCoinObject, bcs.Argument),
-        ), "invalid object type"
+        object_to_send = _coerce_object(object_to_send)
         assert isinstance(recipient, SuiAddress), "Invalid recipient type"
-        obj_type_tag = bcs.TypeTag.type_tag_from(object_type)
+        obj_type_tag = _type_tag_from_str(object_type)
         resolved_args = self._resolve_arguments([object_to_send, recipient])
         return self._move_call(
             target=self._PUBLIC_TRANSFER,
@@ -1155,16 +1132,7 @@ class SuiTransaction(_SuiTransactionBase):
         assert isinstance(recipient, (ObjectID, SuiAddress)), "invalid recipient type"
         if isinstance(transfers, (list, SuiArray)):
             transfers = transfers if isinstance(transfers, list) else transfers.array
-            coerced_transfers: list = []
-            for txfer in transfers:
-                assert isinstance(
-                    txfer,
-                    (str, ObjectID, ObjectRead, SuiCoinObject, bcs.Argument),
-                ), "Unsupported entry in transfers"
-                if isinstance(txfer, str):
-                    coerced_transfers.append(ObjectID(txfer))
-                else:
-                    coerced_transfers.append(txfer)
+            coerced_transfers: list = [_coerce_object(txfer) for txfer in transfers]
             transfers = self._resolve_arguments(coerced_transfers)
         return self.builder.transfer_objects(
             tx_builder.PureInput.as_input(recipient), transfers
@@ -1195,7 +1163,7 @@ class SuiTransaction(_SuiTransactionBase):
         if amount:
             assert isinstance(amount, (int, SuiInteger))
             amount = amount if isinstance(amount, int) else amount.value
-            amount = tx_builder.PureInput.as_input(bcs.U64.encode(amount))
+            amount = tx_builder.PureInput.as_u64_input(amount)
         if from_coin:
             if isinstance(from_coin, str):
                 from_coin = ObjectID(from_coin)
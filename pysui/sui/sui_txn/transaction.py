@@ -13,8 +13,10 @@
 
 """Sui high level Transaction Builder supports generation of TransactionKind and TransactionData."""
 
-
 import base64
+import binascii
+from collections import OrderedDict
+from functools import singledispatch
 import os
 from pathlib import Path
 from typing import Final, Optional, Union
@@ -45,6 +47,9 @@ from pysui.sui.sui_txresults.package_meta import (
     SuiParameterStruct,
 )
 from pysui.sui.sui_txresults.single_tx import (
+    ObjectRead,
+    SharedOwner,
+    SuiCoinObject,
     TransactionConstraints,
 )
 from pysui.sui.sui_types import bcs
@@ -62,6 +67,25 @@ if not logging.getLogger().handlers:
     logger.propagate = False
 
 
+@singledispatch
+def _coerce_object(arg):
+    """Normalize an object command argument, a str id becomes ObjectID."""
+    raise TypeError(f"Unsupported object type {type(arg).__name__}")
+
+
+@_coerce_object.register(str)
+def _(arg: str) -> ObjectID:
+    return ObjectID(arg)
+
+
+@_coerce_object.register(ObjectID)
+@_coerce_object.register(ObjectRead)
+@_coerce_object.register(SuiCoinObject)
+@_coerce_object.register(bcs.Argument)
+def _(arg):
+    return arg
+
+
 class _DebugInspectTransaction(_NativeTransactionBuilder):
     """_DebugInspectTransaction added for malformed inspection results."""
 
@@ -119,7 +143,14 @@ class _DebugInspectTransaction(_NativeTransactionBuilder):
 class _SuiTransactionBase:
     """SuiTransaction base object."""
 
-    _MC_RESULT_CACHE: dict = {}
+    _MC_RESULT_CACHE: OrderedDict[str, tuple] = OrderedDict()
+    _MC_RESULT_CACHE_SIZE: int = 1024
+    # Shared system objects never change initial_shared_version on a chain,
+    # fetched reads are kept by (rpc url, requested id)
+    _SYSTEM_SHARED_IDS: frozenset[str] = frozenset(
+        bcs.Address.from_str(x).to_address_str() for x in ("0x5", "0x6", "0x8", "0x403")
+    )
+    _SYSTEM_SHARED_CACHE: dict[tuple[str, str], ObjectRead] = {}
     _PURE_CANDIDATES: set[str] = {
         "bool",
         "SuiBoolean",
@@ -145,8 +176,13 @@ class _SuiTransactionBase:
         "Address",
     }
 
+    # Argument item classification memoized by type, see _arg_kind
+    _ARG_KINDS: dict[type, str] = {}
+
     _TRANSACTION_GAS_ARGUMENT: bcs.Argument = bcs.Argument("GasCoin")
     _SYSTEMSTATE_OBJECT: ObjectID = ObjectID("0x5")
+    # Shared, only ever serialized as a pure input, see _empty_optional_u64
+    _EMPTY_OPTIONAL_U64: Optional[bcs.OptionalU64] = None
     _STAKE_REQUEST_TARGET: str = "0x3::sui_system::request_add_stake_mul_coin"
     _UNSTAKE_REQUEST_TARGET: str = "0x3::sui_system::request_withdraw_stake"
     _STANDARD_UPGRADE_CAP_TYPE: str = "0x2::package::UpgradeCap"
@@ -214,6 +250,51 @@ class _SuiTransactionBase:
         """Enables use of gas reference as parameters in commands."""
         return self._TRANSACTION_GAS_ARGUMENT
 
+    @classmethod
+    def _empty_optional_u64(cls) -> bcs.OptionalU64:
+        """Return the shared empty OptionalU64, built on first use as the type is deprecated."""
+        if _SuiTransactionBase._EMPTY_OPTIONAL_U64 is None:
+            _SuiTransactionBase._EMPTY_OPTIONAL_U64 = bcs.OptionalU64()
+        return _SuiTransactionBase._EMPTY_OPTIONAL_U64
+
+    @classmethod
+    def _mc_cache_get(cls, target: str) -> Optional[tuple]:
+        """Return cached move call target meta data, if any, refreshing its recency."""
+        res_tup = cls._MC_RESULT_CACHE.get(target)
+        if res_tup is not None:
+            cls._MC_RESULT_CACHE.move_to_end(target)
+        return res_tup
+
+    @classmethod
+    def _mc_cache_put(cls, target: str, res_tup: tuple) -> None:
+        """Cache move call target meta data, evicting the least recently used."""
+        cls._MC_RESULT_CACHE[target] = res_tup
+        if len(cls._MC_RESULT_CACHE) > cls._MC_RESULT_CACHE_SIZE:
+            cls._MC_RESULT_CACHE.popitem(last=False)
+
+    @versionadded(version="0.57.0", reason="Skip refetching shared system objects")
+    def _cached_system_objects(self, object_ids: list) -> dict[int, ObjectRead]:
+        """Return index to previously fetched shared system object, if any."""
+        cache = self._SYSTEM_SHARED_CACHE
+        if not cache:
+            return {}
+        rpc_url = self.client.config.rpc_url
+        hits: dict[int, ObjectRead] = {}
+        for index, object_id in enumerate(object_ids):
+            item = cache.get((rpc_url, object_id.value))
+            if item is not None:
+                hits[index] = item
+        return hits
+
+    @versionadded(version="0.57.0", reason="Skip refetching shared system objects")
+    def _cache_system_objects(self, object_ids: list, reads: list[ObjectRead]) -> None:
+        """Remember fetched shared system objects under the id they were requested by."""
+        rpc_url = self.client.config.rpc_url
+        system_ids = self._SYSTEM_SHARED_IDS
+        for object_id, item in zip(object_ids, reads):
+            if item.object_id in system_ids and isinstance(item.owner, SharedOwner):
+                self._SYSTEM_SHARED_CACHE[(rpc_url, object_id.value)] = item
+
     def raw_kind(self) -> bcs.TransactionKind:
         """Returns the TransactionKind object hierarchy of inputs, returns and commands.
 
@@ -227,7 +308,9 @@ class _SuiTransactionBase:
         :return: base64 string representation of underlying TransactionKind
         :rtype: str
         """
-        return base64.b64encode(self.raw_kind().serialize()).decode()
+        return binascii.b2a_base64(
+            self.builder.finish_for_inspect_bytes(), newline=False
+        ).decode("ascii")
 
     @versionadded(version="0.30.0", reason="Observing Sui ProtocolConfig constraints")
     @versionchanged(version="0.31.0", reason="Validating against all PTB constraints")
@@ -409,11 +492,51 @@ class _SuiTransactionBase:
                 case _:
                     raise ValueError(f"Uknown class type handler {clz_name}")
 
-    def _to_bytes_from_str(self, inbound: Union[str, SuiString]) -> list[int]:
-        """Utility to convert base64 string to bytes then as list of u8."""
-        return list(
-            base64.b64decode(inbound if isinstance(inbound, str) else inbound.value)
-        )
+    @classmethod
+    def _arg_kind(cls, clz: type) -> str:
+        """Classify an argument item type by class name as _resolve_item does."""
+        kind = cls._ARG_KINDS.get(clz)
+        if kind is None:
+            clz_name = clz.__name__
+            if clz_name in cls._PURE_CANDIDATES:
+                kind = "pure"
+            elif clz_name == "ObjectID":
+                kind = "ref"
+            elif clz_name == "ObjectRead":
+                kind = "tuple"
+            elif clz_name in ("Argument", "BuilderArg", "tuple"):
+                kind = "pass"
+            else:
+                kind = "other"
+            cls._ARG_KINDS[clz] = kind
+        return kind
+
+    @versionadded(version="0.57.0", reason="Single pass argument classification")
+    def _resolve_items(self, items: list, refs: list, tuples: list):
+        """Resolve the appropriate bcs type for all argument items.
+
+        Common item types are dispatched on the memoized type classification, lists,
+        coins and unknown types go through _resolve_item.
+        """
+        arg_kinds = self._ARG_KINDS
+        as_input = tx_builder.PureInput.as_input
+        refs_append = refs.append
+        tuples_append = tuples.append
+        for index, item in enumerate(items):
+            kind = arg_kinds.get(type(item)) or self._arg_kind(type(item))
+            if kind == "pure":
+                items[index] = as_input(item)
+            elif kind == "ref":
+                refs_append(index)
+            elif kind == "tuple":
+                tuples_append(index)
+            elif kind == "other":
+                self._resolve_item(index, items, refs, tuples)
+
+    @versionchanged(version="0.57.0", reason="Returns bytes instead of list of u8")
+    def _to_bytes_from_str(self, inbound: Union[str, SuiString]) -> bytes:
+        """Utility to convert base64 string to bytes."""
+        return base64.b64decode(inbound if isinstance(inbound, str) else inbound.value)
 
     @versionchanged(
         version="0.50.0",
@@ -423,7 +546,7 @@ class _SuiTransactionBase:
         self,
         project_path: str,
         args_list: list[str],
-    ) -> tuple[list[str], list[str], bcs.Digest]:
+    ) -> tuple[list[bytes], list[bcs.Address], bcs.Digest]:
         """."""
         src_path = Path(os.path.expanduser(project_path))
         args_list = args_list if args_list else []
@@ -452,36 +575,43 @@ class _SuiTransactionBase:
             arg_is_receiving = True
         return arg_is_receiving
 
+    @versionadded(version="0.57.0", reason="Precompute per target parameter flags")
+    def _parameter_flags(self, parameters: list) -> tuple[tuple[bool, bool], ...]:
+        """Return (is_receiving, is_mutable) for each move call target parameter."""
+        return tuple(
+            (self._receiving_parm(parm), bool(getattr(parm, "is_mutable", False)))
+            for parm in parameters
+        )
+
     @versionadded(
         version="0.37.0",
         reason="Process arguments for Receiving object decoration",
     )
-    def _receiving_feature(self, arguments: list, parameters: list) -> list:
+    @versionchanged(
+        version="0.57.0",
+        reason="Takes the target's precomputed parameter flags",
+    )
+    def _receiving_feature(
+        self, arguments: list, param_flags: tuple[tuple[bool, bool], ...]
+    ) -> list:
         """."""
+        is_receiving_supported = self.constraints.feature_dict.get(
+            "receive_objects", False
+        )
         for index, arg in enumerate(arguments):
-            parm = parameters[index]
-            # Is parameter type a transfer::Receiving kind
-            is_receiving = self._receiving_parm(parm)
-            is_receiving_supported = self.constraints.feature_dict.get(
-                "receive_objects", False
-            )
-            if is_receiving and not self.constraints.feature_dict.get(
-                "receive_objects", False
-            ):
+            # Is parameter type a transfer::Receiving kind and/or mutable
+            is_receiving, is_mutable = param_flags[index]
+            if is_receiving and not is_receiving_supported:
                 raise ValueError(f"Receiving not supported in Sui current environment")
             # If type is a CallArg object (imm/shared/receive)
-            if isinstance(arg, tuple):
+            if type(arg) is tuple:
                 if is_receiving:
-                    if is_receiving_supported:
-                        arguments[index] = (
-                            arg[0],
-                            bcs.ObjectArg("Receiving", arg[1].value),
-                        )
-                        arg = arguments[index]
-                        # arg[1] = bcs.ObjectArg("Receiving", arg[1].value)
-                    else:
-                        pass
-                if hasattr(parm, "is_mutable") and parm.is_mutable:
+                    arguments[index] = (
+                        arg[0],
+                        bcs.ObjectArg("Receiving", arg[1].value),
+                    )
+                    arg = arguments[index]
+                if is_mutable:
                     r_arg: bcs.ObjectArg = arg[1]
                     r_arg.value.Mutable = True
         return arguments
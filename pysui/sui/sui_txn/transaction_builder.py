@@ -16,9 +16,10 @@
 
 import logging
 import binascii
+import struct
 from math import ceil
 from typing import Optional, Set, Union
-from functools import singledispatchmethod
+from functools import lru_cache, singledispatchmethod
 
 from deprecated.sphinx import versionchanged, versionadded
 from pysui.sui.sui_txresults.single_tx import TransactionConstraints
@@ -37,12 +38,28 @@ from pysui.sui.sui_types.scalars import (
     SuiU64,
     SuiU8,
 )
+from pysui.sui.sui_utils import hexstring_to_bytes
 
 # Well known aliases
 _SUI_PACKAGE_ID: bcs.Address = bcs.Address.from_str("0x2")
 _SUI_PACKAGE_MODULE: str = "package"
 _SUI_PACAKGE_AUTHORIZE_UPGRADE: str = "authorize_upgrade"
 _SUI_PACAKGE_COMMIt_UPGRADE: str = "commit_upgrade"
+# Little endian u64 packer, raises struct.error when out of range
+_U64_PACK = struct.Struct("<Q").pack
+
+
+@lru_cache(maxsize=1024)
+def _address_pure_bytes(address: str) -> bytes:
+    """BCS bytes of a hex address, recipients and validators repeat across commands."""
+    # A fixed length bcs.Address serializes as its raw bytes
+    return hexstring_to_bytes(address)
+
+
+def _modules_as_bytes(modules: list) -> list[bytes]:
+    """Normalize compiled modules, given as bytes or list of u8, to bytes."""
+    return [x if isinstance(x, bytes) else bytes(x) for x in modules]
+
 
 # Standard library logging setup
 logger = logging.getLogger("pysui.transaction_builder")
@@ -232,8 +249,7 @@ class PureInput:
     def _(cls, arg: SuiAddress) -> list:
         """Convert SuiAddress to list of bytes."""
         logger.debug(f"SuiAddress->pure {arg.address}")
-        addy = bcs.Address.from_sui_address(arg)
-        return list(addy.serialize())
+        return list(_address_pure_bytes(arg.address))
 
     @pure.register
     @classmethod
@@ -265,6 +281,12 @@ class PureInput:
         """Convert scalars and ObjectIDs to a Pure BuilderArg."""
         return bcs.BuilderArg("Pure", cls.pure(args))
 
+    @classmethod
+    @versionadded(version="0.57.0", reason="Direct u64 to Pure BuilderArg")
+    def as_u64_input(cls, value: int) -> bcs.BuilderArg:
+        """Convert an unsigned 64 bit int to a Pure BuilderArg without dispatch."""
+        return bcs.BuilderArg("Pure", list(_U64_PACK(value)))
+
 
 @versionchanged(version="0.31.0", reason="Added command type frequency")
 class ProgrammableTransactionBuilder:
@@ -276,6 +298,8 @@ class ProgrammableTransactionBuilder:
         self.commands: list[bcs.Command] = []
         self.objects_registry: dict[str, str] = {}
         self.compress_inputs: bool = compress_inputs
+        # Serialized TransactionKind, reset whenever inputs or commands change
+        self._kind_bytes: Optional[bytes] = None
 
         self.command_frequency = {
             "MoveCall": 0,
@@ -309,6 +333,19 @@ class ProgrammableTransactionBuilder:
         """
         return bcs.TransactionKind("ProgrammableTransaction", self._finish())
 
+    @versionadded(version="0.57.0", reason="Cache serialized TransactionKind")
+    def finish_for_inspect_bytes(self) -> bytes:
+        """finish_for_inspect_bytes returns the serialized TransactionKind structure.
+
+        The result is cached until the next input or command is added.
+
+        :return: The BCS serialized TransactionKind
+        :rtype: bytes
+        """
+        if self._kind_bytes is None:
+            self._kind_bytes = self.finish_for_inspect().serialize()
+        return self._kind_bytes
+
     @versionchanged(version="0.20.0", reason="Check for duplication. See bug #99")
     @versionchanged(version="0.30.2", reason="Remove reuse of identical pure inputs")
     def input_pure(self, key: bcs.BuilderArg) -> bcs.Argument:
@@ -333,6 +370,7 @@ class ProgrammableTransactionBuilder:
                         return bcs.Argument("Input", e_index)
                     e_index += 1
             self.inputs[key] = bcs.CallArg(key.enum_name, key.value)
+            self._kind_bytes = None
         else:
             raise ValueError(f"Expected Pure builder arg, found {key.enum_name}")
         logger.debug(f"New pure input created at index {out_index}")
@@ -356,6 +394,7 @@ class ProgrammableTransactionBuilder:
                         return bcs.Argument("Input", e_index)
                     e_index += 1
             self.inputs[key] = bcs.CallArg(key.enum_name, object_arg)
+            self._kind_bytes = None
         else:
             raise ValueError(
                 f"Expected Object builder arg and ObjectArg, found {key.enum_name} and {type(object_arg)}"
@@ -386,6 +425,7 @@ class ProgrammableTransactionBuilder:
         out_index = len(self.commands)
         logger.debug(f"Adding command {out_index}")
         self.commands.append(command_obj)
+        self._kind_bytes = None
         if nresults > 1:
             logger.debug(f"Creating nested result return for {nresults} elements")
             nreslist: list[bcs.Argument] = []
@@ -602,11 +642,15 @@ class ProgrammableTransactionBuilder:
         version="0.20.0",
         reason="Removed UpgradeCap auto transfer as per Sui best practices.",
     )
+    @versionchanged(version="0.57.0", reason="Modules may be bytes")
     def publish(
-        self, modules: list[list[bcs.U8]], dep_ids: list[bcs.Address]
+        self,
+        modules: list[Union[bytes, list[bcs.U8]]],
+        dep_ids: list[bcs.Address],
     ) -> bcs.Argument:
         """Setup a Publish command and return it's result Argument."""
         logger.debug("Creating Publish transaction")
+        modules = _modules_as_bytes(modules)
         # result = self.command(bcs.Command("Publish", bcs.Publish(modules, dep_ids)))
         return self.command(bcs.Command("Publish", bcs.Publish(modules, dep_ids)))
 
@@ -639,15 +683,17 @@ class ProgrammableTransactionBuilder:
             )
         )
 
+    @versionchanged(version="0.57.0", reason="Modules may be bytes")
     def publish_upgrade(
         self,
-        modules: list[list[bcs.U8]],
+        modules: list[Union[bytes, list[bcs.U8]]],
         dep_ids: list[bcs.Address],
         package_id: bcs.Address,
         upgrade_ticket: bcs.Argument,
     ) -> bcs.Argument:
         """Setup a Upgrade Command and return it's result Argument."""
         logger.debug("Creating PublishUpgrade transaction")
+        modules = _modules_as_bytes(modules)
         return self.command(
             bcs.Command(
                 "Upgrade",
@@ -14,7 +14,7 @@
 """SuiTransaction Serialize/Deserialize model."""
 
 from functools import partial, reduce
-from pysui import SuiConfig, SuiAddress, SyncClient, handle_result
+from pysui import SuiConfig, SuiAddress, SyncClient
 from pysui.sui.sui_crypto import MultiSig
 from pysui.sui.sui_txn.signing_ms import SignerBlock, SigningMultiSig
 from pysui.sui.sui_txn.transaction_builder import (
@@ -211,9 +211,10 @@ def deser_transaction_builder(
     client = SyncClient(config)
     # Resolve any objects in use
     obj_list = list(objs_in_use.keys())
-    data_objs_dict = {
-        dobj.object_id: dobj for dobj in handle_result(client.get_objects_for(obj_list))
-    }
+    result = client.get_objects_for(obj_list)
+    if not result.is_ok():
+        raise ValueError(f"Unable to fetch objects in use {result.result_string}")
+    data_objs_dict = {dobj.object_id: dobj for dobj in result.result_data}
     # Make inputs dictionary
     inputs = reduce(
         partial(_deser_inputs, data_objs_dict, objs_in_use), tx_builder.Inputs, {}
@@ -222,3 +223,4 @@ def deser_transaction_builder(
     builder.inputs = inputs
     builder.objects_registry = objs_in_use
     builder.commands = tx_builder.Commands.copy()
+    builder._kind_bytes = None
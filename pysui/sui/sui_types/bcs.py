@@ -584,10 +584,45 @@ class MergeCoins(canoser.Struct):
     _fields = [("ToCoin", Argument), ("FromCoins", [Argument])]
 
 
+@versionadded(version="0.57.0", reason="Single pass encoding of module vectors")
+class BytesVector(canoser.base.Base):
+    """BytesVector is a vector<vector<u8>> held as a list of bytes."""
+
+    @classmethod
+    def encode(cls, value: list[bytes]) -> bytes:
+        """Length prefix each entry and join the whole vector once."""
+        uleb = canoser.Uint32.serialize_uint32_as_uleb128
+        parts: list[bytes] = [uleb(len(value))]
+        for item in value:
+            parts.append(uleb(len(item)))
+            parts.append(item)
+        return b"".join(parts)
+
+    @classmethod
+    def decode(cls, cursor) -> list[bytes]:
+        """Read the vector back as a list of bytes."""
+        uleb = canoser.Uint32.parse_uint32_from_uleb128
+        return [cursor.read_bytes(uleb(cursor)) for _ in range(uleb(cursor))]
+
+    @classmethod
+    def check_value(cls, value):
+        """Require a list of bytes."""
+        if not isinstance(value, list) or not all(isinstance(x, bytes) for x in value):
+            raise TypeError(f"{value} is not a list of bytes")
+
+    @classmethod
+    def to_json_serializable(cls, value) -> list[str]:
+        """Hex string per entry."""
+        return [x.hex() for x in value]
+
+
+@versionchanged(
+    version="0.57.0", reason="Modules are bytes, encoded without per byte packing"
+)
 class Publish(canoser.Struct):
     """Publish represents a sui_publish structure."""
 
-    _fields = [("Modules", [[canoser.Uint8]]), ("Dependents", [Address])]
+    _fields = [("Modules", BytesVector), ("Dependents", [Address])]
 
 
 class MakeMoveVec(canoser.Struct):
@@ -596,11 +631,14 @@ class MakeMoveVec(canoser.Struct):
     _fields = [("TypeTag", OptionalTypeTag), ("Vector", [Argument])]
 
 
+@versionchanged(
+    version="0.57.0", reason="Modules are bytes, encoded without per byte packing"
+)
 class Upgrade(canoser.Struct):
     """Upgrade an existing move package onchain."""
 
     _fields = [
-        ("Modules", [[canoser.Uint8]]),
+        ("Modules", BytesVector),
         ("Dependents", [Address]),
         ("Package", Address),
         ("UpgradeTicket", Argument),
@@ -699,6 +737,26 @@ class TransactionData(canoser.RustEnum):
         """."""
         return cls.deserialize(in_data)
 
+    @versionadded(version="0.57.0", reason="Reuse already serialized TransactionKind")
+    def serialize_with_kind(self, kind_bytes: bytes) -> bytes:
+        """serialize_with_kind Serialize using previously serialized TransactionKind bytes.
+
+        :param kind_bytes: The serialized TransactionKind this TransactionData holds
+        :type kind_bytes: bytes
+        :return: Identical result to `serialize` without re-walking the TransactionKind
+        :rtype: bytes
+        """
+        tx_v1: TransactionDataV1 = self.value
+        return b"".join(
+            [
+                canoser.Uint32.serialize_uint32_as_uleb128(self.index),
+                kind_bytes,
+                Address.encode(tx_v1.Sender),
+                GasData.encode(tx_v1.GasData),
+                TransactionExpiration.encode(tx_v1.TransactionExpiration),
+            ]
+        )
+
 
 # Multi-signature legacy
 @versionadded(version="0.20.4", reason="Added to support in-code MultiSig signing.")
@@ -14,18 +14,19 @@
 """Utility functions."""
 
 import itertools
-import math
 import os
+import re
 import base64
 import binascii
 import subprocess
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, singledispatch
 from dataclasses import dataclass
 from pathlib import Path
 from types import NoneType
 from typing import Any, Iterable, Union
 from deprecated.sphinx import versionchanged, deprecated
-import base58
 import yaml
 from dataclasses_json import DataClassJsonMixin
 from deprecated.sphinx import versionchanged, versionadded
@@ -69,6 +70,11 @@ _UNPUBLISHED: str = "00000000000000000000000000000000000000000000000000000000000
 
 _SUI_BUILD: list[str] = ["move", "build"]
 
+_B64_RE = re.compile(rb"[A-Za-z0-9+/]*={0,2}")
+# Final data character of a canonical encoding, keyed by padding: unused bits must be zero
+_B64_PAD2_TAIL: bytes = b"AQgw"
+_B64_PAD1_TAIL: bytes = b"AEIMQUYcgkosw048"
+
 
 @dataclass
 @versionchanged(
@@ -128,8 +134,9 @@ def _modules_bytes(
     mod_list = list(module_path.glob("*.mv"))
     if not mod_list:
         raise SuiMiisingModuleByteCode(f"{module_path} is empty")
-    # Open and get the bytes representation of same
-    result_list: list[ModuleReader] = [_module_bytes(module) for module in mod_list]
+    # Open and get the bytes representation of same, overlapping the file reads
+    with ThreadPoolExecutor(max_workers=min(8, len(mod_list))) as executor:
+        result_list: list[ModuleReader] = list(executor.map(_module_bytes, mod_list))
     return result_list
 
 
@@ -143,10 +150,9 @@ def _build_dep_info(build_path: str) -> Union[CompiledPackage, Exception]:
         pname = build_info_dict["package_name"].lower()
         inner_dep = build_info_dict["address_alias_instantiation"]
         pindent = f"0x{inner_dep[pname]}"
-        dep_ids: list[ObjectID] = []
-        for key, value in inner_dep.items():
-            if key != pname:
-                dep_ids.append(f"0x{value}")
+        dep_ids: list[ObjectID] = [
+            f"0x{value}" for key, value in inner_dep.items() if key != pname
+        ]
         return CompiledPackage(
             pname,
             pindent,
@@ -170,7 +176,9 @@ def _package_digest(package: CompiledPackage, readers: list[ModuleReader]) -> No
         hasher = hashlib.blake2b(digest_size=32)
         hasher.update(mr_bytes)
         all_bytes.append(hasher.digest())
-        mod_strs.append(SuiString(base64.b64encode(mr_bytes).decode()))
+        mod_strs.append(
+            SuiString(binascii.b2a_base64(mr_bytes, newline=False).decode("ascii"))
+        )
     for dep_str in package.dependencies:
         all_bytes.append(binascii.unhexlify(dep_str[2:]))
 
@@ -200,13 +208,12 @@ def publish_build(
     if not build_path.exists():
         raise SuiMiisingBuildFolder(f"No build folder found in {path_to_package}")
     # Get the project folder
-    build_subdir = [
-        x for x in os.scandir(build_path) if x.is_dir() and x.name != "locks"
-    ]
-    if len(build_subdir) > 1:
+    with os.scandir(build_path) as entries:
+        build_subdir = [x for x in entries if x.is_dir() and x.name != "locks"]
+    if len(build_subdir) != 1:
         raise SuiMiisingBuildFolder(f"No build folder found in {path_to_package}")
     # Finally, get the module(s) bytecode folder
-    byte_modules = Path(build_subdir[0]).joinpath("bytecode_modules")
+    byte_modules = Path(build_subdir[0].path).joinpath("bytecode_modules")
     if not byte_modules.exists():
         raise SuiMiisingBuildFolder(
             f"No bytecode_modules folder found for {path_to_package}/build"
@@ -296,16 +303,42 @@ def hexstring_to_sui_id(indata: str, default_fill_length: int = 64) -> str:
     return indata
 
 
+@versionadded(version="0.57.0", reason="Decode without boxing each byte")
+def hexstring_to_bytes(indata: str) -> bytes:
+    """hexstring_to_bytes convert a hexstr (e.g. 0x...) into bytes.
+
+    :param indata: Data to convert to bytes, zero filled to full sui id length
+    :type indata: str
+    :raises ValueError: If indata contains non hex characters
+    :return: converted indata bytes
+    :rtype: bytes
+    """
+    return bytes.fromhex(hexstring_to_sui_id(indata)[2:])
+
+
 @versionchanged(version="0.19.0", reason="Account for > 3 and < 66 size hex string")
 def hexstring_to_list(indata: str, default_fill_length: int = 64) -> list[int]:
     """hexstring_to_list convert a hexstr (e.g. 0x...) into a list of ints.
 
     :param indata: Data to conver to list of ints
     :type indata: str
+    :raises ValueError: If indata contains non hex characters
     :return: converted indata to int list
     :rtype: list[int]
     """
-    return [int(x) for x in binascii.unhexlify(hexstring_to_sui_id(indata)[2:])]
+    return list(hexstring_to_bytes(indata))
+
+
+@versionadded(version="0.57.0", reason="Decode without boxing each byte")
+def b64str_to_bytes(indata: str) -> bytes:
+    """b64str_to_bytes convert a base64 string into bytes.
+
+    :param indata: Base64 encoded string
+    :type indata: str
+    :return: converted indata bytes
+    :rtype: bytes
+    """
+    return binascii.a2b_base64(indata)
 
 
 def b64str_to_list(indata: str) -> list[int]:
@@ -316,8 +349,43 @@ def b64str_to_list(indata: str) -> list[int]:
     :return: converted indata to int list
     :rtype: list[int]
     """
-    b64bytes = base64.b64decode(indata)
-    return [int(x) for x in b64bytes]
+    return list(b64str_to_bytes(indata))
+
+
+_B58_ALPHABET: str = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_B58_DECODE_MAP: dict[str, int] = {char: idx for idx, char in enumerate(_B58_ALPHABET)}
+
+
+def _b58decode(indata: str) -> bytes:
+    """Decode a base58 (bitcoin alphabet) string to bytes."""
+    indata = indata.rstrip()
+    # Leading '1' characters are leading zero bytes
+    body = indata.lstrip("1")
+    acc = 0
+    try:
+        for char in body:
+            acc = acc * 58 + _B58_DECODE_MAP[char]
+    except KeyError as exc:
+        raise ValueError(f"Invalid character {exc.args[0]!r}") from None
+    return bytes(len(indata) - len(body)) + acc.to_bytes(
+        (acc.bit_length() + 7) // 8, "big"
+    )
+
+
+@versionadded(version="0.57.0", reason="Decode without boxing each byte")
+def b58str_to_bytes(indata: str) -> bytes:
+    """b58str_to_bytes convert a base58 string into bytes.
+
+    :param indata: Base58 encoded string, base64 is accepted as fallback
+    :type indata: str
+    :return: converted indata bytes
+    :rtype: bytes
+    """
+    try:
+        return _b58decode(indata)
+    # Fall back if invalid base58 str
+    except ValueError:
+        return binascii.a2b_base64(indata)
 
 
 def b58str_to_list(indata: str) -> list[int]:
@@ -328,12 +396,7 @@ def b58str_to_list(indata: str) -> list[int]:
     :return: converted indata to int list
     :rtype: list[int]
     """
-    try:
-        decode_bytes = base58.b58decode(indata)
-    # Fall back if invalid base58 str
-    except ValueError:
-        decode_bytes = base64.b64decode(indata)
-    return [int(x) for x in decode_bytes]
+    return list(b58str_to_bytes(indata))
 
 
 def int_to_listu8(byte_count: int, in_el: int) -> list[int]:
@@ -347,15 +410,21 @@ def int_to_listu8(byte_count: int, in_el: int) -> list[int]:
     :return: the integer value converted to list of int (u8)
     :rtype: list[int]
     """
-    byte_res = math.ceil(in_el.bit_length() / 8)
+    byte_res = (in_el.bit_length() + 7) // 8
     if byte_res == byte_count:
-        return list(in_el.to_bytes(byte_res, "little"))
+        return list(in_el.to_bytes(byte_count, "little"))
     raise ValueError(f"Expected byte count {byte_count} found byte count {byte_res}")
 
 
 # Coercion utilities
 
+# Value only singletons shared by the coercers
+_SUI_NULL: SuiNullType = SuiNullType()
+_SUI_TRUE: SuiBoolean = SuiBoolean(True)
+_SUI_FALSE: SuiBoolean = SuiBoolean(False)
+
 
+@singledispatch
 def as_sui_address(in_data: Any) -> Union[SuiAddress, ValueError]:
     """as_sui_address coerces `in_data` to a SuiAddress.
 
@@ -366,27 +435,43 @@ def as_sui_address(in_data: Any) -> Union[SuiAddress, ValueError]:
     :return: A SuiAddress
     :rtype: Union[SuiAddress, ValueError]
     """
-    if isinstance(in_data, SuiAddress):
-        result = in_data
-    elif isinstance(in_data, (ObjectID, SuiString)):
-        if valid_sui_address(in_data.value):
-            result = SuiAddress(in_data.value)
-        else:
-            raise ValueError(
-                f"Type {in_data.__class__.__name__}: {in_data.value} is not a valid SuiAddress form."
-            )
-    elif isinstance(in_data, str):
-        if valid_sui_address(in_data):
-            result = SuiAddress(in_data)
-        else:
-            raise ValueError(f"str {in_data} is not a valid SuiAddress form.")
-    if not result:
-        raise ValueError(
-            f"Can not get SuiInteger from {in_data} with type {type(in_data)}"
-        )
-    return result
+    raise ValueError(f"Can not get SuiAddress from {in_data} with type {type(in_data)}")
+
+
+@as_sui_address.register(SuiAddress)
+def _(in_data: SuiAddress) -> SuiAddress:
+    return in_data
+
+
+@lru_cache(maxsize=2048)
+def _cached_sui_address(in_data: str) -> SuiAddress:
+    """Validate and construct a SuiAddress, memoized for repeated addresses."""
+    if valid_sui_address(in_data):
+        return SuiAddress(in_data)
+    raise ValueError(f"str {in_data} is not a valid SuiAddress form.")
+
+
+@lru_cache(maxsize=2048)
+def _cached_object_id(in_data: str) -> ObjectID:
+    """Construct an ObjectID, memoized for repeated ids."""
+    return ObjectID(in_data)
+
+
+@as_sui_address.register(SuiString)
+def _(in_data: SuiString) -> SuiAddress:
+    if valid_sui_address(in_data.value):
+        return _cached_sui_address(in_data.value)
+    raise ValueError(
+        f"Type {in_data.__class__.__name__}: {in_data.value} is not a valid SuiAddress form."
+    )
+
+
+@as_sui_address.register(str)
+def _(in_data: str) -> SuiAddress:
+    return _cached_sui_address(in_data)
 
 
+@singledispatch
 def as_object_id(in_data: Any) -> Union[ObjectID, ValueError]:
     """as_object_id coerces `in_data` to an ObjectID.
 
@@ -397,23 +482,43 @@ def as_object_id(in_data: Any) -> Union[ObjectID, ValueError]:
     :return: An ObjectID
     :rtype: Union[ObjectID, Union[ValueError, AttributeError]]
     """
-    result = SuiNullType()
-    # object_id: ObjectID = None
-    if isinstance(in_data, ObjectID):
-        result = in_data
-    elif isinstance(in_data, str):
-        result = ObjectID(in_data)
-    elif isinstance(in_data, (ObjectRead, ObjectReadData)):
-        result = in_data.identifier
-    elif isinstance(in_data, SuiString):
-        result = ObjectID(in_data.value)
-    elif issubclass(type(in_data), SuiAddress):
-        result = ObjectID(in_data.identifier.value)
-    elif issubclass(type(in_data), DataClassJsonMixin):
-        if hasattr(in_data, "identifier"):
-            result = in_data.identifier
-            if isinstance(result, str):
-                result = ObjectID(result)
+    # Unhandled types, such as None for an optional property, become null
+    return _SUI_NULL
+
+
+@as_object_id.register(ObjectID)
+def _(in_data: ObjectID) -> ObjectID:
+    return in_data
+
+
+@as_object_id.register(str)
+def _(in_data: str) -> ObjectID:
+    return _cached_object_id(in_data)
+
+
+@as_object_id.register(ObjectRead)
+@as_object_id.register(ObjectReadData)
+def _(in_data: Union[ObjectRead, ObjectReadData]) -> ObjectID:
+    return in_data.identifier
+
+
+@as_object_id.register(SuiString)
+def _(in_data: SuiString) -> ObjectID:
+    return ObjectID(in_data.value)
+
+
+@as_object_id.register(SuiAddress)
+def _(in_data: SuiAddress) -> ObjectID:
+    return ObjectID(in_data.identifier.value)
+
+
+@as_object_id.register(DataClassJsonMixin)
+def _(in_data: DataClassJsonMixin) -> Union[ObjectID, SuiNullType]:
+    if not hasattr(in_data, "identifier"):
+        return _SUI_NULL
+    result = in_data.identifier
+    if isinstance(result, str):
+        return ObjectID(result)
     if not result:
         raise ValueError(
             f"Can not get ObjectID from {in_data} with type {type(in_data)}"
@@ -421,6 +526,7 @@ def as_object_id(in_data: Any) -> Union[ObjectID, ValueError]:
     return result
 
 
+@singledispatch
 def as_sui_string(in_data: Any) -> Union[SuiString, ValueError]:
     """as_sui_string coerces `in_data` to a SuiString.
 
@@ -430,23 +536,31 @@ def as_sui_string(in_data: Any) -> Union[SuiString, ValueError]:
     :return: A SuiString
     :rtype: Union[SuiString, ValueError]
     """
-    if isinstance(in_data, SuiString):
-        result = in_data
-    elif isinstance(in_data, str):
-        result = SuiString(in_data)
-    elif isinstance(in_data, int):
-        result = SuiString(str(in_data))
-    elif issubclass(type(in_data), SuiAddress):
-        result = SuiString(in_data.identifier.value)
-    elif isinstance(in_data, SuiNullType):
-        result = in_data
-    if not result:
-        raise ValueError(
-            f"Can not get SuiString from {in_data} with type {type(in_data)}"
-        )
-    return result
+    raise ValueError(f"Can not get SuiString from {in_data} with type {type(in_data)}")
+
+
+@as_sui_string.register(SuiString)
+@as_sui_string.register(SuiNullType)
+def _(in_data: Union[SuiString, SuiNullType]) -> Union[SuiString, SuiNullType]:
+    return in_data
+
+
+@as_sui_string.register(str)
+def _(in_data: str) -> SuiString:
+    return SuiString(in_data)
+
+
+@as_sui_string.register(int)
+def _(in_data: int) -> SuiString:
+    return SuiString(str(in_data))
+
 
+@as_sui_string.register(SuiAddress)
+def _(in_data: SuiAddress) -> SuiString:
+    return SuiString(in_data.identifier.value)
 
+
+@singledispatch
 def as_sui_integer(in_data: Any) -> Union[SuiInteger, ValueError]:
     """as_sui_integer coerces `in_data` to a SuiInteger.
 
@@ -456,21 +570,27 @@ def as_sui_integer(in_data: Any) -> Union[SuiInteger, ValueError]:
     :return: A SuiInteger
     :rtype: Union[SuiInteger, ValueError]
     """
-    result = SuiNullType()
-    if isinstance(in_data, SuiInteger):
-        result = in_data
-    elif isinstance(in_data, int):
-        result = SuiInteger(in_data)
-    elif isinstance(in_data, str):
-        int_only = in_data.split(".")[0]
-        result = SuiInteger(int(int_only))
-    if not result:
-        raise ValueError(
-            f"Can not get SuiInteger from {in_data} with type {type(in_data)}"
-        )
-    return result
+    # Unhandled types, such as None for an optional property, become null
+    return _SUI_NULL
+
+
+@as_sui_integer.register(SuiInteger)
+def _(in_data: SuiInteger) -> SuiInteger:
+    return in_data
 
 
+@as_sui_integer.register(int)
+def _(in_data: int) -> SuiInteger:
+    return SuiInteger(in_data)
+
+
+@as_sui_integer.register(str)
+def _(in_data: str) -> SuiInteger:
+    int_only = in_data.split(".")[0]
+    return SuiInteger(int(int_only))
+
+
+@singledispatch
 def as_sui_array(in_data: Any) -> Union[SuiArray, ValueError]:
     """as_sui_array coerces `in_data` to a SuiArray.
 
@@ -480,19 +600,26 @@ def as_sui_array(in_data: Any) -> Union[SuiArray, ValueError]:
     :return: A SuiArray
     :rtype: Union[SuiArray, ValueError]
     """
-    if isinstance(in_data, SuiArray):
-        result = in_data
-    elif isinstance(in_data, list):
-        result = SuiArray(in_data)
-    elif isinstance(in_data, tuple):
-        result = SuiArray(list(in_data))
-    if not result:
-        raise ValueError(
-            f"Can not get SuiArray from {in_data} with type {type(in_data)}"
-        )
-    return result
+    raise ValueError(f"Can not get SuiArray from {in_data} with type {type(in_data)}")
 
 
+@as_sui_array.register(SuiArray)
+def _(in_data: SuiArray) -> SuiArray:
+    return in_data
+
+
+@as_sui_array.register(list)
+def _(in_data: list) -> SuiArray:
+    return SuiArray(in_data)
+
+
+@as_sui_array.register(tuple)
+def _(in_data: tuple) -> SuiArray:
+    # SuiArray appends and extends in place so a tuple still needs one list copy
+    return SuiArray([*in_data])
+
+
+@singledispatch
 def as_sui_map(in_data: Any) -> Union[SuiMap, ValueError]:
     """as_sui_map coerces `in_data` to a SuiMap.
 
@@ -502,20 +629,29 @@ def as_sui_map(in_data: Any) -> Union[SuiMap, ValueError]:
     :return: A SuiMap
     :rtype: Union[SuiMap, ValueError]
     """
-    result = None
-    if isinstance(in_data, SuiMap):
-        result = in_data
-    elif isinstance(in_data, dict):
-        result = SuiMap("", "")
-        result.map = in_data
-    elif isinstance(in_data, SuiNullType):
-        result = SuiMap("", "")
-        result.map = {}
-    if not result:
-        raise ValueError(f"Can not get SuiMap from {in_data} with type {type(in_data)}")
+    raise ValueError(f"Can not get SuiMap from {in_data} with type {type(in_data)}")
+
+
+@as_sui_map.register(SuiMap)
+def _(in_data: SuiMap) -> SuiMap:
+    return in_data
+
+
+@as_sui_map.register(dict)
+def _(in_data: dict) -> SuiMap:
+    result = SuiMap("", "")
+    result.map = in_data
     return result
 
 
+@as_sui_map.register(SuiNullType)
+def _(in_data: SuiNullType) -> SuiMap:
+    result = SuiMap("", "")
+    result.map = {}
+    return result
+
+
+@singledispatch
 def as_sui_boolean(in_data: Any) -> Union[SuiBoolean, ValueError]:
     """as_sui_boolean coerces `in_data` to a SuiBoolean.
 
@@ -525,19 +661,13 @@ def as_sui_boolean(in_data: Any) -> Union[SuiBoolean, ValueError]:
     :return: A SuiBoolean
     :rtype: Union[SuiBoolean, ValueError]
     """
-    if isinstance(in_data, SuiBoolean):
-        result = in_data
-    elif isinstance(in_data, bool):
-        result = SuiBoolean(in_data)
-    elif isinstance(in_data, int):
-        result = SuiBoolean(False) if in_data == 0 else SuiBoolean(True)
-    else:
-        result = SuiBoolean(True) if in_data else SuiBoolean(False)
-    if not result:
-        raise ValueError(
-            f"Can not get SuiBoolean from {in_data} with type {type(in_data)}"
-        )
-    return result
+    # bool, int (0 is False) and everything else reduce to truthiness
+    return _SUI_TRUE if in_data else _SUI_FALSE
+
+
+@as_sui_boolean.register(SuiBoolean)
+def _(in_data: SuiBoolean) -> SuiBoolean:
+    return in_data
 
 
 def is_base_64(str_or_bytes: Union[str, bytes, bytearray]) -> bool:
@@ -549,17 +679,21 @@ def is_base_64(str_or_bytes: Union[str, bytes, bytearray]) -> bool:
     :return: True if is valid base64
     :rtype: bool
     """
-    try:
-        if isinstance(str_or_bytes, str):
-            # If there's any unicode here, an exception will be thrown and the function will return false
-            sb_bytes = bytes(str_or_bytes, "ascii")
-        elif isinstance(str_or_bytes, (bytes, bytearray)):
-            sb_bytes = str_or_bytes
-        else:
-            raise ValueError("Argument must be string, bytes or bytearray")
-        return base64.b64encode(base64.b64decode(sb_bytes)) == sb_bytes
-    except binascii.Error:
+    if isinstance(str_or_bytes, str):
+        # If there's any unicode here, an exception will be thrown
+        sb_bytes = bytes(str_or_bytes, "ascii")
+    elif isinstance(str_or_bytes, (bytes, bytearray)):
+        sb_bytes = str_or_bytes
+    else:
+        raise ValueError("Argument must be string, bytes or bytearray")
+    # Single pass alphabet/padding check, then the canonical (zero) trailing bits
+    if len(sb_bytes) % 4 or not _B64_RE.fullmatch(sb_bytes):
         return False
+    if sb_bytes.endswith(b"=="):
+        return sb_bytes[-3] in _B64_PAD2_TAIL
+    if sb_bytes.endswith(b"="):
+        return sb_bytes[-2] in _B64_PAD1_TAIL
+    return True
 
 
 def to_base_64(in_data: Any, clz: Any) -> Union[Any, ValueError]:
@@ -574,17 +708,19 @@ def to_base_64(in_data: Any, clz: Any) -> Union[Any, ValueError]:
     :rtype: Union[Any, ValueError]
     """
     if isinstance(in_data, clz):
-        result = in_data
-    elif is_base_64(in_data):
-        result = clz(in_data)
-    elif isinstance(in_data, (str, bytes, bytearray)):
-        in_data = in_data if not isinstance(in_data, str) else bytes(in_data, "utf-16")
-        result = clz(base64.b64encode(in_data))
-    if not result:
-        raise ValueError(
-            f"Can not get {clz.__class__.__name__} from {in_data} with type {type(clz)}"
-        )
-    return result
+        return in_data
+    # One validation pass, and at most one encode when not already base64
+    if isinstance(in_data, str):
+        if in_data.isascii() and is_base_64(in_data):
+            return clz(in_data)
+        return clz(base64.b64encode(bytes(in_data, "utf-16")))
+    if isinstance(in_data, (bytes, bytearray)):
+        if is_base_64(in_data):
+            return clz(in_data)
+        return clz(base64.b64encode(in_data))
+    raise ValueError(
+        f"Can not get {clz.__name__} from {in_data} with type {type(in_data)}"
+    )
 
 
 def as_sui_txbytes(in_data: Any) -> Union[SuiTxBytes, ValueError]:
@@ -611,6 +747,7 @@ def as_sui_signature(in_data: Any) -> Union[SuiSignature, ValueError]:
     return to_base_64(in_data, SuiSignature)
 
 
+@singledispatch
 def as_sui_txdigest(in_data: Any) -> Union[SuiTransactionDigest, ValueError]:
     """as_sui_txdigest coerces `in_data` to a SuiTransactionDigest.
 
@@ -620,17 +757,24 @@ def as_sui_txdigest(in_data: Any) -> Union[SuiTransactionDigest, ValueError]:
     :return: A SuiTransactionDigest
     :rtype: Union[SuiTransactionDigest, ValueError]
     """
-    if isinstance(in_data, SuiTransactionDigest):
-        result = in_data
-    elif isinstance(in_data, SuiString):
-        result = SuiTransactionDigest(in_data.value)
-    elif isinstance(in_data, str):
-        result = SuiTransactionDigest(in_data)
-    if not result:
-        raise ValueError(
-            f"Can not get SuiTransactionDigest from {in_data} with type {type(in_data)}"
-        )
-    return result
+    raise ValueError(
+        f"Can not get SuiTransactionDigest from {in_data} with type {type(in_data)}"
+    )
+
+
+@as_sui_txdigest.register(SuiTransactionDigest)
+def _(in_data: SuiTransactionDigest) -> SuiTransactionDigest:
+    return in_data
+
+
+@as_sui_txdigest.register(SuiString)
+def _(in_data: SuiString) -> SuiTransactionDigest:
+    return SuiTransactionDigest(in_data.value)
+
+
+@as_sui_txdigest.register(str)
+def _(in_data: str) -> SuiTransactionDigest:
+    return SuiTransactionDigest(in_data)
 
 
 #: Keys are the end product pysui type and the value (set) are the types it can convert from.
@@ -693,7 +837,7 @@ COERCION_FN_MAP = {
     SuiSignature: as_sui_signature,
     SuiTxBytes: as_sui_txbytes,
     SuiTransactionDigest: as_sui_txdigest,
-    NoneType: lambda x: SuiNullType(),
+    NoneType: lambda x: _SUI_NULL,
     Any: lambda x: x,
 }
 
@@ -92,21 +92,16 @@ class BinaryReader:
 
     def read_uleb128(self) -> int:
         """read_uleb128 reads a uleb128 value from stream."""
-
-        def _decode(barray: bytearray) -> int:
-            """Decode the unsigned uleb128 expanded bytearray."""
-            res = 0
-            for i, value in enumerate(barray):
-                res = res + ((value & 0x7F) << (i * 7))
-            return res
-
-        array = bytearray()
+        # Accumulate as bytes are read rather than buffering and decoding after
+        read = self.reader.read
+        res = 0
+        shift = 0
         while True:
-            inb = ord(self.read())
-            array.append(inb)
+            inb = ord(read(1))
+            res |= (inb & 0x7F) << shift
             if (inb & 0x80) == 0:
-                break
-        return _decode(array)
+                return res
+            shift += 7
 
     def read_from_uleb_array(self) -> bytes:
         """read_from_uleb_array reads vector with uleb128 count.
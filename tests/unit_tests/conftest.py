@@ -0,0 +1,112 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Fixtures for unit testing without a Sui node."""
+
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Callable
+
+import httpx
+import pytest
+from gql import Client
+from gql.dsl import DSLSchema
+from gql.transport.httpx import HTTPXAsyncTransport
+
+from pysui import SuiAddress, SuiRpcResult
+from pysui.sui.sui_pgql.pgql_clients import AsyncSuiGQLClient
+from pysui.sui.sui_txresults.single_tx import (
+    AddressOwner,
+    SharedOwner,
+    TransactionConstraints,
+)
+from pysui.sui.sui_types import bcs
+
+SHARED_IDS: set[str] = {
+    bcs.Address.from_str(x).to_address_str() for x in ("0x6", "0x403")
+}
+
+
+class _Owned(AddressOwner):
+    """Address owner without a json payload."""
+
+    def __init__(self) -> None:
+        pass
+
+
+class _Shared(SharedOwner):
+    """Shared owner without a json payload."""
+
+    def __init__(self) -> None:
+        self.initial_shared_version = 7
+
+
+def object_read(object_id: str) -> SimpleNamespace:
+    """Minimal ObjectRead stand in, ids in SHARED_IDS are shared objects."""
+    return SimpleNamespace(
+        object_id=object_id,
+        version=3,
+        digest="ByumsdYUAQWJfwYgowsme7hm5vE8d2mXik3rGaNC9R4W",
+        owner=_Shared() if object_id in SHARED_IDS else _Owned(),
+    )
+
+
+class FakeAsyncClient:
+    """Asynchronous client answering object fetches locally."""
+
+    def __init__(self) -> None:
+        self.config = SimpleNamespace(
+            active_address=SuiAddress("0x" + "1" * 64), rpc_url="http://unit.test"
+        )
+        self.protocol = SimpleNamespace(
+            transaction_constraints=TransactionConstraints()
+        )
+        self.current_gas_price = 1000
+        self.fetches: list[list[str]] = []
+
+    async def get_objects_for(self, object_ids: list) -> SuiRpcResult:
+        """Return an object read for each requested id."""
+        ids = [bcs.Address.from_str(x.value).to_address_str() for x in object_ids]
+        self.fetches.append(ids)
+        return SuiRpcResult(True, None, [object_read(x) for x in ids])
+
+
+@pytest.fixture
+def async_client() -> FakeAsyncClient:
+    """Fresh fake asynchronous client."""
+    return FakeAsyncClient()
+
+
+def mock_gql_client(
+    handler: Callable[[httpx.Request], httpx.Response], schema: str
+) -> AsyncSuiGQLClient:
+    """GraphQL client over a mocked transport, skipping the network bound initializer."""
+    client = AsyncSuiGQLClient.__new__(AsyncSuiGQLClient)
+    client._inner_client = Client(
+        transport=HTTPXAsyncTransport(
+            url="http://unit.test", transport=httpx.MockTransport(handler)
+        ),
+        schema=schema,
+    )
+    client._schema = DSLSchema(client._inner_client.schema)
+    client._document_cache = OrderedDict()
+    client._async_session = None
+    client._session_lock = None
+    client._session_loop = None
+    return client
+
+
+@pytest.fixture
+def gql_client() -> Callable[..., AsyncSuiGQLClient]:
+    """Factory of GraphQL clients over a mocked transport."""
+    return mock_gql_client
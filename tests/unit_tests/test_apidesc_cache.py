@@ -0,0 +1,67 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""RPC API descriptor cache."""
+
+import hashlib
+import json
+
+import pytest
+
+from pysui.sui import sui_apidesc
+from pysui.sui.sui_apidesc import build_api_descriptors
+
+
+def _discover(version: str) -> tuple[dict, bytes]:
+    """Minimal rpc.discover response and its body."""
+    indata = {
+        "result": {
+            "info": {"version": version},
+            "methods": [],
+            "components": {"schemas": {}},
+        }
+    }
+    return indata, json.dumps(indata).encode()
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    sui_apidesc._APIDESC_CACHE.clear()
+    yield
+    sui_apidesc._APIDESC_CACHE.clear()
+
+
+def test_same_body_is_cached():
+    indata, raw = _discover("1.0.0")
+    first = build_api_descriptors(indata, raw=raw)
+    assert build_api_descriptors(indata, raw=raw) is first
+    assert first[0] == "1.0.0"
+
+
+def test_no_body_is_not_cached():
+    indata, _ = _discover("1.0.0")
+    assert build_api_descriptors(indata) is not build_api_descriptors(indata)
+    assert not sui_apidesc._APIDESC_CACHE
+
+
+def test_cache_is_bounded():
+    first, first_raw = _discover("0.0.0")
+    build_api_descriptors(first, raw=first_raw)
+    for minor in range(1, sui_apidesc._APIDESC_CACHE_SIZE + 1):
+        indata, raw = _discover(f"0.{minor}.0")
+        build_api_descriptors(indata, raw=raw)
+    assert len(sui_apidesc._APIDESC_CACHE) == sui_apidesc._APIDESC_CACHE_SIZE
+    assert hashlib.blake2b(first_raw, digest_size=16).digest() not in (
+        sui_apidesc._APIDESC_CACHE
+    )
+    assert len(sui_apidesc._APIDESC_CACHE) == sui_apidesc._APIDESC_CACHE_SIZE
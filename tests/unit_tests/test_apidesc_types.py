@@ -0,0 +1,39 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""SuiJson descriptor types."""
+
+from pysui.sui import sui_apidesc
+from pysui.sui.sui_apidesc import SuiJsonEnum, SuiJsonInteger, SuiJsonType
+
+# Module attributes, slots=True replaces each decorated class
+_JSON_TYPES = [
+    value
+    for value in vars(sui_apidesc).values()
+    if isinstance(value, type)
+    and issubclass(value, SuiJsonType)
+    and value is not SuiJsonType
+]
+
+
+def test_json_types_slotted_with_json_support():
+    for cls in _JSON_TYPES:
+        assert hasattr(cls, "to_dict") and hasattr(cls, "from_dict"), cls.__name__
+    assert not hasattr(SuiJsonInteger("integer", ["epoch"], "uint64", 0.0), "__dict__")
+
+
+def test_json_types_round_trip():
+    integer = SuiJsonInteger("integer", ["epoch"], "uint64", 0.0)
+    assert SuiJsonInteger.from_dict(integer.to_dict()) == integer
+    enum = SuiJsonEnum("string", ["status"], ["success", "failure"])
+    assert SuiJsonEnum.from_json(enum.to_json()) == enum
@@ -0,0 +1,68 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""AsyncSuiGQLClient shared session lifetime."""
+
+import asyncio
+
+import httpx
+from gql import gql
+
+from pysui.sui.sui_pgql.pgql_clients import AsyncSuiGQLClient
+
+
+def _client(gql_client) -> AsyncSuiGQLClient:
+    return gql_client(
+        lambda _: httpx.Response(200, json={"data": {"a": 1}}), "type Query { a: Int }"
+    )
+
+
+async def _query(client: AsyncSuiGQLClient) -> tuple[dict, httpx.AsyncClient]:
+    session = await client._session()
+    return await session.execute(gql("{ a }")), client.client.transport.client
+
+
+def test_session_shared_within_loop(gql_client):
+    client = _client(gql_client)
+
+    async def run():
+        results = await asyncio.gather(_query(client), _query(client))
+        await client.close()
+        return results
+
+    (first, first_http), (second, second_http) = asyncio.run(run())
+    assert first == second == {"a": 1}
+    assert first_http is second_http
+    assert client.client.transport.client is None
+
+
+def test_session_follows_event_loop(gql_client):
+    client = _client(gql_client)
+    first, first_http = asyncio.run(_query(client))
+    second, second_http = asyncio.run(_query(client))
+    assert first == second == {"a": 1}
+    assert first_http is not second_http
+
+
+def test_context_manager_closes(gql_client):
+    client = _client(gql_client)
+
+    async def run():
+        async with client as entered:
+            assert entered is client
+            await _query(client)
+        assert client.client.transport.client is None
+        # Usable again after close
+        return await _query(client)
+
+    assert asyncio.run(run())[0] == {"a": 1}
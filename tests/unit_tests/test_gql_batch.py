@@ -0,0 +1,129 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""QueryNode batching, merge then split."""
+
+import asyncio
+import json
+
+import httpx
+from gql import gql
+from graphql import build_schema, graphql_sync, print_ast
+
+from pysui.sui.sui_pgql.pgql_clients import PGQL_QueryNode
+
+_SCHEMA = """
+type Coin { id: String, value: Int }
+type Query { coin(id: String): Coin, epoch: Int }
+type Mutation { bump: Int }
+"""
+_ROOT = {
+    "coin": lambda _info, id: {"id": id, "value": int(id)},
+    "epoch": 7,
+}
+
+
+class _Coin(PGQL_QueryNode):
+    """Coin query using a fragment."""
+
+    def __init__(self, coin_id: str):
+        self.coin_id = coin_id
+
+    def as_document_node(self, schema):
+        return gql(
+            f'query {{ coin(id: "{self.coin_id}") {{ ...Fields }} }}'
+            " fragment Fields on Coin { id value }"
+        )
+
+    @staticmethod
+    def encode_fn():
+        return lambda data: data["coin"]["value"]
+
+
+class _Epoch(PGQL_QueryNode):
+    """Parameterless query without an encoder."""
+
+    def as_document_node(self, schema):
+        return gql("query { epoch }")
+
+
+class _Broken(PGQL_QueryNode):
+    """QueryNode that does not produce a DocumentNode."""
+
+    def as_document_node(self, schema):
+        return "query { epoch }"
+
+
+class _Bump(PGQL_QueryNode):
+    """Mutation, which can not be batched."""
+
+    def as_document_node(self, schema):
+        return gql("mutation { bump }")
+
+
+def _answer(request: httpx.Request) -> httpx.Response:
+    """Execute the merged query against the local schema."""
+    result = graphql_sync(
+        build_schema(_SCHEMA), json.loads(request.content)["query"], _ROOT
+    )
+    assert not result.errors
+    return httpx.Response(200, json={"data": result.data})
+
+
+def _fail(_request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"data": None, "errors": [{"message": "boom"}]})
+
+
+def _run(client, nodes):
+    return asyncio.run(client.execute_query_nodes(with_nodes=nodes))
+
+
+def test_merge_aliases_and_shares_fragments(gql_client):
+    client = gql_client(_answer, _SCHEMA)
+    merged, slots = client._qnodes_merge([_Coin("1"), _Epoch(), _Coin("2")])
+    text = print_ast(merged)
+    assert text.count("fragment Fields on Coin") == 1
+    assert slots == [
+        [("q0_coin", "coin")],
+        [("q1_epoch", "epoch")],
+        [("q2_coin", "coin")],
+    ]
+
+
+def test_split_in_node_order(gql_client):
+    client = gql_client(_answer, _SCHEMA)
+    results = _run(client, [_Coin("5"), _Epoch(), _Coin("3")])
+    assert all(x.is_ok() for x in results)
+    assert [x.result_data for x in results] == [5, {"epoch": 7}, 3]
+
+
+def test_broken_node_fails_alone(gql_client):
+    client = gql_client(_answer, _SCHEMA)
+    results = _run(client, [_Epoch(), _Broken(), _Coin("4")])
+    assert [x.is_ok() for x in results] == [True, False, True]
+    assert results[1].result_string == "ValueError"
+    assert results[2].result_data == 4
+
+
+def test_query_error_fails_every_node(gql_client):
+    client = gql_client(_fail, _SCHEMA)
+    results = _run(client, [_Coin("1"), _Epoch()])
+    assert all(x.result_string == "TransportQueryError" for x in results)
+    assert results[0] is not results[1]
+
+
+def test_mutation_fails_every_node(gql_client):
+    client = gql_client(_answer, _SCHEMA)
+    results = _run(client, [_Epoch(), _Bump()])
+    assert all(x.result_string == "ValueError" for x in results)
+    assert results[0] is not results[1]
@@ -0,0 +1,81 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""QueryNode DocumentNode reuse."""
+
+import dataclasses
+
+import httpx
+from gql import gql
+
+from pysui.sui.sui_pgql.pgql_clients import PGQL_QueryNode, _has_value_repr
+from pysui.sui.sui_pgql.pgql_query import ExecuteTransaction, GetCoinMetaData
+
+_SCHEMA = "type Query { epoch(id: String): Int }"
+
+
+class _Epoch(PGQL_QueryNode):
+    """Repeatable query, opted in to reuse."""
+
+    _CACHE_DOCUMENT: bool = True
+
+    def __init__(self, epoch_id: str):
+        self.epoch_id = epoch_id
+
+    def as_document_node(self, schema):
+        return gql(f'query {{ epoch(id: "{self.epoch_id}") }}')
+
+
+class _OneShot(_Epoch):
+    """Query not opted in."""
+
+    _CACHE_DOCUMENT: bool = False
+
+
+@dataclasses.dataclass
+class _Holder:
+    inner: object
+
+
+def _client(gql_client):
+    return gql_client(lambda _: httpx.Response(200, json={"data": {}}), _SCHEMA)
+
+
+def test_opted_in_node_reused(gql_client):
+    client = _client(gql_client)
+    first = client._qnode_pre_run(_Epoch("1"))
+    assert client._qnode_pre_run(_Epoch("1")) is first
+    assert client._qnode_pre_run(_Epoch("2")) is not first
+
+
+def test_not_opted_in_node_not_cached(gql_client):
+    client = _client(gql_client)
+    client._qnode_pre_run(_OneShot("1"))
+    assert not client._document_cache
+
+
+def test_large_state_not_cached(gql_client):
+    client = _client(gql_client)
+    client._qnode_pre_run(_Epoch("x" * client._DOCUMENT_KEY_MAX))
+    assert not client._document_cache
+
+
+def test_transaction_nodes_not_opted_in():
+    assert GetCoinMetaData._CACHE_DOCUMENT
+    assert not ExecuteTransaction._CACHE_DOCUMENT
+
+
+def test_dataclass_fields_checked():
+    assert _has_value_repr(_Holder(inner=[1, "a"]))
+    assert not _has_value_repr(_Holder(inner=object()))
+    assert not _has_value_repr(_Holder(inner=_Holder(inner=object())))
@@ -0,0 +1,58 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Move binary reader uleb128 decoding."""
+
+import random
+
+import canoser
+import pytest
+
+from pysui.sui_move.bin_reader.reader import BinaryReader
+
+_RNG = random.Random(128)
+_VALUES: list[int] = [0, 1, 127, 128, 255, 16383, 16384, 2**32 - 1, 2**64 - 1] + [
+    _RNG.getrandbits(_RNG.randrange(1, 65)) for _ in range(64)
+]
+
+
+def _uleb128(value: int) -> bytes:
+    """Reference unsigned leb128 encoder."""
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2**21, 2**32 - 1])
+def test_reference_encoder_matches_canoser(value):
+    assert _uleb128(value) == canoser.Uint32.serialize_uint32_as_uleb128(value)
+
+
+def test_read_uleb128_sequence():
+    reader = BinaryReader("unit", b"".join(_uleb128(x) for x in _VALUES) + b"\xaa")
+    assert [reader.read_uleb128() for _ in _VALUES] == _VALUES
+    # Stops on the terminating byte of the last value
+    assert reader.read() == b"\xaa"
+
+
+def test_read_from_uleb_array():
+    payload = bytes(range(200))
+    reader = BinaryReader("unit", _uleb128(len(payload)) + payload + _uleb128(0))
+    assert reader.read_from_uleb_array() == payload
+    assert reader.read_from_uleb_array() is None
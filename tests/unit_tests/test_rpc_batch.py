@@ -0,0 +1,133 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""JSON RPC batch execution."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from pysui.sui.sui_apidesc import build_api_descriptors
+from pysui.sui.sui_builders.get_builders import GetReferenceGasPrice
+from pysui.sui.sui_clients.async_client import SuiClient as AsyncClient
+from pysui.sui.sui_clients.sync_client import SuiClient
+
+_DISCOVER = {
+    "result": {
+        "info": {"version": "1.23.0"},
+        "methods": [
+            {
+                "name": "suix_getReferenceGasPrice",
+                "params": [],
+                "result": {
+                    "name": "u64",
+                    "schema": {"type": "integer", "format": "uint64", "minimum": 0.0},
+                },
+            }
+        ],
+        "components": {"schemas": {}},
+    }
+}
+
+
+def _answer(request: httpx.Request) -> httpx.Response:
+    """Answer in reverse order, failing the middle request."""
+    batch = json.loads(request.content)
+    answers = []
+    for jblock in reversed(batch):
+        if jblock["id"] == 1:
+            answers.append({"jsonrpc": "2.0", "id": 1, "error": {"code": -32000}})
+        else:
+            answers.append(
+                {"jsonrpc": "2.0", "id": jblock["id"], "result": str(jblock["id"])}
+            )
+    return httpx.Response(200, json=answers)
+
+
+def _unreachable(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("unreachable", request=request)
+
+
+def _client(client_cls, http_cls, handler):
+    """Client over a mocked transport, skipping the network bound initializer."""
+    client = client_cls.__new__(client_cls)
+    client._config = SimpleNamespace(rpc_url="http://unit.test")
+    client._rpc_api = build_api_descriptors(_DISCOVER)[1]
+    client._client = http_cls(transport=httpx.MockTransport(handler))
+    return client
+
+
+def _run_sync(handler, builders):
+    return _client(SuiClient, httpx.Client, handler).execute_batch(builders)
+
+
+def _run_async(handler, builders):
+    client = _client(AsyncClient, httpx.AsyncClient, handler)
+    return asyncio.run(client.execute_batch(builders))
+
+
+_RUNNERS = pytest.mark.parametrize("run", [_run_sync, _run_async])
+
+
+@_RUNNERS
+def test_results_in_builder_order(run):
+    results = run(_answer, [GetReferenceGasPrice() for _ in range(3)])
+    assert [x.is_ok() for x in results] == [True, False, True]
+    assert [results[0].result_data, results[2].result_data] == ["0", "2"]
+    assert results[1].result_string == {"code": -32000}
+
+
+@_RUNNERS
+def test_transport_error_result_per_builder(run):
+    results = run(_unreachable, [GetReferenceGasPrice() for _ in range(3)])
+    assert len(results) == 3
+    assert len({id(x) for x in results}) == 3
+    assert all(x.is_err() for x in results)
+    assert results[0].result_string == "HTTPX error: ConnectError"
+
+
+@_RUNNERS
+def test_empty_batch(run):
+    assert run(_unreachable, []) == []
+
+
+@_RUNNERS
+@pytest.mark.parametrize("body", [None, "bad gateway", 7, {"jsonrpc": "2.0"}])
+def test_malformed_response_fails_each_builder(run, body):
+    results = run(
+        lambda _: httpx.Response(200, content=json.dumps(body).encode()),
+        [GetReferenceGasPrice()] * 2,
+    )
+    assert [x.result_string for x in results] == ["Malformed batch response"] * 2
+    assert results[0] is not results[1]
+
+
+@_RUNNERS
+def test_unhandled_result_fails_its_builder(run):
+    def _answer_partial(request: httpx.Request) -> httpx.Response:
+        # The second entry has neither result nor error
+        return httpx.Response(
+            200,
+            json=[
+                {"jsonrpc": "2.0", "id": 0, "result": "0"},
+                {"jsonrpc": "2.0", "id": 1},
+                "junk",
+            ],
+        )
+
+    results = run(_answer_partial, [GetReferenceGasPrice() for _ in range(2)])
+    assert [x.is_ok() for x in results] == [True, False]
+    assert results[1].result_string == "Result handling error KeyError"
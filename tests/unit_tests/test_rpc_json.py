@@ -0,0 +1,58 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""JSON RPC body encoding and decoding."""
+
+import json
+
+import pytest
+
+from pysui.sui.sui_clients.common import _json_content, _json_loads
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        123456789012345678901234567890,
+        18446744073709551616,
+        -9223372036854775809,
+        18446744073709551615,
+        -9223372036854775808,
+        0,
+    ],
+)
+def test_loads_keeps_integers_exact(value):
+    """Integers of any width decode as the same int."""
+    decoded = _json_loads(json.dumps({"result": [value]}).encode())
+    assert decoded["result"][0] == value
+    assert isinstance(decoded["result"][0], int)
+
+
+def test_loads_matches_json():
+    """Ordinary bodies decode as the standard library does."""
+    body = b'{"jsonrpc":"2.0","id":1,"result":{"a":[1,2.5,"x",null,true]}}'
+    assert _json_loads(body) == json.loads(body)
+
+
+def test_loads_raises_json_decode_error():
+    """Malformed bodies raise a JSONDecodeError either way."""
+    with pytest.raises(json.JSONDecodeError):
+        _json_loads(b'{"result": ')
+    with pytest.raises(json.JSONDecodeError):
+        _json_loads(b'{"result": 1234567890123456789012')
+
+
+def test_content_round_trips_wide_integers():
+    """Request bodies with wide integers encode and decode exactly."""
+    payload = {"params": [2**128, "0x2"]}
+    assert _json_loads(_json_content(payload)) == payload
@@ -0,0 +1,39 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Transaction object argument coercion."""
+
+import pytest
+
+from pysui import ObjectID
+from pysui.sui.sui_txn.transaction import _coerce_object
+from pysui.sui.sui_types import bcs
+
+
+def test_str_becomes_object_id():
+    coerced = _coerce_object("0x6")
+    assert isinstance(coerced, ObjectID)
+    assert coerced.value == "0x6"
+
+
+def test_supported_types_pass_through():
+    object_id = ObjectID("0x6")
+    gas = bcs.Argument("GasCoin")
+    assert _coerce_object(object_id) is object_id
+    assert _coerce_object(gas) is gas
+
+
+@pytest.mark.parametrize("arg", [6, None, b"0x6"])
+def test_unsupported_type_raises(arg):
+    with pytest.raises(TypeError, match=type(arg).__name__):
+        _coerce_object(arg)
@@ -0,0 +1,101 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Deferred object resolution must build what eager resolution builds."""
+
+import asyncio
+
+import pytest
+
+from pysui import ObjectID
+from pysui.sui.sui_txn.async_transaction import SuiTransactionAsync
+from pysui.sui.sui_types import bcs
+
+_TARGET: str = "0x" + "b" * 64 + "::deny::add"
+_OWNED: str = "0x" + "a" * 64
+
+
+def _build(client, deferred: bool) -> SuiTransactionAsync:
+    """Stage a move call taking a `&mut` system shared object, an owned object and `&Clock`."""
+
+    async def _stage() -> SuiTransactionAsync:
+        txn = SuiTransactionAsync(client=client, deferred_resolution=deferred)
+        # (is_receiving, is_mutable) per parameter
+        txn._mc_cache_put(
+            _TARGET,
+            (
+                bcs.Address.from_str(_TARGET.split("::")[0]),
+                "deny",
+                "add",
+                ((False, True), (False, True), (False, False)),
+                0,
+            ),
+        )
+        await txn.move_call(
+            target=_TARGET,
+            arguments=[ObjectID("0x403"), ObjectID(_OWNED), ObjectID("0x6")],
+        )
+        await txn._resolve_deferred()
+        return txn
+
+    return asyncio.run(_stage())
+
+
+def _shared_mutability(txn: SuiTransactionAsync) -> dict[str, bool]:
+    """Map shared object input to its Mutable flag."""
+    return {
+        key.value.to_address_str(): arg.value.value.Mutable
+        for key, arg in txn.builder.inputs.items()
+        if arg.value.enum_name == "SharedObject"
+    }
+
+
+def test_deferred_matches_eager(async_client):
+    """Deferred and eager builds of the same move call serialize identically."""
+    eager = _build(async_client, False)
+    deferred = _build(async_client, True)
+    assert (
+        deferred.builder.finish_for_inspect_bytes()
+        == eager.builder.finish_for_inspect_bytes()
+    )
+
+
+def test_deferred_keeps_required_mutability(async_client):
+    """A system object passed to a `&mut` parameter stays mutable after resolving."""
+    mutability = _shared_mutability(_build(async_client, True))
+    assert mutability[bcs.Address.from_str("0x403").to_address_str()] is True
+    assert mutability[bcs.Address.from_str("0x6").to_address_str()] is False
+
+
+def test_deferred_fetches_once(async_client):
+    """Objects passed by id are fetched in a single request."""
+    _build(async_client, True)
+    assert len(async_client.fetches) == 1
+    assert bcs.Address.from_str(_OWNED).to_address_str() in async_client.fetches[0]
+
+
+def test_unresolved_refuses_to_serialize(async_client):
+    """Placeholder references never leave the transaction."""
+
+    async def _stage():
+        txn = SuiTransactionAsync(client=async_client, deferred_resolution=True)
+        await txn.split_coin(coin=ObjectID(_OWNED), amounts=[5])
+        for fetch in (txn.serialize, txn.raw_kind, txn.build_for_inspection):
+            with pytest.raises(ValueError, match="resolve_deferred"):
+                fetch()
+        await txn.resolve_deferred()
+        return txn
+
+    txn = asyncio.run(_stage())
+    assert txn.raw_kind()
+    assert txn.build_for_inspection()
@@ -0,0 +1,42 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Importing the transaction modules must not trigger deprecation warnings."""
+
+import subprocess
+import sys
+
+
+def test_txn_import_is_warning_free():
+    """Deprecated bcs types are only built when used."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-W",
+            "error::DeprecationWarning",
+            "-c",
+            "import pysui.sui.sui_txn.sync_transaction, pysui.sui.sui_txn.async_transaction",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_empty_optional_u64_shared():
+    """The empty OptionalU64 is built once and serializes as None."""
+    from pysui.sui.sui_txn.transaction import _SuiTransactionBase
+
+    empty = _SuiTransactionBase._empty_optional_u64()
+    assert empty is _SuiTransactionBase._empty_optional_u64()
+    assert empty.serialize() == b"\x00"
@@ -0,0 +1,83 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Cached TransactionKind bytes."""
+
+import asyncio
+
+from pysui import ObjectID
+from pysui.sui.sui_txn.async_transaction import SuiTransactionAsync
+from pysui.sui.sui_txn.transaction_builder import (
+    ProgrammableTransactionBuilder,
+    PureInput,
+)
+from pysui.sui.sui_types import bcs
+
+_SENDER = bcs.Address.from_str("0x" + "1" * 64)
+
+
+def _split(builder: ProgrammableTransactionBuilder, amount: int) -> bcs.Argument:
+    return builder.split_coin(bcs.Argument("GasCoin"), [PureInput.as_u64_input(amount)])
+
+
+def test_kind_bytes_cached_until_changed():
+    builder = ProgrammableTransactionBuilder()
+    _split(builder, 5)
+    first = builder.finish_for_inspect_bytes()
+    assert builder.finish_for_inspect_bytes() is first
+    assert first == builder.finish_for_inspect().serialize()
+    # A new input and command both invalidate
+    _split(builder, 6)
+    second = builder.finish_for_inspect_bytes()
+    assert second != first
+    assert second == builder.finish_for_inspect().serialize()
+    # A command without new inputs invalidates
+    builder.transfer_objects(
+        PureInput.as_input(bcs.Address.from_str("0x2")), [bcs.Argument("GasCoin")]
+    )
+    assert (
+        builder.finish_for_inspect_bytes() == builder.finish_for_inspect().serialize()
+    )
+    assert builder.finish_for_inspect_bytes() != second
+
+
+def test_serialize_with_kind_matches_serialize():
+    builder = ProgrammableTransactionBuilder()
+    _split(builder, 5)
+    tx_data = bcs.TransactionData(
+        "V1",
+        bcs.TransactionDataV1(
+            builder.finish_for_inspect(),
+            _SENDER,
+            bcs.GasData([], _SENDER, 1000, 50_000_000_000),
+            bcs.TransactionExpiration("None"),
+        ),
+    )
+    assert (
+        tx_data.serialize_with_kind(builder.finish_for_inspect_bytes())
+        == tx_data.serialize()
+    )
+
+
+def test_deferred_resolution_invalidates(async_client):
+    async def _stage():
+        txn = SuiTransactionAsync(client=async_client, deferred_resolution=True)
+        await txn.split_coin(coin=ObjectID("0x" + "a" * 64), amounts=[5])
+        placeholder = txn.builder.finish_for_inspect_bytes()
+        await txn._resolve_deferred()
+        return txn, placeholder
+
+    txn, placeholder = asyncio.run(_stage())
+    resolved = txn.builder.finish_for_inspect_bytes()
+    assert resolved != placeholder
+    assert resolved == txn.builder.finish_for_inspect().serialize()
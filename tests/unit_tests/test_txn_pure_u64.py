@@ -0,0 +1,36 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""PureInput.as_u64_input against the general pure encoding."""
+
+import struct
+
+import pytest
+
+from pysui.sui.sui_txn.transaction_builder import PureInput
+from pysui.sui.sui_types import bcs
+
+
+@pytest.mark.parametrize("value", [0, 1, 255, 256, 1_000_000_000, 2**63, 2**64 - 1])
+def test_as_u64_input_matches_as_input(value):
+    fast = PureInput.as_u64_input(value)
+    general = PureInput.as_input(bcs.U64.encode(value))
+    assert fast.enum_name == general.enum_name == "Pure"
+    assert fast.value == general.value
+    assert fast.serialize() == general.serialize()
+
+
+@pytest.mark.parametrize("value", [-1, 2**64])
+def test_as_u64_input_rejects_out_of_range(value):
+    with pytest.raises(struct.error):
+        PureInput.as_u64_input(value)
@@ -0,0 +1,75 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Decoders against their library equivalents."""
+
+import base64
+import binascii
+import random
+
+import base58
+import pytest
+
+from pysui.sui.sui_utils import (
+    _b58decode,
+    b58str_to_bytes,
+    b58str_to_list,
+    b64str_to_bytes,
+    b64str_to_list,
+    hexstring_to_bytes,
+    hexstring_to_list,
+    hexstring_to_sui_id,
+)
+
+_RNG = random.Random(58)
+_SAMPLES: list[bytes] = [b"", b"\x00", b"\x00\x00\x01", b"\xff" * 32] + [
+    bytes(_RNG.randrange(3)) + _RNG.randbytes(_RNG.randrange(1, 48)) for _ in range(64)
+]
+
+
+@pytest.mark.parametrize("raw", _SAMPLES)
+def test_b58decode_matches_base58(raw):
+    encoded = base58.b58encode(raw).decode()
+    assert _b58decode(encoded) == base58.b58decode(encoded) == raw
+    assert b58str_to_bytes(encoded) == raw
+    assert b58str_to_list(encoded) == list(raw)
+
+
+def test_b58decode_rejects_invalid():
+    with pytest.raises(ValueError):
+        _b58decode("0OIl")
+
+
+def test_b58str_falls_back_to_base64():
+    raw = b"\x00\x01pysui"
+    assert b58str_to_bytes(base64.b64encode(raw).decode()) == raw
+
+
+@pytest.mark.parametrize("raw", _SAMPLES)
+def test_b64_matches_base64(raw):
+    encoded = base64.b64encode(raw).decode()
+    assert b64str_to_bytes(encoded) == base64.b64decode(encoded) == raw
+    assert b64str_to_list(encoded) == list(raw)
+
+
+@pytest.mark.parametrize("indata", ["0x2", "0X2", "2", "ab" * 31, "0x" + "ab" * 32])
+def test_hexstring_matches_unhexlify(indata):
+    expected = binascii.unhexlify(hexstring_to_sui_id(indata)[2:])
+    assert len(expected) == 32
+    assert hexstring_to_bytes(indata) == expected
+    assert hexstring_to_list(indata) == list(expected)
+
+
+def test_hexstring_rejects_invalid():
+    with pytest.raises(ValueError):
+        hexstring_to_bytes("0xzz")